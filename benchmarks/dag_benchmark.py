@@ -0,0 +1,191 @@
+import argparse
+import json
+import os
+import random
+import subprocess
+import sys
+import time
+import tracemalloc
+from typing import Any, Callable, Dict, List, Tuple
+
+
+DAG_MODULE_PATH = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+    'werkflow',
+    'graph',
+    'dag',
+    'dag.py'
+)
+
+IMPORT_SCRIPTS = {
+    'networkx': 'import networkx',
+    'werkflow_dag': (
+        'import importlib.util;'
+        f'spec = importlib.util.spec_from_file_location("dag", {DAG_MODULE_PATH!r});'
+        'module = importlib.util.module_from_spec(spec);'
+        'spec.loader.exec_module(module)'
+    ),
+}
+
+MEASURE_TEMPLATE = '''
+import time
+import tracemalloc
+tracemalloc.start()
+start = time.perf_counter()
+{script}
+elapsed = time.perf_counter() - start
+_, peak = tracemalloc.get_traced_memory()
+print(elapsed, peak)
+'''
+
+
+def measure_import(script: str, repeats: int) -> Dict[str, float]:
+    timings: List[float] = []
+    peaks: List[int] = []
+
+    for _ in range(repeats):
+        output = subprocess.run(
+            [sys.executable, '-c', MEASURE_TEMPLATE.format(script=script)],
+            capture_output=True,
+            text=True,
+            check=True
+        )
+
+        elapsed, peak = output.stdout.split()
+        timings.append(float(elapsed))
+        peaks.append(int(peak))
+
+    return {
+        'import_seconds': min(timings),
+        'import_peak_bytes': min(peaks),
+    }
+
+
+def create_edges(size: int, seed: int) -> Tuple[List[str], List[Tuple[str, str]]]:
+    generator = random.Random(seed)
+    names = [f'step_{index}' for index in range(size)]
+
+    edges: List[Tuple[str, str]] = []
+    for index in range(1, size):
+        for dependency in generator.sample(range(index), min(index, 3)):
+            edges.append((names[dependency], names[index]))
+
+    return names, edges
+
+
+def build_networkx(names: List[str], edges: List[Tuple[str, str]]):
+    import networkx
+
+    graph = networkx.DiGraph()
+    graph.add_nodes_from(names)
+    graph.add_edges_from(edges)
+
+    return list(networkx.topological_generations(graph))
+
+
+def build_werkflow_dag(names: List[str], edges: List[Tuple[str, str]]):
+    from werkflow.graph.dag import DAG
+
+    graph = DAG()
+    graph.add_nodes_from(names)
+    graph.add_edges_from(edges)
+
+    return graph.topological_generations()
+
+
+def measure_build(
+    build: Callable[[List[str], List[Tuple[str, str]]], Any],
+    names: List[str],
+    edges: List[Tuple[str, str]],
+    repeats: int
+) -> Dict[str, float]:
+
+    timings: List[float] = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        build(names, edges)
+        timings.append(time.perf_counter() - start)
+
+    tracemalloc.start()
+    build(names, edges)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return {
+        'build_seconds': min(timings),
+        'build_peak_bytes': peak,
+    }
+
+
+def run(sizes: List[int], repeats: int, seed: int) -> Dict[str, Any]:
+
+    implementations: Dict[str, Callable[..., Any]] = {
+        'werkflow_dag': build_werkflow_dag,
+    }
+
+    try:
+        import networkx  # noqa: F401
+        implementations['networkx'] = build_networkx
+
+    except ImportError:
+        pass
+
+    results: Dict[str, Any] = {
+        'python': sys.version,
+        'imports': {},
+        'graphs': {},
+    }
+
+    for implementation_name in implementations:
+        results['imports'][implementation_name] = measure_import(
+            IMPORT_SCRIPTS[implementation_name],
+            repeats
+        )
+
+    for size in sizes:
+        names, edges = create_edges(size, seed)
+
+        expected = build_werkflow_dag(names, edges)
+        size_results: Dict[str, Any] = {}
+
+        for implementation_name, build in implementations.items():
+            generations = build(names, edges)
+            assert generations == expected, f'{implementation_name} generations differ at size {size}'
+
+            size_results[implementation_name] = measure_build(
+                build,
+                names,
+                edges,
+                repeats
+            )
+
+        results['graphs'][str(size)] = size_results
+
+    return results
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(
+        description='Compare import cost, build time, and memory of werkflow.graph.dag against networkx.'
+    )
+
+    parser.add_argument('--sizes', type=int, nargs='+', default=[10, 100, 1000, 10000])
+    parser.add_argument('--repeats', type=int, default=5)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--output', type=str, default=None)
+
+    arguments = parser.parse_args()
+
+    benchmark_results = run(
+        arguments.sizes,
+        arguments.repeats,
+        arguments.seed
+    )
+
+    serialized_results = json.dumps(benchmark_results, indent=4)
+
+    if arguments.output:
+        with open(arguments.output, 'w') as output_file:
+            output_file.write(serialized_results)
+
+    print(serialized_results)
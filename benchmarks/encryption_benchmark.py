@@ -0,0 +1,234 @@
+import argparse
+import io
+import json
+import os
+import secrets
+import time
+import tracemalloc
+from typing import Any, Dict, List
+
+
+MEGABYTE = 1000**2
+
+
+class SyntheticSource(io.RawIOBase):
+
+    # Repeats one random block so multi-gigabyte payloads can be
+    # streamed without ever existing in memory.
+    def __init__(
+        self,
+        size: int,
+        block: bytes
+    ) -> None:
+        self._remaining = size
+        self._block = memoryview(block)
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:
+        read_size = min(len(buffer), len(self._block), self._remaining)
+        buffer[:read_size] = self._block[:read_size]
+        self._remaining -= read_size
+
+        return read_size
+
+
+def create_fernet(chunk_size: int):
+    from werkflow.connections.encryption import AESGCMFernet
+    from werkflow.connections.env import Env
+
+    return AESGCMFernet(
+        Env(
+            MERCURY_SYNC_AUTH_SECRET=secrets.token_hex(32),
+            MERCURY_SYNC_ENCRYPTION_CHUNK_SIZE=chunk_size
+        )
+    )
+
+
+def get_throughput(size: int, elapsed: float) -> float:
+    if elapsed <= 0:
+        return 0
+
+    return round(size / MEGABYTE / elapsed, 1)
+
+
+def run_single_shot(size: int) -> Dict[str, Any]:
+    from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+
+    # The previous codec: one random key and nonce per payload, with
+    # the whole payload encrypted and decrypted as one buffer.
+    data = os.urandom(size)
+
+    tracemalloc.start()
+
+    started = time.perf_counter()
+    key = secrets.token_bytes(32)
+    nonce = secrets.token_bytes(12)
+    encrypted = key + nonce + AESGCM(key).encrypt(nonce, data, b'')
+    encrypt_elapsed = time.perf_counter() - started
+
+    started = time.perf_counter()
+    decrypted = AESGCM(encrypted[:32]).decrypt(encrypted[32:44], encrypted[44:], b'')
+    decrypt_elapsed = time.perf_counter() - started
+
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    assert decrypted == data
+
+    return {
+        'encrypt_mb_per_second': get_throughput(size, encrypt_elapsed),
+        'decrypt_mb_per_second': get_throughput(size, decrypt_elapsed),
+        'peak_memory_mb': round(peak / MEGABYTE, 1),
+    }
+
+
+def run_buffer(
+    size: int,
+    chunk_size: int
+) -> Dict[str, Any]:
+    fernet = create_fernet(chunk_size)
+    data = os.urandom(size)
+
+    tracemalloc.start()
+
+    started = time.perf_counter()
+    encrypted = fernet.encrypt(data)
+    encrypt_elapsed = time.perf_counter() - started
+
+    started = time.perf_counter()
+    decrypted = fernet.decrypt(encrypted)
+    decrypt_elapsed = time.perf_counter() - started
+
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    assert decrypted == data
+
+    return {
+        'encrypt_mb_per_second': get_throughput(size, encrypt_elapsed),
+        'decrypt_mb_per_second': get_throughput(size, decrypt_elapsed),
+        'peak_memory_mb': round(peak / MEGABYTE, 1),
+    }
+
+
+def run_stream(
+    size: int,
+    chunk_size: int
+) -> Dict[str, Any]:
+    fernet = create_fernet(chunk_size)
+
+    source = SyntheticSource(
+        size,
+        os.urandom(chunk_size)
+    )
+
+    encryptor = fernet.encryptor()
+    decryptor = fernet.decryptor()
+
+    buffer = bytearray(chunk_size)
+    view = memoryview(buffer)
+
+    encrypt_elapsed = 0
+    decrypt_elapsed = 0
+    decrypted_size = 0
+
+    tracemalloc.start()
+
+    for _ in decryptor.update(encryptor.header):
+        pass
+
+    # Each record goes straight from the encryptor to the decryptor,
+    # so memory stays at a few chunks whatever the payload size.
+    while read_size := source.readinto(buffer):
+        started = time.perf_counter()
+        records = list(encryptor.update(view[:read_size]))
+        encrypt_elapsed += time.perf_counter() - started
+
+        started = time.perf_counter()
+        for record in records:
+            for chunk in decryptor.update(record):
+                decrypted_size += len(chunk)
+
+        decrypt_elapsed += time.perf_counter() - started
+
+    started = time.perf_counter()
+    final_record = encryptor.finalize()
+    encrypt_elapsed += time.perf_counter() - started
+
+    started = time.perf_counter()
+    for chunk in decryptor.update(final_record):
+        decrypted_size += len(chunk)
+
+    decrypted_size += len(decryptor.finalize())
+    decrypt_elapsed += time.perf_counter() - started
+
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    assert decrypted_size == size
+
+    return {
+        'encrypt_mb_per_second': get_throughput(size, encrypt_elapsed),
+        'decrypt_mb_per_second': get_throughput(size, decrypt_elapsed),
+        'peak_memory_mb': round(peak / MEGABYTE, 1),
+    }
+
+
+def run_benchmarks(
+    sizes: List[int],
+    chunk_size: int,
+    max_buffer_size: int
+) -> List[Dict[str, Any]]:
+    results: List[Dict[str, Any]] = []
+
+    for size_mb in sizes:
+        size = size_mb * MEGABYTE
+
+        modes = {
+            'stream': lambda: run_stream(size, chunk_size),
+        }
+
+        if size <= max_buffer_size * MEGABYTE:
+            modes['single_shot'] = lambda: run_single_shot(size)
+            modes['buffer'] = lambda: run_buffer(size, chunk_size)
+
+        for mode, run in modes.items():
+            result = {
+                'size_mb': size_mb,
+                'mode': mode,
+                'chunk_size': chunk_size,
+                **run()
+            }
+
+            print(
+                f"{size_mb:>6} MB {mode:<12} encrypt {result['encrypt_mb_per_second']:>8} MB/s  decrypt {result['decrypt_mb_per_second']:>8} MB/s  peak {result['peak_memory_mb']:>8} MB"
+            )
+
+            results.append(result)
+
+    return results
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(
+        description='Measure AES-GCM payload throughput and peak memory for whole-buffer and streaming use.'
+    )
+
+    parser.add_argument('--sizes', type=int, nargs='+', default=[1, 10, 100, 1000, 10000], help='Payload sizes in MB.')
+    parser.add_argument('--chunk-size', type=int, default=1024**2)
+    parser.add_argument('--max-buffer-size', type=int, default=256, help='Largest payload in MB to also run as a whole buffer.')
+    parser.add_argument('--output', type=str, default=None)
+
+    args = parser.parse_args()
+
+    results = run_benchmarks(
+        args.sizes,
+        args.chunk_size,
+        args.max_buffer_size
+    )
+
+    if args.output:
+        with open(args.output, 'w') as output_file:
+            json.dump(results, output_file, indent=4)
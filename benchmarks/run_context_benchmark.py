@@ -0,0 +1,195 @@
+import argparse
+import asyncio
+import importlib.util
+import json
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+from typing import Any, Dict, List
+
+
+def create_chain_source(steps: int) -> str:
+    lines = [
+        'from werkflow import Workflow, step',
+        '',
+        '',
+        'class Chain(Workflow):',
+        '',
+        '    @step()',
+        '    async def step_0(self):',
+        "        return {'value_0': [0] * 16}",
+    ]
+
+    for index in range(1, steps):
+        lines.extend([
+            '',
+            f"    @step('step_{index - 1}')",
+            f'    async def step_{index}(self, value_{index - 1}: list):',
+            f"        return {{'value_{index}': [{index}] * 16}}",
+        ])
+
+    return '\n'.join(lines) + '\n'
+
+
+def load_chain(steps: int, directory: str):
+    chain_path = os.path.join(directory, f'chain_{steps}.py')
+
+    with open(chain_path, 'w') as chain_file:
+        chain_file.write(create_chain_source(steps))
+
+    spec = importlib.util.spec_from_file_location(f'chain_{steps}', chain_path)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[module.__name__] = module
+    spec.loader.exec_module(module)
+
+    return module.Chain
+
+
+def run_graph(steps: int, directory: str) -> Dict[str, float]:
+    from werkflow.graph import Graph, WorkflowGroup
+    from werkflow.logging import LoggerTypes, logging_manager
+
+    logging_manager.disable(
+        LoggerTypes.DISTRIBUTED,
+        LoggerTypes.DISTRIBUTED_FILESYSTEM,
+        LoggerTypes.SPINNER,
+        LoggerTypes.WERKFLOW
+    )
+
+    chain = load_chain(steps, directory)
+
+    group = WorkflowGroup()
+    group.add_workflow(chain)
+
+    graph = Graph(
+        group,
+        no_prompt=True,
+        werkflow_config={
+            'plan_cache': False,
+        }
+    )
+
+    graph.setup()
+
+    tracemalloc.start()
+    start = time.perf_counter()
+
+    asyncio.run(graph.run())
+
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return {
+        'run_seconds': elapsed,
+        'run_peak_bytes': peak,
+    }
+
+
+def spread_context(steps: int) -> int:
+    # The previous hook calling convention: every step received the whole
+    # context as kwargs, filtered it, and returned it merged with its result.
+    context: Dict[str, Any] = {}
+    copied = 0
+
+    for index in range(steps):
+        kwargs = {**context}
+        params = {f'value_{index - 1}'}
+
+        {
+            name: value for name, value in kwargs.items() if name in params
+        }
+
+        result = {
+            **kwargs,
+            f'value_{index}': [index] * 16
+        }
+
+        context.update({
+            name: value for name, value in result.items() if value is not None
+        })
+
+        copied += len(kwargs) + len(result)
+
+    return copied
+
+
+def layered_context(steps: int) -> int:
+    from werkflow.graph.context import RunContext
+
+    context = RunContext()
+
+    for index in range(steps):
+        params = (f'value_{index - 1}',)
+
+        {
+            name: context[name] for name in params if name in context
+        }
+
+        context.merge({
+            f'value_{index}': [index] * 16
+        })
+
+    return len(context)
+
+
+def measure_context(steps: int, repeats: int) -> Dict[str, Dict[str, float]]:
+
+    results: Dict[str, Dict[str, float]] = {}
+
+    for name, implementation in (
+        ('spread_kwargs', spread_context),
+        ('run_context', layered_context),
+    ):
+        timings: List[float] = []
+        for _ in range(repeats):
+            start = time.perf_counter()
+            implementation(steps)
+            timings.append(time.perf_counter() - start)
+
+        tracemalloc.start()
+        implementation(steps)
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        results[name] = {
+            'context_seconds': min(timings),
+            'context_peak_bytes': peak,
+        }
+
+    return results
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(
+        description='Benchmark passing the run context through a chain of steps.'
+    )
+
+    parser.add_argument('--steps', type=int, default=1000)
+    parser.add_argument('--repeats', type=int, default=5)
+    parser.add_argument('--output', type=str, default=None)
+
+    arguments = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as chain_directory:
+        benchmark_results = {
+            'steps': arguments.steps,
+            'context': measure_context(
+                arguments.steps,
+                arguments.repeats
+            ),
+            'graph': run_graph(
+                arguments.steps,
+                chain_directory
+            ),
+        }
+
+    serialized_results = json.dumps(benchmark_results, indent=4)
+
+    if arguments.output:
+        with open(arguments.output, 'w') as output_file:
+            output_file.write(serialized_results)
+
+    print(serialized_results)
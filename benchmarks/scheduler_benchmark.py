@@ -0,0 +1,362 @@
+import argparse
+import asyncio
+import importlib.util
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+from typing import Any, Dict, List, Tuple
+
+
+SHAPES = ['wide', 'deep', 'diamond', 'random']
+
+
+def create_dependencies(
+    shape: str,
+    size: int,
+    seed: int
+) -> List[List[int]]:
+
+    if shape == 'wide':
+        return [[] for _ in range(size)]
+
+    elif shape == 'deep':
+        return [[]] + [[index - 1] for index in range(1, size)]
+
+    elif shape == 'diamond':
+        if size < 3:
+            return [[]] + [[0] for _ in range(1, size)]
+
+        middle = list(range(1, size - 1))
+        return [[]] + [[0] for _ in middle] + [middle]
+
+    generator = random.Random(seed)
+
+    return [[]] + [
+        sorted(generator.sample(range(index), min(index, generator.randint(1, 3)))) for index in range(1, size)
+    ]
+
+
+def get_depth(dependencies: List[List[int]]) -> int:
+    depths: List[int] = []
+
+    for step_dependencies in dependencies:
+        depths.append(
+            max([depths[dependency] for dependency in step_dependencies], default=0) + 1
+        )
+
+    return max(depths, default=0)
+
+
+def create_workflow_source(
+    class_name: str,
+    dependencies: List[List[int]],
+    sleep: float
+) -> str:
+
+    lines = [
+        'import asyncio',
+        '',
+        'from werkflow import Workflow, step',
+        '',
+        '',
+        f'class {class_name}(Workflow):',
+    ]
+
+    for index, step_dependencies in enumerate(dependencies):
+        step_names = ', '.join([
+            f"'step_{dependency}'" for dependency in step_dependencies
+        ])
+
+        step_params = ''.join([
+            f', value_{dependency}: int' for dependency in step_dependencies
+        ])
+
+        lines.extend([
+            '',
+            f'    @step({step_names})',
+            f'    async def step_{index}(self{step_params}):',
+        ])
+
+        if sleep > 0:
+            lines.append(f'        await asyncio.sleep({sleep})')
+
+        lines.append(f"        return {{'value_{index}': {index}}}")
+
+    return '\n'.join(lines) + '\n'
+
+
+def load_workflow(
+    class_name: str,
+    source: str,
+    directory: str
+):
+    workflow_path = os.path.join(directory, f'{class_name.lower()}.py')
+
+    with open(workflow_path, 'w') as workflow_file:
+        workflow_file.write(source)
+
+    spec = importlib.util.spec_from_file_location(class_name.lower(), workflow_path)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[module.__name__] = module
+    spec.loader.exec_module(module)
+
+    return getattr(module, class_name)
+
+
+def instrument_context_merge() -> Dict[str, float]:
+    from werkflow.graph.context import RunContext
+
+    merge_stats = {
+        'calls': 0,
+        'seconds': 0.0,
+    }
+
+    merge = RunContext.merge
+
+    def timed_merge(context: RunContext, outputs: Dict[str, Any]):
+        start = time.perf_counter()
+        merge(context, outputs)
+
+        merge_stats['calls'] += 1
+        merge_stats['seconds'] += time.perf_counter() - start
+
+    RunContext.merge = timed_merge
+
+    return merge_stats
+
+
+def create_graph(
+    workflow_type,
+    scheduler: str
+):
+    from werkflow.graph import Graph, WorkflowGroup
+
+    group = WorkflowGroup()
+    group.add_workflow(workflow_type)
+
+    return Graph(
+        group,
+        no_prompt=True,
+        werkflow_config={
+            'scheduler': scheduler,
+            'plan_cache': False,
+        }
+    )
+
+
+def measure(
+    shape: str,
+    size: int,
+    scheduler: str,
+    sleep: float,
+    seed: int,
+    directory: str,
+    merge_stats: Dict[str, float],
+    loop: asyncio.AbstractEventLoop
+) -> Dict[str, Any]:
+
+    dependencies = create_dependencies(shape, size, seed)
+    depth = get_depth(dependencies)
+
+    results: Dict[str, Any] = {
+        'shape': shape,
+        'size': size,
+        'scheduler': scheduler,
+        'sleep': sleep,
+        'depth': depth,
+    }
+
+    # Each measured graph gets a fresh workflow class since setup binds
+    # the registered hooks to a single workflow instance.
+    timed_class, memory_class = [
+        load_workflow(
+            f'{shape.capitalize()}{size}{scheduler.capitalize()}{run_type}',
+            create_workflow_source(
+                f'{shape.capitalize()}{size}{scheduler.capitalize()}{run_type}',
+                dependencies,
+                sleep
+            ),
+            directory
+        ) for run_type in ('Timed', 'Memory')
+    ]
+
+    graph = create_graph(timed_class, scheduler)
+
+    start = time.perf_counter()
+    graph.setup()
+    results['setup_seconds'] = time.perf_counter() - start
+
+    merge_stats['calls'] = 0
+    merge_stats['seconds'] = 0.0
+
+    start = time.perf_counter()
+    loop.run_until_complete(graph.run())
+    run_seconds = time.perf_counter() - start
+
+    # Sleeping steps on the critical path bound the run from below, so
+    # anything beyond that is framework overhead.
+    overhead = max(run_seconds - depth * sleep, 0)
+
+    results.update({
+        'run_seconds': run_seconds,
+        'overhead_seconds': overhead,
+        'per_step_overhead_seconds': overhead / size,
+        'context_merge_calls': merge_stats['calls'],
+        'context_merge_seconds': merge_stats['seconds'],
+    })
+
+    memory_graph = create_graph(memory_class, scheduler)
+
+    tracemalloc.start()
+    memory_graph.setup()
+    _, setup_peak = tracemalloc.get_traced_memory()
+
+    tracemalloc.reset_peak()
+    loop.run_until_complete(memory_graph.run())
+    _, run_peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    results.update({
+        'setup_peak_bytes': setup_peak,
+        'run_peak_bytes': run_peak,
+    })
+
+    return results
+
+
+def compare(
+    results: List[Dict[str, Any]],
+    baseline: List[Dict[str, Any]]
+) -> List[str]:
+
+    def get_key(result: Dict[str, Any]) -> Tuple[Any, ...]:
+        return (result['shape'], result['size'], result['scheduler'], result['sleep'])
+
+    baseline_results = {
+        get_key(result): result for result in baseline
+    }
+
+    lines: List[str] = []
+    for result in results:
+        baseline_result = baseline_results.get(get_key(result))
+        if baseline_result is None:
+            continue
+
+        changes = []
+        for metric in (
+            'setup_seconds',
+            'per_step_overhead_seconds',
+            'context_merge_seconds',
+            'run_peak_bytes',
+        ):
+            previous = baseline_result.get(metric)
+            current = result.get(metric)
+
+            if previous:
+                changes.append(f'{metric} {round((current - previous) / previous * 100, 1):+}%')
+
+        lines.append(
+            f"{result['shape']:>8} {result['size']:>6} {result['scheduler']:>11}: {', '.join(changes)}"
+        )
+
+    return lines
+
+
+def run(
+    shapes: List[str],
+    sizes: List[int],
+    schedulers: List[str],
+    sleep: float,
+    seed: int
+) -> Dict[str, Any]:
+    from werkflow.logging import LoggerTypes, logging_manager
+
+    logging_manager.disable(*list(LoggerTypes))
+
+    merge_stats = instrument_context_merge()
+
+    # Workflows and loggers bind to the current loop when created, so
+    # every graph runs on the same one as under werkflow run.
+    loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(loop)
+
+    benchmark_results: List[Dict[str, Any]] = []
+
+    with tempfile.TemporaryDirectory() as workflows_directory:
+        for shape in shapes:
+            for size in sizes:
+                for scheduler in schedulers:
+                    benchmark_results.append(
+                        measure(
+                            shape,
+                            size,
+                            scheduler,
+                            sleep,
+                            seed,
+                            workflows_directory,
+                            merge_stats,
+                            loop
+                        )
+                    )
+
+    loop.close()
+
+    try:
+        from importlib.metadata import version
+        werkflow_version = version('werkflow')
+
+    except Exception:
+        werkflow_version = 'unknown'
+
+    return {
+        'python': sys.version,
+        'werkflow': werkflow_version,
+        'results': benchmark_results,
+    }
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(
+        description='Measure werkflow graph setup time, scheduling overhead, context merge cost, and peak memory.'
+    )
+
+    parser.add_argument('--shapes', nargs='+', choices=SHAPES, default=SHAPES)
+    parser.add_argument('--sizes', type=int, nargs='+', default=[10, 100, 1000, 10000])
+    parser.add_argument('--schedulers', nargs='+', choices=['generations', 'eager'], default=['generations', 'eager'])
+    parser.add_argument('--sleep', type=float, default=0, help='Seconds each step sleeps. Zero runs no-op steps.')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--output', type=str, default=None)
+    parser.add_argument('--compare', type=str, default=None, help='Path to a previous results JSON to compare against.')
+
+    arguments = parser.parse_args()
+
+    scheduler_results = run(
+        arguments.shapes,
+        arguments.sizes,
+        arguments.schedulers,
+        arguments.sleep,
+        arguments.seed
+    )
+
+    serialized_results = json.dumps(scheduler_results, indent=4)
+
+    if arguments.output:
+        with open(arguments.output, 'w') as output_file:
+            output_file.write(serialized_results)
+
+    print(serialized_results)
+
+    if arguments.compare:
+        with open(arguments.compare) as baseline_file:
+            baseline_results = json.load(baseline_file)
+
+        print('\n'.join(
+            compare(
+                scheduler_results['results'],
+                baseline_results['results']
+            )
+        ))
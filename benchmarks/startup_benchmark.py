@@ -0,0 +1,197 @@
+import argparse
+import json
+import subprocess
+import sys
+from typing import Any, Dict, List
+
+
+# Modules each entrypoint must not import eagerly. The CLI and package
+# roots defer everything, while the graph (needed to run a workflow)
+# may load logging but not prompts, banners, or the connection stack.
+STARTUP_TARGETS: Dict[str, List[str]] = {
+    'werkflow': [
+        'art',
+        'aiologger',
+        'cryptography',
+        'networkx',
+        'pydantic',
+        'yaspin',
+        'werkflow.graph',
+        'werkflow.logging',
+    ],
+    'werkflow.cli': [
+        'art',
+        'aiologger',
+        'cryptography',
+        'networkx',
+        'pydantic',
+        'yaspin',
+        'werkflow.graph',
+        'werkflow.logging',
+    ],
+    'werkflow.cli.run': [
+        'art',
+        'aiologger',
+        'cryptography',
+        'networkx',
+        'pydantic',
+        'yaspin',
+        'werkflow.graph',
+        'werkflow.logging',
+        'werkflow_core',
+    ],
+    'werkflow.graph': [
+        'art',
+        'cryptography',
+        'dotenv',
+        'networkx',
+        'pydantic',
+        'werkflow.prompt.types.base.base_prompt_validator',
+    ],
+}
+
+
+def measure_import_time(module_name: str) -> int:
+    output = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', f'import {module_name}'],
+        capture_output=True,
+        text=True,
+        check=True
+    )
+
+    # -X importtime reports "self | cumulative | name" in microseconds,
+    # with the requested module as the last top-level entry.
+    for line in reversed(output.stderr.splitlines()):
+        if not line.startswith('import time:'):
+            continue
+
+        _, cumulative, imported_name = line.split('|')
+        if imported_name.strip() == module_name:
+            return int(cumulative)
+
+    raise RuntimeError(f'No importtime entry found for {module_name}')
+
+
+def measure_banner_time() -> float:
+    # The banner is rendered by CLI.main on every run without --ci, so
+    # time the art import, logger setup, and render together.
+    output = subprocess.run(
+        [
+            sys.executable,
+            '-c',
+            (
+                'import sys, time\n'
+                'from werkflow.cli.base import CLI\n'
+                'started = time.perf_counter()\n'
+                'CLI().show_banner()\n'
+                'print(time.perf_counter() - started, file=sys.stderr)'
+            )
+        ],
+        capture_output=True,
+        text=True,
+        check=True
+    )
+
+    return float(output.stderr.splitlines()[-1]) * 1000
+
+
+def find_eager_imports(
+    module_name: str,
+    forbidden: List[str]
+) -> List[str]:
+    output = subprocess.run(
+        [
+            sys.executable,
+            '-c',
+            f'import sys, json, {module_name}; print(json.dumps(sorted(sys.modules)))'
+        ],
+        capture_output=True,
+        text=True,
+        check=True
+    )
+
+    imported = set(json.loads(output.stdout.splitlines()[-1]))
+
+    return [
+        forbidden_name for forbidden_name in forbidden if forbidden_name in imported
+    ]
+
+
+def run(
+    repeats: int,
+    budgets: Dict[str, float]
+) -> Dict[str, Any]:
+
+    results: Dict[str, Any] = {}
+
+    for module_name, forbidden in STARTUP_TARGETS.items():
+        import_time = min([
+            measure_import_time(module_name) for _ in range(repeats)
+        ]) / 1000
+
+        budget = budgets.get(module_name)
+
+        results[module_name] = {
+            'import_ms': import_time,
+            'budget_ms': budget,
+            'within_budget': budget is None or import_time <= budget,
+            'eager_imports': find_eager_imports(module_name, forbidden),
+        }
+
+    banner_time = min([
+        measure_banner_time() for _ in range(repeats)
+    ])
+
+    banner_budget = budgets.get('banner')
+
+    results['banner'] = {
+        'render_ms': banner_time,
+        'budget_ms': banner_budget,
+        'within_budget': banner_budget is None or banner_time <= banner_budget,
+        'eager_imports': [],
+    }
+
+    return results
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(
+        description='Check werkflow startup import time and eagerly imported modules using python -X importtime.'
+    )
+
+    parser.add_argument('--repeats', type=int, default=5)
+    parser.add_argument('--cli-budget-ms', type=float, default=100)
+    parser.add_argument('--graph-budget-ms', type=float, default=None)
+    parser.add_argument('--banner-budget-ms', type=float, default=None)
+    parser.add_argument('--output', type=str, default=None)
+
+    arguments = parser.parse_args()
+
+    startup_results = run(
+        arguments.repeats,
+        {
+            'werkflow': arguments.cli_budget_ms,
+            'werkflow.cli': arguments.cli_budget_ms,
+            'werkflow.cli.run': arguments.cli_budget_ms,
+            'werkflow.graph': arguments.graph_budget_ms,
+            'banner': arguments.banner_budget_ms,
+        }
+    )
+
+    serialized_results = json.dumps(startup_results, indent=4)
+
+    if arguments.output:
+        with open(arguments.output, 'w') as output_file:
+            output_file.write(serialized_results)
+
+    print(serialized_results)
+
+    regressions = [
+        module_name for module_name, result in startup_results.items() if (
+            result['within_budget'] is False or len(result['eager_imports']) > 0
+        )
+    ]
+
+    if len(regressions) > 0:
+        print(f'Startup regression in: {", ".join(regressions)}', file=sys.stderr)
+        sys.exit(1)
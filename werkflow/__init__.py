@@ -1,8 +1,31 @@
-from .graph import (
-    Workflow,
-    WorkflowGroup
-)
-from .hooks import (
-    step,
-    requires
-)
\ No newline at end of file
+from typing import TYPE_CHECKING
+
+from werkflow.tools.imports import lazy_exports
+
+if TYPE_CHECKING:
+    from .graph import (
+        GroupConcurrency,
+        Workflow,
+        WorkflowGroup
+    )
+    from .hooks import (
+        step,
+        requires
+    )
+
+
+__all__ = [
+    'GroupConcurrency',
+    'Workflow',
+    'WorkflowGroup',
+    'step',
+    'requires',
+]
+
+__getattr__, __dir__ = lazy_exports(__name__, {
+    'GroupConcurrency': '.graph',
+    'Workflow': '.graph',
+    'WorkflowGroup': '.graph',
+    'step': '.hooks',
+    'requires': '.hooks',
+})
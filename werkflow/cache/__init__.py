@@ -0,0 +1,3 @@
+from .incremental_state import IncrementalState
+from .plan_cache import PlanCache
+from .step_cache import StepCache
@@ -0,0 +1,61 @@
+import hashlib
+import inspect
+import pickle
+from typing import Any, Dict
+
+from werkflow.hooks.types.base.base_hook import BaseHook
+
+
+def hash_step_source(hook: BaseHook) -> str:
+    try:
+        source = inspect.getsource(hook._func).encode()
+
+    except (OSError, TypeError):
+        code = hook._func.__code__
+        source = code.co_code + repr(code.co_consts).encode()
+
+    return hashlib.sha256(source).hexdigest()
+
+
+def serialize_step_args(hook_args: Dict[str, Any]) -> bytes | None:
+    try:
+        return pickle.dumps(
+            sorted(
+                (
+                    (arg_name, normalize_arg(arg)) for arg_name, arg in hook_args.items()
+                ),
+                key=lambda arg: arg[0]
+            ),
+            protocol=pickle.HIGHEST_PROTOCOL
+        )
+
+    except Exception:
+        return None
+
+
+def normalize_arg(arg: Any) -> Any:
+    # Set iteration order depends on the per-process string hash seed,
+    # so sets are sorted to keep keys stable across runs. They stay
+    # tagged with their type so a list and a set never share a key.
+    if isinstance(arg, (set, frozenset)):
+        normalized = [normalize_arg(item) for item in arg]
+
+        try:
+            normalized.sort()
+
+        except TypeError:
+            normalized.sort(key=repr)
+
+        return (type(arg), normalized)
+
+    elif isinstance(arg, dict):
+        return (type(arg), [
+            (key, normalize_arg(value)) for key, value in arg.items()
+        ])
+
+    elif isinstance(arg, (list, tuple)):
+        return (type(arg), [
+            normalize_arg(item) for item in arg
+        ])
+
+    return arg
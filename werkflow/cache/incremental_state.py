@@ -0,0 +1,225 @@
+import asyncio
+import functools
+import hashlib
+import io
+import os
+import pickle
+from typing import Any, Dict, List, Tuple
+
+from werkflow.hooks.types.step.hook import StepHook
+from werkflow.tools.executors import ExecutorType, executors
+from werkflow.tools.filesystem import open
+
+from .hashing import hash_step_source, serialize_step_args
+
+
+FileStats = Tuple[str, int | None, int | None, str | None]
+
+
+class IncrementalState:
+
+    def __init__(
+        self,
+        state_directory: str,
+        hash_files: bool=False
+    ) -> None:
+        self.state_directory = state_directory
+        self.hash_files = hash_files
+
+        self._records: Dict[str, Dict[str, Dict[str, Any]]] = {}
+        self._source_hashes: Dict[str, str] = {}
+
+    async def load(self, workflow_name: str):
+
+        state_path = self._get_state_path(workflow_name)
+
+        loop = asyncio.get_running_loop()
+        state_exists = await loop.run_in_executor(
+            executors.get(ExecutorType.FILE_IO),
+            os.path.exists,
+            state_path
+        )
+
+        if state_exists is False:
+            self._records[workflow_name] = {}
+            return
+
+        state_file = await open(state_path, 'rb')
+        state_data = await state_file.read()
+        await state_file.close()
+
+        self._records[workflow_name] = pickle.loads(state_data)
+
+    async def save(self, workflow_name: str):
+
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(
+            executors.get(ExecutorType.FILE_IO),
+            functools.partial(
+                os.makedirs,
+                self.state_directory,
+                exist_ok=True
+            )
+        )
+
+        state_path = self._get_state_path(workflow_name)
+        temporary_path = f'{state_path}.{os.getpid()}.tmp'
+
+        state_file = await open(temporary_path, 'wb')
+        await state_file.write(
+            pickle.dumps(
+                self._records.get(workflow_name, {}),
+                protocol=pickle.HIGHEST_PROTOCOL
+            )
+        )
+        await state_file.close()
+
+        await loop.run_in_executor(
+            executors.get(ExecutorType.FILE_IO),
+            os.replace,
+            temporary_path,
+            state_path
+        )
+
+    async def create_fingerprint(
+        self,
+        hook: StepHook,
+        hook_args: Dict[str, Any],
+        condition_result: bool | None=None
+    ) -> str | None:
+
+        serialized_args = serialize_step_args(hook_args)
+        if serialized_args is None:
+            return None
+
+        source_hash = self._source_hashes.get(hook.name)
+        if source_hash is None:
+            source_hash = hash_step_source(hook)
+            self._source_hashes[hook.name] = source_hash
+
+        input_stats = await self._get_file_stats(hook.inputs)
+
+        fingerprint = hashlib.sha256()
+        fingerprint.update(hook.name.encode())
+        fingerprint.update(source_hash.encode())
+        fingerprint.update(serialized_args)
+        fingerprint.update(repr(input_stats).encode())
+
+        # A condition can read context the step itself does not take,
+        # so its result is part of whether a recorded run still applies.
+        fingerprint.update(repr(condition_result).encode())
+
+        return fingerprint.hexdigest()
+
+    async def replay(
+        self,
+        hook: StepHook,
+        fingerprint: str | None
+    ) -> Dict[str, Any] | None:
+
+        if fingerprint is None:
+            return None
+
+        record = self._records.get(hook.workflow, {}).get(hook.shortname)
+        if record is None or record.get('fingerprint') != fingerprint:
+            return None
+
+        output_stats = await self._get_file_stats(hook.outputs)
+        if output_stats != record.get('outputs'):
+            return None
+
+        result_data = record.get('result')
+        if not isinstance(result_data, bytes):
+            return None
+
+        return pickle.loads(result_data)
+
+    async def record(
+        self,
+        hook: StepHook,
+        fingerprint: str | None,
+        result: Dict[str, Any]
+    ):
+
+        workflow_records = self._records.setdefault(hook.workflow, {})
+
+        result_data: bytes | None = None
+        if fingerprint is not None:
+            try:
+                result_data = pickle.dumps(
+                    result,
+                    protocol=pickle.HIGHEST_PROTOCOL
+                )
+
+            except Exception:
+                pass
+
+        if result_data is None:
+            workflow_records.pop(hook.shortname, None)
+            return
+
+        # Only the serialized result is kept, so recording does not hold
+        # step outputs in memory for the rest of the run.
+        workflow_records[hook.shortname] = {
+            'fingerprint': fingerprint,
+            'outputs': await self._get_file_stats(hook.outputs),
+            'result': result_data
+        }
+
+    async def _get_file_stats(self, paths: List[str]) -> List[FileStats]:
+
+        if len(paths) < 1:
+            return []
+
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            executors.get(ExecutorType.FILE_IO),
+            self._stat_files,
+            paths
+        )
+
+    def _stat_files(self, paths: List[str]) -> List[FileStats]:
+
+        file_stats: List[FileStats] = []
+
+        for path in paths:
+            try:
+                path_stat = os.stat(path)
+
+            except FileNotFoundError:
+                file_stats.append((path, None, None, None))
+                continue
+
+            if self.hash_files and os.path.isfile(path):
+                file_stats.append((
+                    path,
+                    None,
+                    path_stat.st_size,
+                    self._hash_file(path)
+                ))
+
+            else:
+                file_stats.append((
+                    path,
+                    path_stat.st_mtime_ns,
+                    path_stat.st_size,
+                    None
+                ))
+
+        return file_stats
+
+    def _hash_file(self, path: str):
+
+        file_hash = hashlib.sha256()
+
+        with io.open(path, 'rb') as hashed_file:
+            for chunk in iter(lambda: hashed_file.read(1024 * 1024), b''):
+                file_hash.update(chunk)
+
+        return file_hash.hexdigest()
+
+    def _get_state_path(self, workflow_name: str):
+        return os.path.join(
+            self.state_directory,
+            f'{workflow_name}.pickle'
+        )
@@ -0,0 +1,130 @@
+import hashlib
+import inspect
+import json
+import os
+from importlib.metadata import PackageNotFoundError, version
+from typing import Any, Dict, List, Type
+
+from werkflow.logging import WerkflowLogger
+
+
+WERKFLOW_DIRECTORY = os.path.dirname(
+    os.path.dirname(
+        os.path.abspath(__file__)
+    )
+)
+
+
+class PlanCache:
+
+    def __init__(self, cache_directory: str) -> None:
+        self.cache_directory = cache_directory
+        self.enabled = True
+
+        self.logger = WerkflowLogger()
+        self.logger.initialize()
+
+        try:
+            self._werkflow_version = version('werkflow')
+
+        except PackageNotFoundError:
+            self._werkflow_version = 'unknown'
+
+    def create_key(self, workflow_type: Type) -> str | None:
+
+        plan_hash = hashlib.sha256()
+        plan_hash.update(self._werkflow_version.encode())
+        plan_hash.update(workflow_type.__name__.encode())
+
+        source_files: List[str] = []
+        for workflow_class in inspect.getmro(workflow_type):
+            if workflow_class is object:
+                continue
+
+            try:
+                source_file = os.path.abspath(
+                    inspect.getfile(workflow_class)
+                )
+
+            except (OSError, TypeError):
+                return None
+
+            if source_file.startswith(WERKFLOW_DIRECTORY):
+                continue
+
+            if source_file not in source_files:
+                source_files.append(source_file)
+
+        if len(source_files) < 1:
+            return None
+
+        for source_file in source_files:
+            try:
+                with open(source_file, 'rb') as workflow_source:
+                    plan_hash.update(workflow_source.read())
+
+            except OSError:
+                return None
+
+        return plan_hash.hexdigest()
+
+    def load(self, key: str) -> Dict[str, Any] | None:
+
+        if self.enabled is False:
+            return None
+
+        try:
+            with open(self._get_plan_path(key)) as plan_file:
+                return json.load(plan_file)
+
+        except FileNotFoundError:
+            return None
+
+        except ValueError:
+            return None
+
+        except OSError as error:
+            self._disable(error)
+            return None
+
+    def save(
+        self,
+        key: str,
+        plan: Dict[str, Any]
+    ):
+        if self.enabled is False:
+            return
+
+        plan_path = self._get_plan_path(key)
+        temporary_path = f'{plan_path}.{os.getpid()}.tmp'
+
+        try:
+            os.makedirs(self.cache_directory, exist_ok=True)
+
+            with open(temporary_path, 'w') as plan_file:
+                json.dump(plan, plan_file)
+
+            os.replace(temporary_path, plan_path)
+
+        except OSError as error:
+            self._disable(error)
+
+            try:
+                os.remove(temporary_path)
+
+            except OSError:
+                pass
+
+    def _disable(self, error: OSError):
+        # The plan cache only saves setup work, so an unusable cache
+        # directory should not fail the run.
+        self.enabled = False
+        self.logger.console.sync.warning(
+            f'Plan cache at - {self.cache_directory} - is unavailable ({error}). Continuing without it.'
+        )
+
+    def _get_plan_path(self, key: str):
+        return os.path.join(
+            self.cache_directory,
+            f'{key}.json'
+        )
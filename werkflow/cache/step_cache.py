@@ -0,0 +1,207 @@
+import asyncio
+import hashlib
+import os
+import pickle
+from collections import OrderedDict
+from typing import Any, Dict
+
+from werkflow.hooks.types.base.base_hook import BaseHook
+from werkflow.tools.executors import ExecutorType, executors
+from werkflow.tools.filesystem import open
+
+from .hashing import hash_step_source, serialize_step_args
+
+
+class StepCache:
+
+    def __init__(
+        self,
+        cache_directory: str,
+        max_size: int=1024**3,
+        max_memory_entries: int=128
+    ) -> None:
+        self.cache_directory = cache_directory
+        self.max_size = max_size
+        self.max_memory_entries = max_memory_entries
+
+        self._memory: OrderedDict[str, bytes] = OrderedDict()
+        self._index: OrderedDict[str, int] | None = None
+        self._index_lock = asyncio.Lock()
+        self._source_hashes: Dict[str, str] = {}
+        self._size = 0
+
+    def create_key(
+        self,
+        hook: BaseHook,
+        hook_args: Dict[str, Any]
+    ) -> str | None:
+
+        source_hash = self._source_hashes.get(hook.name)
+        if source_hash is None:
+            source_hash = hash_step_source(hook)
+            self._source_hashes[hook.name] = source_hash
+
+        serialized_args = serialize_step_args(hook_args)
+        if serialized_args is None:
+            return None
+
+        step_hash = hashlib.sha256()
+        step_hash.update(hook.name.encode())
+        step_hash.update(source_hash.encode())
+        step_hash.update(serialized_args)
+
+        return step_hash.hexdigest()
+
+    async def get(self, key: str) -> Dict[str, Any] | None:
+
+        # Hits are unpickled each time so a step that mutates its input
+        # cannot change what later hits of the same entry receive.
+        entry_data = self._memory.get(key)
+        if entry_data is not None:
+            self._memory.move_to_end(key)
+            return pickle.loads(entry_data)
+
+        await self._load_index()
+        if key not in self._index:
+            return None
+
+        entry_path = self._get_entry_path(key)
+
+        try:
+            entry_file = await open(entry_path, 'rb')
+            entry_data = await entry_file.read()
+            await entry_file.close()
+
+        except FileNotFoundError:
+            self._remove_from_index(key)
+            return None
+
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(
+            executors.get(ExecutorType.FILE_IO),
+            os.utime,
+            entry_path
+        )
+
+        self._index.move_to_end(key)
+
+        self._store_in_memory(key, entry_data)
+
+        return pickle.loads(entry_data)
+
+    async def set(
+        self,
+        key: str,
+        result: Dict[str, Any]
+    ):
+
+        try:
+            entry_data = pickle.dumps(
+                result,
+                protocol=pickle.HIGHEST_PROTOCOL
+            )
+
+        except Exception:
+            return
+
+        self._store_in_memory(key, entry_data)
+
+        await self._load_index()
+
+        entry_path = self._get_entry_path(key)
+        temporary_path = f'{entry_path}.{os.getpid()}.tmp'
+
+        entry_file = await open(temporary_path, 'wb')
+        await entry_file.write(entry_data)
+        await entry_file.close()
+
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(
+            executors.get(ExecutorType.FILE_IO),
+            os.replace,
+            temporary_path,
+            entry_path
+        )
+
+        self._remove_from_index(key)
+        self._index[key] = len(entry_data)
+        self._size += len(entry_data)
+
+        await self._evict()
+
+    async def _evict(self):
+
+        loop = asyncio.get_running_loop()
+
+        while self._size > self.max_size and len(self._index) > 1:
+            evicted_key = next(iter(self._index))
+            self._remove_from_index(evicted_key)
+            self._memory.pop(evicted_key, None)
+
+            try:
+                await loop.run_in_executor(
+                    executors.get(ExecutorType.FILE_IO),
+                    os.remove,
+                    self._get_entry_path(evicted_key)
+                )
+
+            except FileNotFoundError:
+                pass
+
+    async def _load_index(self):
+
+        if self._index is not None:
+            return
+
+        async with self._index_lock:
+            if self._index is not None:
+                return
+
+            loop = asyncio.get_running_loop()
+            entries = await loop.run_in_executor(
+                executors.get(ExecutorType.FILE_IO),
+                self._scan_directory
+            )
+
+            self._index = OrderedDict(entries)
+            self._size = sum(self._index.values())
+
+    def _scan_directory(self):
+
+        os.makedirs(self.cache_directory, exist_ok=True)
+
+        entries = []
+        for entry in os.scandir(self.cache_directory):
+            if entry.is_file() and entry.name.endswith('.pickle'):
+                entry_stat = entry.stat()
+                entries.append((
+                    entry_stat.st_mtime,
+                    entry.name[:-len('.pickle')],
+                    entry_stat.st_size
+                ))
+
+        return [
+            (key, size) for _, key, size in sorted(entries)
+        ]
+
+    def _remove_from_index(self, key: str):
+        size = self._index.pop(key, None)
+        if size is not None:
+            self._size -= size
+
+    def _store_in_memory(
+        self,
+        key: str,
+        entry_data: bytes
+    ):
+        self._memory[key] = entry_data
+        self._memory.move_to_end(key)
+
+        while len(self._memory) > self.max_memory_entries:
+            self._memory.popitem(last=False)
+
+    def _get_entry_path(self, key: str):
+        return os.path.join(
+            self.cache_directory,
+            f'{key}.pickle'
+        )
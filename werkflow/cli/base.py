@@ -1,19 +1,16 @@
 import os
-from importlib.metadata import version
+import sys
 from typing import Any, Callable, List, Optional, Union
 
 import click
-from art import text2art
-
-from werkflow.logging import WerkflowLogger
 
 
 class CLI(click.MultiCommand):
 
     command_files = {
-        'run': 'run.py'
+        'run': 'run.py',
+        'worker': 'worker.py'
     }
-    logger = WerkflowLogger()
 
     def __init__(
         self, 
@@ -35,13 +32,38 @@ class CLI(click.MultiCommand):
             **attrs
         )
 
-        self.logger.initialize()
+    def main(
+        self,
+        args: Optional[List[str]] = None,
+        *main_args: Any,
+        **kwargs: Any
+    ) -> Any:
+
+        command_args = sys.argv[1:] if args is None else list(args)
+
+        # --ci mutes CLI graphics, so the banner and the art import it
+        # needs are skipped along with them.
+        if '--ci' not in command_args:
+            self.show_banner()
+
+        return super().main(args, *main_args, **kwargs)
+
+    def show_banner(self):
+        # The banner and logging stack are only needed once a command
+        # is actually invoked, not when the entrypoint is imported.
+        from importlib.metadata import version
+
+        from art import text2art
+
+        from werkflow.logging import WerkflowLogger
+
+        logger = WerkflowLogger()
+        logger.initialize()
 
         header_text = text2art('werkflow', font='rozzo').strip('\n')
         werkflow_version = version('werkflow')
 
-        self.logger.console.sync.info(f'\n{header_text} v{werkflow_version}\n\n')
-
+        logger.console.sync.info(f'\n{header_text} v{werkflow_version}\n\n')
 
     def list_commands(self, ctx: click.Context) -> List[str]:
         rv = []
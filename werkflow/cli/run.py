@@ -1,16 +1,14 @@
 import asyncio
 import json
 import os
+import secrets
+import subprocess
+import sys
+import tempfile
 from typing import List
 
 import click
 
-from werkflow.cli.import_tools.workflow import import_workflow
-from werkflow.cli.signals import add_abort_handler
-from werkflow.graph import Graph, WorkflowGroup
-from werkflow.logging import LoggerTypes, WerkflowLogger, logging_manager
-from werkflow_core import Module
-
 
 @click.command(
     help='Run the workflow at the given path or by the given name.'
@@ -47,6 +45,61 @@ from werkflow_core import Module
     is_flag=True,
     help='Gracefully abort on any exceptions encountered during execution instead of throwing.'
 )
+@click.option(
+    '--scheduler',
+    type=click.Choice(['generations', 'eager']),
+    show_default=True,
+    default='generations',
+    help='Run steps generation by generation or start each step as soon as its dependencies complete.'
+)
+@click.option(
+    '--cache',
+    is_flag=True,
+    help='Reuse results of steps whose code and inputs are unchanged since a previous run.'
+)
+@click.option(
+    '--incremental',
+    is_flag=True,
+    help='Only re-run steps whose inputs, code, or declared files changed since the last run, and the steps downstream of them.'
+)
+@click.option(
+    '--no-plan-cache',
+    is_flag=True,
+    help='Rebuild the execution plan for each workflow instead of loading it from the cache directory.'
+)
+@click.option(
+    '--cache-directory',
+    show_default=True,
+    default=f'{os.getcwd()}/.werkflow/cache',
+    help='Output directory for cached step results and incremental run state. If the directory does not exist it will be created.'
+)
+@click.option(
+    '--no-report',
+    is_flag=True,
+    help='Skip the per-step timing and critical path report at the end of the run.'
+)
+@click.option(
+    '--reports-directory',
+    show_default=True,
+    default=f'{os.getcwd()}/.werkflow/reports',
+    help='Output directory for JSON run reports. If the directory does not exist it will be created.'
+)
+@click.option(
+    '--coordinator-address',
+    help='Dispatch steps to workers connected at this tcp://host:port or unix:///path address.'
+)
+@click.option(
+    '--local-workers',
+    show_default=True,
+    default=0,
+    help='Start this many worker processes on this machine and dispatch steps to them.'
+)
+@click.option(
+    '--min-workers',
+    show_default=True,
+    default=1,
+    help='Number of workers that must connect before the run starts.'
+)
 @click.argument('path')
 def run(
     ci: bool,
@@ -56,11 +109,47 @@ def run(
     log_level: str,
     logfiles_directory: str,
     graceful_abort: bool,
+    scheduler: str,
+    cache: bool,
+    incremental: bool,
+    no_plan_cache: bool,
+    cache_directory: str,
+    no_report: bool,
+    reports_directory: str,
+    coordinator_address: str | None,
+    local_workers: int,
+    min_workers: int,
 ):
+    # The graph, logging and module stacks are imported here so loading
+    # the command to parse arguments or print help stays fast.
+    from werkflow_core import Module
+
+    from werkflow.cli.import_tools.workflow import import_workflow
+    from werkflow.cli.signals import add_abort_handler
+    from werkflow.graph import Graph, WorkflowGroup
+    from werkflow.logging import LoggerTypes, WerkflowLogger, logging_manager
+
     werkflow_config = {
         'config_path': config_path,
-        'graceful_abort': graceful_abort
+        'graceful_abort': graceful_abort,
+        'scheduler': scheduler,
+        'step_cache': cache,
+        'incremental': incremental,
+        'plan_cache': no_plan_cache is False,
+        'cache_directory': cache_directory,
+        'report': no_report is False,
+        'reports_directory': reports_directory,
     }
+
+    if local_workers > 0 and coordinator_address is None:
+        coordinator_address = f'unix://{tempfile.gettempdir()}/werkflow-{os.getpid()}.sock'
+
+    if coordinator_address:
+        werkflow_config.update({
+            'coordinator_address': coordinator_address,
+            'min_workers': max(min_workers, local_workers),
+        })
+
     if os.path.exists(config_path):
         with open(config_path) as werkflow_config_file:
             werkflow_config_json = json.load(werkflow_config_file)
@@ -133,7 +222,50 @@ def run(
         graph
     )
 
-    loop.run_until_complete(graph.run())    
+    worker_processes: List[subprocess.Popen] = []
+    if local_workers > 0:
+        # Local workers share a generated secret unless one is set.
+        if os.getenv('MERCURY_SYNC_AUTH_SECRET') is None:
+            os.environ['MERCURY_SYNC_AUTH_SECRET'] = secrets.token_hex(32)
+
+        worker_processes = [
+            subprocess.Popen([
+                sys.executable,
+                '-m',
+                'werkflow.cli.worker',
+                path,
+                '--coordinator-address',
+                coordinator_address,
+                '--config-path',
+                config_path,
+                '--log-level',
+                log_level,
+                '--logfiles-directory',
+                logfiles_directory
+            ]) for _ in range(local_workers)
+        ]
+
+    try:
+        loop.run_until_complete(graph.run())
+
+    finally:
+        for worker_process in worker_processes:
+            try:
+                worker_process.wait(timeout=5)
+
+            except subprocess.TimeoutExpired:
+                worker_process.terminate()
+
+    if werkflow_config.get('report'):
+        report = graph.create_report()
+        report_path = os.path.join(
+            werkflow_config.get('reports_directory'),
+            f'{workflow.__class__.__name__}.json'
+        )
+
+        report.save(report_path)
+
+        logger.console.sync.info(f'\n{report.to_text()}\n\nReport saved to - {report_path}')
 
     if logger.spinner.logger_enabled:
         logger.console.sync.info(f'\nGraph - {workflow.__class__.__name__} - completed! {graph.logger.spinner.display.total_timer.elapsed_message}\n')
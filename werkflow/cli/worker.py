@@ -0,0 +1,114 @@
+import asyncio
+import json
+import os
+
+import click
+
+from werkflow.cli.import_tools.workflow import import_workflow
+from werkflow.connections import ConnectionAddress, Worker
+from werkflow.connections.env import Env, load_env
+from werkflow.graph import Graph, WorkflowGroup
+from werkflow.logging import LoggerTypes, WerkflowLogger, logging_manager
+
+
+@click.command(
+    help='Run steps dispatched by a coordinating run of the workflow at the given path.'
+)
+@click.option(
+    '--coordinator-address',
+    required=True,
+    help='The tcp://host:port or unix:///path address of the coordinating run.'
+)
+@click.option(
+    '--slots',
+    show_default=True,
+    default=1,
+    help='Number of steps this worker runs concurrently.'
+)
+@click.option(
+    '--config-path',
+    show_default=True,
+    default=f'{os.getcwd()}/.werkflow.json',
+    help='Path to existing .werkflow.json.'
+)
+@click.option(
+    '--log-level',
+    default='info',
+    help='Set log level.'
+)
+@click.option(
+    '--logfiles-directory',
+    show_default=True,
+    default=f'{os.getcwd()}/logs',
+    help='Output directory for logfiles. If the directory does not exist it will be created.'
+)
+@click.argument('path')
+def worker(
+    coordinator_address: str,
+    slots: int,
+    config_path: str,
+    log_level: str,
+    logfiles_directory: str,
+    path: str,
+):
+    werkflow_config = {
+        'config_path': config_path,
+    }
+
+    if os.path.exists(config_path):
+        with open(config_path) as werkflow_config_file:
+            werkflow_config.update(json.load(werkflow_config_file))
+
+    logging_manager.disable(
+        LoggerTypes.DISTRIBUTED,
+        LoggerTypes.DISTRIBUTED_FILESYSTEM,
+        LoggerTypes.SPINNER,
+        LoggerTypes.WERKFLOW
+    )
+
+    logging_manager.update_log_level(log_level)
+    logging_manager.logfiles_directory = logfiles_directory
+
+    os.makedirs(logfiles_directory, exist_ok=True)
+
+    logger = WerkflowLogger()
+    logger.initialize()
+
+    discovered = import_workflow(path)
+    workflow: WorkflowGroup = discovered.get('workflow')
+
+    loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(loop)
+
+    graph = Graph(
+        workflow,
+        no_prompt=True,
+        werkflow_config=werkflow_config,
+    )
+
+    graph.setup(resolve_prompts=False)
+
+    step_worker = Worker(
+        load_env(Env),
+        ConnectionAddress(coordinator_address),
+        graph.run_step,
+        slots=slots
+    )
+
+    logger.console.sync.info(
+        f'Worker - {step_worker.name} - connecting to - {step_worker.address}'
+    )
+
+    try:
+        loop.run_until_complete(step_worker.run())
+
+    finally:
+        loop.run_until_complete(graph.close())
+
+    logger.console.sync.info(
+        f'Worker - {step_worker.name} - ran {step_worker.completed} steps.'
+    )
+
+
+if __name__ == '__main__':
+    worker()
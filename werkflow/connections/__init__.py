@@ -0,0 +1,3 @@
+from .coordinator import Coordinator
+from .transport import ConnectionAddress
+from .worker import Worker
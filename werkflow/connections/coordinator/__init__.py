@@ -0,0 +1,3 @@
+from .coordinator import Coordinator
+from .dispatched_step import DispatchedStep
+from .worker_session import WorkerSession
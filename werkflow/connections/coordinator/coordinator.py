@@ -0,0 +1,201 @@
+import asyncio
+import itertools
+import os
+from typing import Any, Dict
+
+from werkflow.connections.encryption import AESGCMFernet
+from werkflow.connections.env import Env, TimeParser
+from werkflow.connections.exceptions import (
+    ConnectionAuthenticationError,
+    InvalidPayloadError,
+    WorkersUnavailableError,
+)
+from werkflow.connections.transport import (
+    COORDINATOR_ROLE,
+    WORKER_ROLE,
+    ConnectionAddress,
+    FrameStream,
+)
+from werkflow.hooks.types.base.base_hook import BaseHook
+
+from .dispatched_step import DispatchedStep
+from .worker_session import WorkerSession
+
+
+class Coordinator:
+
+    def __init__(
+        self,
+        env: Env,
+        address: ConnectionAddress
+    ) -> None:
+        self.address = address
+        self._secret = env.MERCURY_SYNC_AUTH_SECRET.encode()
+        self._encryptor = AESGCMFernet(env)
+        self._connect_timeout = TimeParser(env.MERCURY_SYNC_CONNECT_SECONDS).time
+        self._workers_timeout = TimeParser(env.MERCURY_SYNC_WORKERS_WAIT_SECONDS).time
+
+        self._step_ids = itertools.count()
+        self._queue: asyncio.Queue[DispatchedStep] | None = None
+        self._sessions: Dict[int, WorkerSession] = {}
+        self._workers_changed: asyncio.Condition | None = None
+        self._workers_watch: asyncio.Task | None = None
+        self._server: asyncio.AbstractServer | None = None
+
+    @property
+    def workers(self) -> Dict[str, int]:
+        return {
+            session.name: session.completed for session in self._sessions.values()
+        }
+
+    async def start(self):
+        self._queue = asyncio.Queue()
+        self._workers_changed = asyncio.Condition()
+
+        self._server = await self.address.start_server(
+            self._handle_connection
+        )
+
+    async def wait_for_workers(self, count: int):
+        try:
+            await asyncio.wait_for(
+                self._wait_for_connected(count),
+                timeout=self._workers_timeout
+            )
+
+        except asyncio.TimeoutError:
+            raise WorkersUnavailableError(
+                count,
+                len(self._sessions),
+                self._workers_timeout
+            )
+
+    async def submit(
+        self,
+        hook: BaseHook,
+        hook_args: Dict[str, Any]
+    ) -> Any:
+        step = DispatchedStep(
+            next(self._step_ids),
+            hook.workflow,
+            hook.shortname,
+            hook_args
+        )
+
+        self._queue.put_nowait(step)
+
+        if len(self._sessions) < 1:
+            self._watch_workers()
+
+        # Cancelling the caller, e.g. on a step timeout, cancels the
+        # future, which tells the worker to cancel the step as well.
+        return await step.future
+
+    async def close(self):
+        if self._workers_watch:
+            self._workers_watch.cancel()
+
+        if self._server is None:
+            return
+
+        self._server.close()
+
+        await asyncio.gather(*[
+            session.close() for session in list(self._sessions.values())
+        ])
+
+        await self._server.wait_closed()
+        self._server = None
+
+        if self.address.is_unix:
+            try:
+                os.unlink(self.address.path)
+
+            except FileNotFoundError:
+                pass
+
+    async def _handle_connection(
+        self,
+        reader: asyncio.StreamReader,
+        writer: asyncio.StreamWriter
+    ):
+        stream = FrameStream(
+            reader,
+            writer,
+            self._encryptor
+        )
+
+        try:
+            await asyncio.wait_for(
+                stream.authenticate(
+                    self._secret,
+                    COORDINATOR_ROLE,
+                    WORKER_ROLE
+                ),
+                timeout=self._connect_timeout
+            )
+
+            hello: Dict[str, Any] = await asyncio.wait_for(
+                stream.receive(),
+                timeout=self._connect_timeout
+            )
+
+        except (
+            ConnectionAuthenticationError,
+            asyncio.TimeoutError,
+            asyncio.IncompleteReadError,
+            ConnectionError,
+            InvalidPayloadError
+        ):
+            await stream.close()
+            return
+
+        session = WorkerSession(
+            stream,
+            hello.get('name', stream.peer),
+            hello.get('slots', 1)
+        )
+
+        async with self._workers_changed:
+            self._sessions[id(session)] = session
+            self._workers_changed.notify_all()
+
+        try:
+            await session.run(self._queue)
+
+        finally:
+            async with self._workers_changed:
+                self._sessions.pop(id(session), None)
+                self._workers_changed.notify_all()
+
+            await stream.close()
+
+            # Steps lost with a worker go back on the queue for the rest.
+            for step in session.unfinished:
+                self._queue.put_nowait(step)
+
+            if len(self._sessions) < 1 and self._server is not None:
+                self._watch_workers()
+
+    async def _wait_for_connected(self, count: int):
+        async with self._workers_changed:
+            await self._workers_changed.wait_for(
+                lambda: len(self._sessions) >= count
+            )
+
+    def _watch_workers(self):
+        if self._workers_watch is None or self._workers_watch.done():
+            self._workers_watch = asyncio.create_task(
+                self._fail_without_workers()
+            )
+
+    async def _fail_without_workers(self):
+        try:
+            await self.wait_for_workers(1)
+
+        except WorkersUnavailableError as unavailable_error:
+            while not self._queue.empty():
+                step = self._queue.get_nowait()
+
+                if not step.future.done():
+                    step.future.set_exception(unavailable_error)
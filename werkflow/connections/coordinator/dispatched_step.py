@@ -0,0 +1,27 @@
+import asyncio
+from typing import Any, Dict
+
+
+class DispatchedStep:
+
+    def __init__(
+        self,
+        step_id: int,
+        workflow_name: str,
+        step_name: str,
+        hook_args: Dict[str, Any]
+    ) -> None:
+        self.id = step_id
+        self.workflow_name = workflow_name
+        self.step_name = step_name
+        self.hook_args = hook_args
+        self.future: asyncio.Future = asyncio.get_running_loop().create_future()
+
+    def to_message(self) -> Dict[str, Any]:
+        return {
+            'type': 'step',
+            'id': self.id,
+            'workflow': self.workflow_name,
+            'step': self.step_name,
+            'args': self.hook_args
+        }
@@ -0,0 +1,135 @@
+import asyncio
+import pickle
+from typing import Dict, List
+
+from werkflow.connections.exceptions import InvalidPayloadError, RemoteStepError
+from werkflow.connections.transport import FrameStream
+
+from .dispatched_step import DispatchedStep
+
+
+class WorkerSession:
+
+    def __init__(
+        self,
+        stream: FrameStream,
+        name: str,
+        slots: int
+    ) -> None:
+        self.stream = stream
+        self.name = name
+        self.slots = max(slots, 1)
+        self.in_flight: Dict[int, DispatchedStep] = {}
+        self.completed = 0
+
+    @property
+    def unfinished(self) -> List[DispatchedStep]:
+        return [
+            step for step in self.in_flight.values() if not step.future.done()
+        ]
+
+    async def run(
+        self,
+        queue: asyncio.Queue[DispatchedStep]
+    ):
+
+        # Each slot only takes a step from the shared queue once its
+        # previous step finished, so idle workers pick up work that
+        # busy ones have not claimed.
+        dispatchers = [
+            asyncio.create_task(
+                self._dispatch(queue)
+            ) for _ in range(self.slots)
+        ]
+
+        try:
+            await self._receive()
+
+        except (
+            asyncio.IncompleteReadError,
+            ConnectionError,
+            InvalidPayloadError
+        ):
+            pass
+
+        finally:
+            for dispatcher in dispatchers:
+                dispatcher.cancel()
+
+            await asyncio.gather(*dispatchers, return_exceptions=True)
+
+    async def close(self):
+        try:
+            await self.stream.send({
+                'type': 'shutdown'
+            })
+
+        except ConnectionError:
+            pass
+
+        await self.stream.close()
+
+    async def _dispatch(
+        self,
+        queue: asyncio.Queue[DispatchedStep]
+    ):
+        while True:
+            step = await queue.get()
+
+            if step.future.done():
+                continue
+
+            self.in_flight[step.id] = step
+
+            try:
+                await self.stream.send(step.to_message())
+
+            except ConnectionError:
+                return
+
+            except Exception as serialization_error:
+                self.in_flight.pop(step.id)
+                step.future.set_exception(serialization_error)
+                continue
+
+            await asyncio.wait([step.future])
+            self.in_flight.pop(step.id, None)
+
+            if step.future.cancelled():
+                await self.stream.send({
+                    'type': 'cancel',
+                    'id': step.id
+                })
+
+    async def _receive(self):
+        while True:
+            message = await self.stream.receive()
+
+            step = self.in_flight.get(message.get('id'))
+            if step is None or step.future.done():
+                continue
+
+            self.completed += 1
+
+            # A value that cannot be rebuilt here fails its own step
+            # rather than the session, which would requeue it.
+            try:
+                value = pickle.loads(message.get('payload'))
+
+            except Exception as unpickle_error:
+                step.future.set_exception(
+                    RemoteStepError(
+                        step.step_name,
+                        step.workflow_name,
+                        self.name,
+                        f'a {message.get("type")} the coordinator could not unpickle - {unpickle_error!r}'
+                    )
+                )
+
+                continue
+
+            if message.get('type') == 'error':
+                step.future.set_exception(value)
+
+            else:
+                step.future.set_result(value)
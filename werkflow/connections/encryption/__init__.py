@@ -1 +1,3 @@
-from .aes_gcm import AESGCMFernet
\ No newline at end of file
+from .aes_gcm import AESGCMFernet
+from .aes_gcm_decryptor import AESGCMDecryptor
+from .aes_gcm_encryptor import AESGCMEncryptor
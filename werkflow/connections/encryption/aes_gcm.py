@@ -1,20 +1,115 @@
-import secrets
-from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+from typing import BinaryIO
+
 from werkflow.connections.env import Env
 
+from .aes_gcm_decryptor import AESGCMDecryptor
+from .aes_gcm_encryptor import AESGCMEncryptor
+from .aes_gcm_framing import CHUNK_TAG_SIZE, PAYLOAD_HEADER, get_encrypted_size
+
 
 class AESGCMFernet:
 
     def __init__(self, env: Env) -> None:
         self.secret = env.MERCURY_SYNC_AUTH_SECRET
+        self.chunk_size = env.MERCURY_SYNC_ENCRYPTION_CHUNK_SIZE
+        self._secret = self.secret.encode()
+
+    def encryptor(self) -> AESGCMEncryptor:
+        return AESGCMEncryptor(
+            self._secret,
+            self.chunk_size
+        )
+
+    def decryptor(self) -> AESGCMDecryptor:
+        return AESGCMDecryptor(self._secret)
+
+    def get_encrypted_size(self, size: int) -> int:
+        return get_encrypted_size(
+            size,
+            self.chunk_size
+        )
+
+    def encrypt(self, data: bytes | bytearray | memoryview) -> bytearray:
+        data = memoryview(data).cast('B')
+        encryptor = self.encryptor()
+
+        encrypted = bytearray(
+            self.get_encrypted_size(len(data))
+        )
+
+        encrypted[:PAYLOAD_HEADER.size] = encryptor.header
+        offset = PAYLOAD_HEADER.size
+
+        for record in encryptor.update(data):
+            encrypted[offset:offset + len(record)] = record
+            offset += len(record)
+
+        encrypted[offset:] = encryptor.finalize()
+
+        return encrypted
+
+    def decrypt(self, data: bytes | bytearray | memoryview) -> bytearray:
+        data = memoryview(data).cast('B')
+        decryptor = self.decryptor()
+
+        # Reading the header first sizes the output, so plaintext is
+        # written in place instead of being joined from chunks.
+        for _ in decryptor.update(data[:PAYLOAD_HEADER.size]):
+            pass
+
+        decrypted = bytearray(
+            decryptor.get_decrypted_size(len(data))
+        )
+
+        offset = 0
+        for chunk in decryptor.update(data[PAYLOAD_HEADER.size:]):
+            decrypted[offset:offset + len(chunk)] = chunk
+            offset += len(chunk)
+
+        decrypted[offset:] = decryptor.finalize()
+
+        return decrypted
+
+    def encrypt_stream(
+        self,
+        source: BinaryIO,
+        destination: BinaryIO
+    ) -> int:
+        encryptor = self.encryptor()
+
+        destination.write(encryptor.header)
+        written = len(encryptor.header)
+
+        buffer = bytearray(self.chunk_size)
+        view = memoryview(buffer)
+
+        while read_size := source.readinto(buffer):
+            for record in encryptor.update(view[:read_size]):
+                destination.write(record)
+                written += len(record)
+
+        final_record = encryptor.finalize()
+        destination.write(final_record)
+
+        return written + len(final_record)
+
+    def decrypt_stream(
+        self,
+        source: BinaryIO,
+        destination: BinaryIO
+    ) -> int:
+        decryptor = self.decryptor()
+        written = 0
+
+        buffer = bytearray(self.chunk_size + CHUNK_TAG_SIZE)
+        view = memoryview(buffer)
+
+        while read_size := source.readinto(buffer):
+            for chunk in decryptor.update(view[:read_size]):
+                destination.write(chunk)
+                written += len(chunk)
+
+        final_chunk = decryptor.finalize()
+        destination.write(final_chunk)
 
-    def encrypt(self, data: bytes) -> bytes:
-        key = secrets.token_bytes(32)
-        nonce = secrets.token_bytes(12)
-        return key + nonce + AESGCM(key).encrypt(nonce, data, b"")
-    
-    def decrypt(self, data: bytes) -> bytes:
-        key = data[:32]
-        nonce = data[32:44]
-        return AESGCM(key).decrypt(nonce, data[44:], b"")
-    
+        return written + len(final_chunk)
@@ -0,0 +1,146 @@
+from typing import Iterator
+
+from cryptography.exceptions import InvalidTag
+
+from werkflow.connections.exceptions import InvalidPayloadError
+
+from .aes_gcm_framing import (
+    CHUNK_NONCE,
+    CHUNK_TAG_SIZE,
+    MAX_CHUNK_SIZE,
+    MAX_CHUNKS,
+    PAYLOAD_HEADER,
+    PAYLOAD_VERSION,
+    derive_cipher,
+    get_decrypted_size,
+)
+
+
+class AESGCMDecryptor:
+
+    def __init__(self, secret: bytes) -> None:
+        self._secret = secret
+        self._header = bytearray()
+        self._nonce_prefix: bytes | None = None
+        self._cipher = None
+        self._record_size = 0
+
+        self.chunk_size: int | None = None
+
+        self._pending = bytearray()
+        self._pending_size = 0
+        self._counter = 0
+        self._finalized = False
+
+    def get_decrypted_size(self, encrypted_size: int) -> int:
+        if self.chunk_size is None:
+            raise InvalidPayloadError('the payload header has not been read')
+
+        decrypted_size = get_decrypted_size(
+            encrypted_size,
+            self.chunk_size
+        )
+
+        if decrypted_size < 0:
+            raise InvalidPayloadError(f'{encrypted_size} bytes is not a valid payload size')
+
+        return decrypted_size
+
+    def update(self, data: bytes | bytearray | memoryview) -> Iterator[bytes]:
+
+        data = memoryview(data).cast('B')
+        offset = 0
+
+        if self._cipher is None:
+            offset = min(PAYLOAD_HEADER.size - len(self._header), len(data))
+            self._header += data[:offset]
+
+            if len(self._header) < PAYLOAD_HEADER.size:
+                return
+
+            self._read_header()
+
+        if self._pending_size > 0:
+            filled = min(self._record_size - self._pending_size, len(data) - offset)
+            self._pending[self._pending_size:self._pending_size + filled] = data[offset:offset + filled]
+
+            self._pending_size += filled
+            offset += filled
+
+            if self._pending_size < self._record_size:
+                return
+
+            yield self._open(memoryview(self._pending), False)
+            self._pending_size = 0
+
+        # Final chunks are always short, so every full record can be
+        # opened as soon as it arrives.
+        while len(data) - offset >= self._record_size:
+            yield self._open(data[offset:offset + self._record_size], False)
+            offset += self._record_size
+
+        remaining = len(data) - offset
+        self._pending[:remaining] = data[offset:]
+        self._pending_size = remaining
+
+    def finalize(self) -> bytes:
+        if self._finalized:
+            raise RuntimeError('Decryptor was already finalized.')
+
+        self._finalized = True
+
+        if self._cipher is None:
+            raise InvalidPayloadError('the payload header is truncated')
+
+        return self._open(
+            memoryview(self._pending)[:self._pending_size],
+            True
+        )
+
+    def _read_header(self):
+        version, chunk_size, salt, nonce_prefix = PAYLOAD_HEADER.unpack(self._header)
+
+        if version != PAYLOAD_VERSION:
+            raise InvalidPayloadError(f'unsupported version {version}')
+
+        elif chunk_size < 1 or chunk_size > MAX_CHUNK_SIZE:
+            raise InvalidPayloadError(f'chunk size {chunk_size} is out of range')
+
+        self.chunk_size = chunk_size
+        self._header = bytes(self._header)
+        self._nonce_prefix = nonce_prefix
+        self._cipher = derive_cipher(self._secret, salt)
+        self._record_size = chunk_size + CHUNK_TAG_SIZE
+        self._pending = bytearray(self._record_size)
+
+    def _open(
+        self,
+        record: memoryview,
+        final: bool
+    ) -> bytes:
+
+        if len(record) < CHUNK_TAG_SIZE:
+            raise InvalidPayloadError('the final chunk is truncated')
+
+        elif self._counter > MAX_CHUNKS:
+            raise InvalidPayloadError('the payload exceeds the maximum number of chunks')
+
+        nonce = CHUNK_NONCE.pack(
+            self._nonce_prefix,
+            self._counter,
+            int(final)
+        )
+
+        self._counter += 1
+
+        try:
+            return self._cipher.decrypt(
+                nonce,
+                record,
+                self._header
+            )
+
+        except InvalidTag:
+            raise InvalidPayloadError(
+                f'chunk {self._counter - 1} failed authentication'
+            )
@@ -0,0 +1,100 @@
+import secrets
+from typing import Iterator
+
+from .aes_gcm_framing import (
+    CHUNK_NONCE,
+    MAX_CHUNKS,
+    PAYLOAD_HEADER,
+    PAYLOAD_VERSION,
+    derive_cipher,
+)
+
+
+class AESGCMEncryptor:
+
+    def __init__(
+        self,
+        secret: bytes,
+        chunk_size: int
+    ) -> None:
+        self.chunk_size = chunk_size
+
+        salt = secrets.token_bytes(16)
+        self._nonce_prefix = secrets.token_bytes(7)
+        self._cipher = derive_cipher(secret, salt)
+
+        self.header = PAYLOAD_HEADER.pack(
+            PAYLOAD_VERSION,
+            chunk_size,
+            salt,
+            self._nonce_prefix
+        )
+
+        self._pending = bytearray(chunk_size)
+        self._pending_size = 0
+        self._counter = 0
+        self._finalized = False
+
+    def update(self, data: bytes | bytearray | memoryview) -> Iterator[bytes]:
+
+        data = memoryview(data).cast('B')
+        offset = 0
+
+        if self._pending_size > 0:
+            filled = min(self.chunk_size - self._pending_size, len(data))
+            self._pending[self._pending_size:self._pending_size + filled] = data[:filled]
+
+            self._pending_size += filled
+            offset = filled
+
+            if self._pending_size < self.chunk_size:
+                return
+
+            yield self._seal(memoryview(self._pending), False)
+            self._pending_size = 0
+
+        # Full chunks are sealed straight from the caller's buffer and
+        # only a trailing partial chunk is copied.
+        while len(data) - offset >= self.chunk_size:
+            yield self._seal(data[offset:offset + self.chunk_size], False)
+            offset += self.chunk_size
+
+        remaining = len(data) - offset
+        self._pending[:remaining] = data[offset:]
+        self._pending_size = remaining
+
+    def finalize(self) -> bytes:
+        if self._finalized:
+            raise RuntimeError('Encryptor was already finalized.')
+
+        self._finalized = True
+
+        # The final chunk is always shorter than a full chunk, possibly
+        # empty, so truncation at a chunk boundary is detected.
+        return self._seal(
+            memoryview(self._pending)[:self._pending_size],
+            True
+        )
+
+    def _seal(
+        self,
+        chunk: memoryview,
+        final: bool
+    ) -> bytes:
+
+        if self._counter > MAX_CHUNKS:
+            raise OverflowError('Payload exceeds the maximum number of chunks.')
+
+        nonce = CHUNK_NONCE.pack(
+            self._nonce_prefix,
+            self._counter,
+            int(final)
+        )
+
+        self._counter += 1
+
+        return self._cipher.encrypt(
+            nonce,
+            chunk,
+            self.header
+        )
@@ -0,0 +1,58 @@
+import struct
+
+from cryptography.hazmat.primitives import hashes
+from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+from cryptography.hazmat.primitives.kdf.hkdf import HKDF
+
+
+# version, chunk size, key salt, nonce prefix
+PAYLOAD_HEADER = struct.Struct('!BI16s7s')
+PAYLOAD_VERSION = 1
+
+# nonce prefix + chunk counter + final chunk flag
+CHUNK_NONCE = struct.Struct('!7sIB')
+CHUNK_TAG_SIZE = 16
+
+DEFAULT_CHUNK_SIZE = 1024**2
+MAX_CHUNK_SIZE = 16 * 1024**2
+MAX_CHUNKS = 2**32 - 1
+
+KEY_INFO = b'werkflow.connections.aes-gcm'
+
+
+def derive_cipher(
+    secret: bytes,
+    salt: bytes
+) -> AESGCM:
+
+    # Every payload gets its own key, so random nonce prefixes never
+    # need to stay unique across payloads.
+    return AESGCM(
+        HKDF(
+            algorithm=hashes.SHA256(),
+            length=32,
+            salt=salt,
+            info=KEY_INFO
+        ).derive(secret)
+    )
+
+
+def get_encrypted_size(
+    size: int,
+    chunk_size: int
+) -> int:
+    # Full chunks plus one short, possibly empty, final chunk.
+    return PAYLOAD_HEADER.size + size + (size // chunk_size + 1) * CHUNK_TAG_SIZE
+
+
+def get_decrypted_size(
+    encrypted_size: int,
+    chunk_size: int
+) -> int:
+    record_size = chunk_size + CHUNK_TAG_SIZE
+    body_size = encrypted_size - PAYLOAD_HEADER.size
+
+    if body_size < CHUNK_TAG_SIZE or body_size % record_size < CHUNK_TAG_SIZE:
+        return -1
+
+    return body_size - (body_size // record_size + 1) * CHUNK_TAG_SIZE
@@ -1,5 +1,4 @@
+from werkflow.env.load_env import load_env
+
 from .env import Env
-from .monitor_env import MonitorEnv
-from .replication_env import ReplicationEnv
-from .registrar_env import RegistrarEnv
-from .load_env import load_env
\ No newline at end of file
+from .time_parser import TimeParser
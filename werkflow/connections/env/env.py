@@ -0,0 +1,23 @@
+from typing import Any, Dict
+
+from pydantic import StrictInt, StrictStr, conint
+
+from werkflow.env.env import Env as BaseEnv
+
+
+class Env(BaseEnv):
+    MERCURY_SYNC_AUTH_SECRET: StrictStr
+    MERCURY_SYNC_CONNECT_SECONDS: StrictStr = '5s'
+    MERCURY_SYNC_CONNECT_RETRIES: StrictInt = 10
+    MERCURY_SYNC_WORKERS_WAIT_SECONDS: StrictStr = '60s'
+    MERCURY_SYNC_ENCRYPTION_CHUNK_SIZE: conint(ge=1, le=16 * 1024**2) = 1024**2
+
+    @classmethod
+    def get_parse_map(cls) -> Dict[str, Any]:
+        return {
+            'MERCURY_SYNC_AUTH_SECRET': str,
+            'MERCURY_SYNC_CONNECT_SECONDS': str,
+            'MERCURY_SYNC_CONNECT_RETRIES': int,
+            'MERCURY_SYNC_WORKERS_WAIT_SECONDS': str,
+            'MERCURY_SYNC_ENCRYPTION_CHUNK_SIZE': int,
+        }
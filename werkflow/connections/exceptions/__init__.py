@@ -0,0 +1,4 @@
+from .connection_authentication_error import ConnectionAuthenticationError
+from .invalid_payload_error import InvalidPayloadError
+from .remote_step_error import RemoteStepError
+from .workers_unavailable_error import WorkersUnavailableError
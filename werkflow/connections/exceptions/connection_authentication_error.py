@@ -0,0 +1,6 @@
+class ConnectionAuthenticationError(Exception):
+
+    def __init__(self, peer: str) -> None:
+        super().__init__(
+            f'Connection - {peer} - failed to authenticate. Check that MERCURY_SYNC_AUTH_SECRET matches on the coordinator and all workers.'
+        )
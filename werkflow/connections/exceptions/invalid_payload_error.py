@@ -0,0 +1,6 @@
+class InvalidPayloadError(Exception):
+
+    def __init__(self, reason: str) -> None:
+        super().__init__(
+            f'Encrypted payload is invalid - {reason}'
+        )
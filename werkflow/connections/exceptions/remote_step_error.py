@@ -0,0 +1,35 @@
+class RemoteStepError(Exception):
+
+    def __init__(
+        self,
+        step_name: str,
+        workflow_name: str,
+        worker_name: str,
+        error: str,
+        remote_traceback: str | None=None
+    ) -> None:
+        self.step_name = step_name
+        self.workflow_name = workflow_name
+        self.worker_name = worker_name
+        self.error = error
+        self.remote_traceback = remote_traceback
+
+        message = f'Step - {step_name} - for workflow - {workflow_name} - failed on worker - {worker_name} - with - {error}'
+        if remote_traceback:
+            message = f'{message}\n\nRemote traceback:\n{remote_traceback}'
+
+        super().__init__(message)
+
+    def __reduce__(self):
+        # Exceptions unpickle by calling the class with self.args, which
+        # only holds the message, so the original arguments are given.
+        return (
+            RemoteStepError,
+            (
+                self.step_name,
+                self.workflow_name,
+                self.worker_name,
+                self.error,
+                self.remote_traceback
+            )
+        )
@@ -0,0 +1,11 @@
+class WorkersUnavailableError(Exception):
+
+    def __init__(
+        self,
+        expected: int,
+        connected: int,
+        timeout: float
+    ) -> None:
+        super().__init__(
+            f'Expected - {expected} - workers but only - {connected} - connected within - {timeout} - seconds.'
+        )
@@ -0,0 +1,2 @@
+from .connection_address import ConnectionAddress
+from .frame_stream import COORDINATOR_ROLE, WORKER_ROLE, FrameStream
@@ -0,0 +1,70 @@
+import asyncio
+from typing import Awaitable, Callable, Tuple
+
+
+class ConnectionAddress:
+
+    def __init__(self, address: str) -> None:
+        self.address = address
+        self.host: str | None = None
+        self.port: int | None = None
+        self.path: str | None = None
+
+        if address.startswith('unix://'):
+            self.path = address[len('unix://'):]
+
+            if len(self.path) < 1:
+                raise ValueError(f'Address - {address} - is missing a socket path.')
+
+            return
+
+        if address.startswith('tcp://'):
+            address = address[len('tcp://'):]
+
+        host, _, port = address.rpartition(':')
+        if len(host) < 1 or not port.isdigit():
+            raise ValueError(
+                f'Address - {self.address} - must be tcp://host:port or unix:///path.'
+            )
+
+        self.host = host.strip('[]')
+        self.port = int(port)
+
+    @property
+    def is_unix(self) -> bool:
+        return self.path is not None
+
+    def __str__(self) -> str:
+        if self.is_unix:
+            return f'unix://{self.path}'
+
+        return f'tcp://{self.host}:{self.port}'
+
+    async def start_server(
+        self,
+        handler: Callable[
+            [asyncio.StreamReader, asyncio.StreamWriter],
+            Awaitable[None]
+        ]
+    ) -> asyncio.AbstractServer:
+
+        if self.is_unix:
+            return await asyncio.start_unix_server(
+                handler,
+                path=self.path
+            )
+
+        return await asyncio.start_server(
+            handler,
+            host=self.host,
+            port=self.port
+        )
+
+    async def connect(self) -> Tuple[asyncio.StreamReader, asyncio.StreamWriter]:
+        if self.is_unix:
+            return await asyncio.open_unix_connection(path=self.path)
+
+        return await asyncio.open_connection(
+            host=self.host,
+            port=self.port
+        )
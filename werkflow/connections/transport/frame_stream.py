@@ -0,0 +1,135 @@
+import asyncio
+import hmac
+import pickle
+import secrets
+import struct
+from typing import Any
+
+from werkflow.connections.encryption import AESGCMFernet
+from werkflow.connections.encryption.aes_gcm_framing import (
+    CHUNK_TAG_SIZE,
+    PAYLOAD_HEADER,
+)
+from werkflow.connections.exceptions import ConnectionAuthenticationError
+
+
+FRAME_HEADER = struct.Struct('!Q')
+CHALLENGE_SIZE = 32
+DIGEST_SIZE = 32
+
+COORDINATOR_ROLE = b'coordinator'
+WORKER_ROLE = b'worker'
+
+
+class FrameStream:
+
+    def __init__(
+        self,
+        reader: asyncio.StreamReader,
+        writer: asyncio.StreamWriter,
+        encryptor: AESGCMFernet
+    ) -> None:
+        self._reader = reader
+        self._writer = writer
+        self._encryptor = encryptor
+        self._send_lock = asyncio.Lock()
+
+        peer = writer.get_extra_info('peername')
+        self.peer = str(peer) if peer else 'local'
+
+    async def authenticate(
+        self,
+        secret: bytes,
+        role: bytes,
+        peer_role: bytes
+    ):
+        # Both sides prove they hold the shared secret before any frame
+        # is unpickled. Signing with the role stops a peer reflecting
+        # our own challenge back at us.
+        challenge = secrets.token_bytes(CHALLENGE_SIZE)
+        self._writer.write(challenge)
+        await self._writer.drain()
+
+        try:
+            peer_challenge = await self._reader.readexactly(CHALLENGE_SIZE)
+
+            self._writer.write(
+                hmac.digest(secret, role + peer_challenge, 'sha256')
+            )
+            await self._writer.drain()
+
+            peer_digest = await self._reader.readexactly(DIGEST_SIZE)
+
+        except asyncio.IncompleteReadError:
+            raise ConnectionAuthenticationError(self.peer)
+
+        expected_digest = hmac.digest(secret, peer_role + challenge, 'sha256')
+        if not hmac.compare_digest(peer_digest, expected_digest):
+            raise ConnectionAuthenticationError(self.peer)
+
+    async def send(self, message: Any):
+        payload = pickle.dumps(message, protocol=pickle.HIGHEST_PROTOCOL)
+        encryptor = self._encryptor.encryptor()
+
+        # Records are written as they are sealed, so a large payload is
+        # never held as ciphertext in full.
+        async with self._send_lock:
+            self._writer.write(
+                FRAME_HEADER.pack(
+                    self._encryptor.get_encrypted_size(len(payload))
+                )
+            )
+
+            self._writer.write(encryptor.header)
+
+            for record in encryptor.update(payload):
+                self._writer.write(record)
+                await self._writer.drain()
+
+            self._writer.write(encryptor.finalize())
+            await self._writer.drain()
+
+    async def receive(self) -> Any:
+        header = await self._reader.readexactly(FRAME_HEADER.size)
+        (frame_size,) = FRAME_HEADER.unpack(header)
+
+        decryptor = self._encryptor.decryptor()
+
+        payload_header = await self._reader.readexactly(PAYLOAD_HEADER.size)
+        for _ in decryptor.update(payload_header):
+            pass
+
+        payload = bytearray(
+            decryptor.get_decrypted_size(frame_size)
+        )
+
+        remaining = frame_size - PAYLOAD_HEADER.size
+        read_size = decryptor.chunk_size + CHUNK_TAG_SIZE
+        offset = 0
+
+        while remaining > 0:
+            record = await self._reader.readexactly(
+                min(read_size, remaining)
+            )
+
+            remaining -= len(record)
+
+            for chunk in decryptor.update(record):
+                payload[offset:offset + len(chunk)] = chunk
+                offset += len(chunk)
+
+        payload[offset:] = decryptor.finalize()
+
+        return pickle.loads(payload)
+
+    async def close(self):
+        if self._writer.is_closing():
+            return
+
+        self._writer.close()
+
+        try:
+            await self._writer.wait_closed()
+
+        except (ConnectionError, OSError):
+            pass
@@ -0,0 +1,201 @@
+import asyncio
+import os
+import pickle
+import socket
+import traceback
+from typing import Any, Awaitable, Callable, Dict
+
+from werkflow.connections.encryption import AESGCMFernet
+from werkflow.connections.env import Env, TimeParser
+from werkflow.connections.exceptions import InvalidPayloadError, RemoteStepError
+from werkflow.connections.transport import (
+    COORDINATOR_ROLE,
+    WORKER_ROLE,
+    ConnectionAddress,
+    FrameStream,
+)
+
+
+class Worker:
+
+    def __init__(
+        self,
+        env: Env,
+        address: ConnectionAddress,
+        execute: Callable[
+            [str, str, Dict[str, Any]],
+            Awaitable[Any]
+        ],
+        slots: int=1,
+        name: str | None=None
+    ) -> None:
+        self.address = address
+        self.slots = slots
+        self.name = name or f'{socket.gethostname()}:{os.getpid()}'
+        self.completed = 0
+
+        self._execute = execute
+        self._secret = env.MERCURY_SYNC_AUTH_SECRET.encode()
+        self._encryptor = AESGCMFernet(env)
+        self._connect_timeout = TimeParser(env.MERCURY_SYNC_CONNECT_SECONDS).time
+        self._connect_retries = env.MERCURY_SYNC_CONNECT_RETRIES
+        self._running: Dict[int, asyncio.Task] = {}
+
+    async def run(self):
+        stream = await self._connect()
+
+        try:
+            await stream.send({
+                'type': 'hello',
+                'name': self.name,
+                'slots': self.slots
+            })
+
+            while True:
+                try:
+                    message: Dict[str, Any] = await stream.receive()
+
+                except (
+                    asyncio.IncompleteReadError,
+                    ConnectionError,
+                    InvalidPayloadError
+                ):
+                    break
+
+                message_type = message.get('type')
+
+                if message_type == 'step':
+                    self._start_step(stream, message)
+
+                elif message_type == 'cancel':
+                    step_task = self._running.get(message.get('id'))
+                    if step_task:
+                        step_task.cancel()
+
+                elif message_type == 'shutdown':
+                    break
+
+        finally:
+            running = list(self._running.values())
+            for step_task in running:
+                step_task.cancel()
+
+            await asyncio.gather(*running, return_exceptions=True)
+            await stream.close()
+
+    async def _connect(self) -> FrameStream:
+
+        # Workers are often started alongside the coordinator, so the
+        # first attempts may land before it is listening.
+        for attempt in range(self._connect_retries + 1):
+            try:
+                reader, writer = await asyncio.wait_for(
+                    self.address.connect(),
+                    timeout=self._connect_timeout
+                )
+
+                break
+
+            except (OSError, asyncio.TimeoutError) as connect_error:
+                if attempt == self._connect_retries:
+                    raise connect_error
+
+                await asyncio.sleep(
+                    min(0.1 * 2**attempt, 2)
+                )
+
+        stream = FrameStream(
+            reader,
+            writer,
+            self._encryptor
+        )
+
+        await asyncio.wait_for(
+            stream.authenticate(
+                self._secret,
+                WORKER_ROLE,
+                COORDINATOR_ROLE
+            ),
+            timeout=self._connect_timeout
+        )
+
+        return stream
+
+    def _start_step(
+        self,
+        stream: FrameStream,
+        message: Dict[str, Any]
+    ):
+        step_id = message.get('id')
+
+        step_task = asyncio.create_task(
+            self._run_step(stream, message)
+        )
+
+        self._running[step_id] = step_task
+        step_task.add_done_callback(
+            lambda _: self._running.pop(step_id, None)
+        )
+
+    async def _run_step(
+        self,
+        stream: FrameStream,
+        message: Dict[str, Any]
+    ):
+        step_id = message.get('id')
+        workflow_name = message.get('workflow')
+        step_name = message.get('step')
+
+        try:
+            response_type = 'result'
+            response_value = await self._execute(
+                workflow_name,
+                step_name,
+                message.get('args')
+            )
+
+        except Exception as step_error:
+            response_type = 'error'
+            response_value = step_error
+
+        self.completed += 1
+
+        # The value is pickled on its own so the coordinator can read
+        # the step id even when the value fails to unpickle there.
+        try:
+            payload = pickle.dumps(
+                response_value,
+                protocol=pickle.HIGHEST_PROTOCOL
+            )
+
+            # Exceptions with custom constructors pickle fine but fail to
+            # rebuild, so errors are only sent as-is if they round-trip.
+            if response_type == 'error':
+                pickle.loads(payload)
+
+        except Exception as serialization_error:
+            failed = response_value if response_type == 'error' else serialization_error
+
+            response_type = 'error'
+            payload = pickle.dumps(
+                RemoteStepError(
+                    step_name,
+                    workflow_name,
+                    self.name,
+                    repr(failed),
+                    ''.join(
+                        traceback.format_exception(failed)
+                    )
+                ),
+                protocol=pickle.HIGHEST_PROTOCOL
+            )
+
+        try:
+            await stream.send({
+                'type': response_type,
+                'id': step_id,
+                'payload': payload
+            })
+
+        except ConnectionError:
+            pass
@@ -1,3 +1,4 @@
 from .graph import Graph
+from .group_concurrency import GroupConcurrency
 from .workflow import Workflow
 from .workflow_group import WorkflowGroup
\ No newline at end of file
@@ -0,0 +1,2 @@
+from .context_liveness import ContextLiveness
+from .run_context import RunContext
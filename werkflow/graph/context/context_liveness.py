@@ -0,0 +1,62 @@
+from typing import Any, Dict, Iterable, Mapping
+
+from werkflow.hooks.types.base.base_hook import BaseHook
+
+from .run_context import RunContext
+
+
+class ContextLiveness:
+
+    def __init__(self) -> None:
+        self._consumers: Dict[str, int] = {}
+        self._unbounded_readers = 0
+
+    def register(self, hooks: Iterable[BaseHook]):
+        for hook in hooks:
+            for param_name in hook.binding.names:
+                self._consumers[param_name] = self._consumers.get(param_name, 0) + 1
+
+            if self._reads_context(hook):
+                self._unbounded_readers += 1
+
+    def release(
+        self,
+        hook: BaseHook,
+        outputs: Mapping[str, Any],
+        context: RunContext
+    ):
+
+        for param_name in hook.binding.names:
+            self._consumers[param_name] -= 1
+
+        if self._reads_context(hook):
+            self._unbounded_readers -= 1
+
+            if self._unbounded_readers == 0:
+                return self.sweep(context)
+
+        if self._unbounded_readers > 0:
+            return
+
+        for key in (*hook.binding.names, *outputs):
+            if key in context and self._consumers.get(key, 0) < 1:
+                del context[key]
+
+    def sweep(self, context: RunContext):
+
+        if self._unbounded_readers > 0:
+            return
+
+        dead_keys = [
+            key for key in context if self._consumers.get(key, 0) < 1
+        ]
+
+        for key in dead_keys:
+            del context[key]
+
+    def _reads_context(self, hook: BaseHook) -> bool:
+        # Step and prompt conditions and var-keyword steps receive the
+        # whole context, so any key may still be read until they have run.
+        return hook.condition is not None or hook.binding.var_keyword or any([
+            prompt.condtition is not None for prompt in hook.prompts
+        ])
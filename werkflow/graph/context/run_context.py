@@ -0,0 +1,93 @@
+from __future__ import annotations
+
+from collections.abc import MutableMapping
+from typing import Any, Dict, Iterator, Mapping, Set
+
+
+class _Deleted:
+    pass
+
+
+DELETED = _Deleted()
+
+
+class RunContext(MutableMapping):
+
+    def __init__(
+        self,
+        values: Dict[str, Any] | None=None,
+        parent: RunContext | None=None
+    ) -> None:
+        self.values: Dict[str, Any] = {} if values is None else values
+        self.parent = parent
+
+    def __getitem__(self, key: str) -> Any:
+        context = self
+        while context is not None:
+            value = context.values.get(key, DELETED)
+
+            if value is not DELETED:
+                return value
+
+            elif key in context.values:
+                break
+
+            context = context.parent
+
+        raise KeyError(key)
+
+    def __contains__(self, key: object) -> bool:
+        try:
+            self[key]
+            return True
+
+        except KeyError:
+            return False
+
+    def __setitem__(self, key: str, value: Any):
+        self.values[key] = value
+
+    def __delitem__(self, key: str):
+        if key not in self:
+            raise KeyError(key)
+
+        # Keys inherited from a parent layer are masked rather than
+        # removed so sibling layers still see them.
+        if self.parent is not None and key in self.parent:
+            self.values[key] = DELETED
+
+        else:
+            del self.values[key]
+
+    def __iter__(self) -> Iterator[str]:
+        seen: Set[str] = set()
+
+        context = self
+        while context is not None:
+            for key, value in context.values.items():
+                if key in seen:
+                    continue
+
+                seen.add(key)
+
+                if value is not DELETED:
+                    yield key
+
+            context = context.parent
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+    @property
+    def changes(self) -> Dict[str, Any]:
+        return {
+            key: value for key, value in self.values.items() if value is not DELETED
+        }
+
+    def child(self) -> RunContext:
+        return RunContext(parent=self)
+
+    def merge(self, outputs: Mapping[str, Any]):
+        for key, value in outputs.items():
+            if value is not None:
+                self.values[key] = value
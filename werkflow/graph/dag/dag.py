@@ -0,0 +1,272 @@
+from typing import Dict, Iterable, Iterator, List, Set, Tuple
+
+
+class DAG:
+
+    def __init__(self) -> None:
+        self._names: List[str] = []
+        self._indexes: Dict[str, int] = {}
+        self._successors: List[List[int]] = []
+        self._predecessors: List[List[int]] = []
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._indexes
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._names)
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    @property
+    def nodes(self) -> List[str]:
+        return list(self._names)
+
+    @property
+    def edges(self) -> List[Tuple[str, str]]:
+        return [
+            (
+                self._names[source],
+                self._names[target]
+            ) for source, targets in enumerate(self._successors) for target in targets
+        ]
+
+    def add_node(self, name: str):
+        if name in self._indexes:
+            return
+
+        self._indexes[name] = len(self._names)
+        self._names.append(name)
+        self._successors.append([])
+        self._predecessors.append([])
+
+    def add_nodes_from(self, names: Iterable[str]):
+        for name in names:
+            self.add_node(name)
+
+    def add_edge(
+        self,
+        source: str,
+        target: str
+    ):
+        self.add_node(source)
+        self.add_node(target)
+
+        source_index = self._indexes[source]
+        target_index = self._indexes[target]
+
+        if target_index not in self._successors[source_index]:
+            self._successors[source_index].append(target_index)
+            self._predecessors[target_index].append(source_index)
+
+    def add_edges_from(self, edges: Iterable[Tuple[str, str]]):
+        for source, target in edges:
+            self.add_edge(source, target)
+
+    def in_degree(self, name: str) -> int:
+        return len(self._predecessors[self._indexes[name]])
+
+    def out_degree(self, name: str) -> int:
+        return len(self._successors[self._indexes[name]])
+
+    def predecessors(self, name: str) -> List[str]:
+        return [
+            self._names[index] for index in self._predecessors[self._indexes[name]]
+        ]
+
+    def successors(self, name: str) -> List[str]:
+        return [
+            self._names[index] for index in self._successors[self._indexes[name]]
+        ]
+
+    def ancestors(self, name: str) -> Set[str]:
+        return {
+            self._names[index] for index in self._walk(
+                self._indexes[name],
+                self._predecessors
+            )
+        }
+
+    def descendants(self, name: str) -> Set[str]:
+        return {
+            self._names[index] for index in self._walk(
+                self._indexes[name],
+                self._successors
+            )
+        }
+
+    def find_cycle(self) -> List[str] | None:
+
+        # 0 - unvisited, 1 - on the current path, 2 - finished.
+        states = [0] * len(self._names)
+        parents = [-1] * len(self._names)
+
+        for root in range(len(self._names)):
+            if states[root] != 0:
+                continue
+
+            stack: List[Tuple[int, int]] = [(root, 0)]
+            states[root] = 1
+
+            while stack:
+                node, edge_position = stack[-1]
+                targets = self._successors[node]
+
+                if edge_position == len(targets):
+                    states[node] = 2
+                    stack.pop()
+                    continue
+
+                stack[-1] = (node, edge_position + 1)
+                target = targets[edge_position]
+
+                if states[target] == 1:
+                    cycle = [node]
+                    while cycle[-1] != target:
+                        cycle.append(parents[cycle[-1]])
+
+                    return [
+                        self._names[index] for index in reversed(cycle)
+                    ]
+
+                elif states[target] == 0:
+                    states[target] = 1
+                    parents[target] = node
+                    stack.append((target, 0))
+
+        return None
+
+    def topological_generations(self) -> List[List[str]] | None:
+
+        indegrees = [
+            len(predecessors) for predecessors in self._predecessors
+        ]
+
+        generation = [
+            index for index, indegree in enumerate(indegrees) if indegree == 0
+        ]
+
+        generations: List[List[str]] = []
+        visited = 0
+
+        while generation:
+            next_generation: List[int] = []
+
+            for node in generation:
+                for target in self._successors[node]:
+                    indegrees[target] -= 1
+
+                    if indegrees[target] == 0:
+                        next_generation.append(target)
+
+            visited += len(generation)
+            generations.append([
+                self._names[index] for index in generation
+            ])
+
+            generation = next_generation
+
+        if visited != len(self._names):
+            return None
+
+        return generations
+
+    def critical_path(
+        self,
+        weights: Dict[str, float]
+    ) -> Tuple[List[str], float]:
+
+        generations = self.topological_generations()
+        if generations is None or len(generations) < 1:
+            return [], 0
+
+        finish_times = [0.0] * len(self._names)
+        previous = [-1] * len(self._names)
+
+        for generation in generations:
+            for name in generation:
+                node = self._indexes[name]
+
+                for source in self._predecessors[node]:
+                    if previous[node] == -1 or finish_times[source] > finish_times[previous[node]]:
+                        previous[node] = source
+
+                start_time = 0.0
+                if previous[node] != -1:
+                    start_time = finish_times[previous[node]]
+
+                finish_times[node] = start_time + weights.get(name, 0)
+
+        node = max(
+            range(len(self._names)),
+            key=lambda index: finish_times[index]
+        )
+
+        total = finish_times[node]
+
+        path = [node]
+        while previous[path[-1]] != -1:
+            path.append(previous[path[-1]])
+
+        return [
+            self._names[index] for index in reversed(path)
+        ], total
+
+    def slack(
+        self,
+        weights: Dict[str, float]
+    ) -> Dict[str, float]:
+
+        generations = self.topological_generations()
+        if generations is None:
+            return {}
+
+        order = [
+            self._indexes[name] for generation in generations for name in generation
+        ]
+
+        durations = [
+            weights.get(name, 0) for name in self._names
+        ]
+
+        earliest_finish = [0.0] * len(self._names)
+        for node in order:
+            earliest_start = max([
+                earliest_finish[source] for source in self._predecessors[node]
+            ], default=0.0)
+
+            earliest_finish[node] = earliest_start + durations[node]
+
+        end_time = max(earliest_finish, default=0.0)
+
+        latest_start = [end_time] * len(self._names)
+        for node in reversed(order):
+            latest_finish = min([
+                latest_start[target] for target in self._successors[node]
+            ], default=end_time)
+
+            latest_start[node] = latest_finish - durations[node]
+
+        return {
+            self._names[node]: latest_start[node] - (earliest_finish[node] - durations[node]) for node in order
+        }
+
+    def _walk(
+        self,
+        start: int,
+        adjacency: List[List[int]]
+    ) -> Set[int]:
+
+        visited: Set[int] = set()
+        stack = list(adjacency[start])
+
+        while stack:
+            node = stack.pop()
+
+            if node in visited:
+                continue
+
+            visited.add(node)
+            stack.extend(adjacency[node])
+
+        return visited
@@ -1 +1,6 @@
-from .step_timeout_error import StepTimeoutError
\ No newline at end of file
+from .graph_cycle_error import GraphCycleError
+from .invalid_map_step_error import InvalidMapStepError
+from .invalid_stream_step_error import InvalidStreamStepError
+from .missing_prompt_values_error import MissingPromptValuesError
+from .missing_step_inputs_error import MissingStepInputsError
+from .step_timeout_error import StepTimeoutError
@@ -0,0 +1,16 @@
+from typing import List
+
+
+class GraphCycleError(Exception):
+
+    def __init__(
+        self, 
+        workflow_name: str,
+        cycle: List[str]
+    ) -> None:
+        
+        cycle_steps = ' -> '.join([*cycle, cycle[0]])
+
+        super().__init__(
+            f'Workflow - {workflow_name} - contains a dependency cycle between steps:\n\t{cycle_steps}'
+        )
@@ -0,0 +1,11 @@
+class InvalidMapStepError(Exception):
+
+    def __init__(
+        self,
+        step_name: str,
+        workflow_name: str,
+        map_over: str
+    ) -> None:
+        super().__init__(
+            f'Step - {step_name} - for workflow - {workflow_name} - maps over - {map_over} - but has no parameter named - {map_over} - to receive each item.'
+        )
@@ -0,0 +1,11 @@
+class InvalidStreamStepError(Exception):
+
+    def __init__(
+        self,
+        step_name: str,
+        workflow_name: str,
+        reason: str
+    ) -> None:
+        super().__init__(
+            f'Step - {step_name} - for workflow - {workflow_name} - cannot stream - {reason}.'
+        )
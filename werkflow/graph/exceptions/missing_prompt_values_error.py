@@ -0,0 +1,17 @@
+from typing import Dict, List
+
+
+class MissingPromptValuesError(Exception):
+
+    def __init__(
+        self, 
+        missing_values: Dict[str, Dict[str, List[str]]]
+    ) -> None:
+        
+        missing_messages = '\n'.join([
+            f'\tWorkflow - {workflow_name} - step - {step_name} - requires: {", ".join(result_keys)}' for workflow_name, workflow_steps in missing_values.items() for step_name, result_keys in workflow_steps.items()
+        ])
+
+        super().__init__(
+            f'Prompt values are not provided by project options, .env, or environment variables with --no-prompt:\n{missing_messages}'
+        )
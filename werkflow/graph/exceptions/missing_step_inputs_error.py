@@ -0,0 +1,17 @@
+from typing import Dict, List
+
+
+class MissingStepInputsError(Exception):
+
+    def __init__(
+        self, 
+        missing_inputs: Dict[str, Dict[str, List[str]]]
+    ) -> None:
+        
+        missing_messages = '\n'.join([
+            f'\tWorkflow - {workflow_name} - step - {step_name} - requires: {", ".join(inputs)}' for workflow_name, workflow_steps in missing_inputs.items() for step_name, inputs in workflow_steps.items()
+        ])
+
+        super().__init__(
+            f'Required step inputs are not provided by project options, prompts, or earlier steps:\n{missing_messages}'
+        )
@@ -1,20 +1,40 @@
 import asyncio
-import functools
 import inspect
+import itertools
 import os
-from typing import Any, Dict, List
-
-import click
-import networkx
-from dotenv import dotenv_values
+import random
+import time
+from typing import TYPE_CHECKING, Any, AsyncIterator, Dict, List, Set, Tuple
 
+from werkflow.cache import IncrementalState, PlanCache, StepCache
 from werkflow.hooks.types.base.base_hook import BaseHook
+from werkflow.hooks.types.base.hook_outputs import find_hook_outputs
 from werkflow.hooks.types.base.registrar import registrar
+from werkflow.hooks.types.step.hook import StepHook
 from werkflow.logging import WerkflowLogger
+from werkflow.tools.executors import executors
+from werkflow.tools.terminal import terminal_io
 
+from .context import ContextLiveness, RunContext
+from .dag import DAG
+from .exceptions import (
+    GraphCycleError,
+    InvalidMapStepError,
+    InvalidStreamStepError,
+    MissingPromptValuesError,
+    MissingStepInputsError,
+    StepTimeoutError,
+)
+from .group_concurrency import GroupConcurrency
+from .report import PromptWait, RunReport, StepTiming
+from .scheduler_mode import SchedulerMode
+from .stream import StepStream
 from .workflow import Workflow
 from .workflow_group import WorkflowGroup
 
+if TYPE_CHECKING:
+    from werkflow.connections import Coordinator
+
 
 class Graph:
 
@@ -31,6 +51,9 @@ class Graph:
         self._no_prompt = no_prompt
         self._werkflow_config = werkflow_config
         self._graceful_abort = werkflow_config.get('graceful_abort', False)
+        self._scheduler_mode = SchedulerMode(
+            werkflow_config.get('scheduler', SchedulerMode.GENERATIONS.value)
+        )
         self._project_options: Dict[str, Any] = self._werkflow_config.get(
             'project_options', {}
         )
@@ -39,6 +62,8 @@ class Graph:
         
         dot_env_path = f'{os.getcwd()}/.env'
         if os.path.exists(dot_env_path):
+            from dotenv import dotenv_values
+
             self._env = dotenv_values(dot_env_path)
 
         self._project_options.update({
@@ -46,164 +71,1556 @@ class Graph:
         })
 
         self._project_options['command_directory'] = os.getcwd()
+        self._prompt_values: Dict[str, Any] = {}
 
-        self._graphs: Dict[str, networkx.DiGraph] = {}
+        self._graphs: Dict[str, DAG] = {}
         self._execution_orders: Dict[str, List[List[str]]] = {}
         self._workflows: Dict[str, Workflow] = workflows.group_workflows
+        self._workflow_group_name = workflows.__class__.__name__
         self._workflow_hooks: Dict[str, Dict[str, BaseHook]] = {}
+        self._workflow_outputs: Dict[str, Dict[str, List[str] | None]] = {}
+        self.scheduler_savings: Dict[str, float] = {}
 
-    def setup(self):
+        group_concurrency = workflows.concurrency
+        if group_concurrency is None:
+            group_concurrency = GroupConcurrency(
+                werkflow_config.get('workflow_concurrency', GroupConcurrency.SEQUENTIAL.value)
+            )
+
+        max_concurrent_workflows = workflows.max_concurrent_workflows
+        if max_concurrent_workflows is None:
+            max_concurrent_workflows = werkflow_config.get('max_concurrent_workflows')
+
+        # A limit of zero would leave every tier waiting on the semaphore.
+        if max_concurrent_workflows is not None and max_concurrent_workflows < 1:
+            raise ValueError(
+                f'Graph - {self._workflow_group_name} - max_concurrent_workflows must be at least 1, got {max_concurrent_workflows}'
+            )
+
+        self._group_concurrency = group_concurrency
+        self._max_concurrent_workflows: int | None = max_concurrent_workflows
+        self._prompt_lock = asyncio.Lock()
+
+        self._step_cache: StepCache | None = None
+        if werkflow_config.get('step_cache'):
+            self._step_cache = StepCache(
+                werkflow_config.get(
+                    'cache_directory',
+                    f'{os.getcwd()}/.werkflow/cache'
+                ),
+                max_size=werkflow_config.get('step_cache_max_size', 1024**3),
+                max_memory_entries=werkflow_config.get('step_cache_memory_entries', 128)
+            )
+
+        self._plan_cache: PlanCache | None = None
+        if werkflow_config.get('plan_cache', True):
+            self._plan_cache = PlanCache(
+                os.path.join(
+                    werkflow_config.get(
+                        'cache_directory',
+                        f'{os.getcwd()}/.werkflow/cache'
+                    ),
+                    'plans'
+                )
+            )
+
+        self._incremental_state: IncrementalState | None = None
+        if werkflow_config.get('incremental'):
+            self._incremental_state = IncrementalState(
+                os.path.join(
+                    werkflow_config.get(
+                        'cache_directory',
+                        f'{os.getcwd()}/.werkflow/cache'
+                    ),
+                    'incremental'
+                ),
+                hash_files=werkflow_config.get('incremental_hash_files', False)
+            )
+
+        self._executed_steps: Dict[str, Set[str]] = {}
+        self._replayed_steps: Dict[str, Set[str]] = {}
+        self._liveness = ContextLiveness()
+
+        self._stream_consumers: Dict[str, Dict[str, List[str]]] = {}
+        self._stream_inputs: Dict[str, Dict[str, List[str]]] = {}
+        self._stream_tasks: Dict[str, List[asyncio.Task]] = {}
+
+        self._prompt_orders: Dict[str, List[str]] = {}
+        self._prompt_waits: Dict[str, Dict[str, List[str]]] = {}
+        self._prompt_events: Dict[str, Dict[str, asyncio.Event]] = {}
+        self._completion_events: Dict[str, Dict[str, asyncio.Event]] = {}
+        self._prompt_tasks: Dict[str, asyncio.Task] = {}
+        self._prompt_wait_timers: Dict[str, PromptWait] = {}
+
+        self._step_timings: Dict[str, Dict[str, StepTiming]] = {}
+        self._workflow_starts: Dict[str, float] = {}
+        self._run_started: float | None = None
+        self._run_completed: float | None = None
+
+        self._coordinator_address: str | None = werkflow_config.get('coordinator_address')
+        self._min_workers: int = werkflow_config.get('min_workers', 1)
+        self._map_concurrency: int = werkflow_config.get('map_concurrency', 16)
+        if self._map_concurrency < 1:
+            raise ValueError(
+                f'Graph - {self._workflow_group_name} - map_concurrency must be at least 1, got {self._map_concurrency}'
+            )
+
+        self._coordinator: Coordinator | None = None
+
+        for executor_name, executor_settings in werkflow_config.get('executors', {}).items():
+            executors.configure(
+                executor_name,
+                **executor_settings
+            )
+
+    def setup(
+        self,
+        resolve_prompts: bool=True
+    ):
 
         for workflow in self._workflows.values():
 
             workflow.werkflow_config.update(self._werkflow_config)
-
-            workflow_graph = networkx.DiGraph()
-            workflow_hooks = {}
             workflow_name = workflow.__class__.__name__
 
-            workflow_methods = inspect.getmembers(
-                workflow, 
-                predicate=inspect.ismethod
-            )
+            plan_key: str | None = None
+            workflow_plan: Dict[str, Any] | None = None
+            workflow_hooks: Dict[str, BaseHook] | None = None
 
-            for _, method in workflow_methods:
-                hook = registrar.all.get(method.__qualname__)
+            if self._plan_cache:
+                plan_key = self._plan_cache.create_key(workflow.__class__)
 
-                if hook:
-                    hook.workflow = workflow_name
+            if plan_key:
+                workflow_plan = self._plan_cache.load(plan_key)
 
-                    hook._call = hook._call.__get__(workflow, workflow.__class__)
-                    setattr(workflow, hook.shortname, hook._call)
+            if workflow_plan:
+                workflow_hooks = self._load_plan_hooks(
+                    workflow,
+                    workflow_plan
+                )
 
-                    workflow_hooks[hook.shortname] = hook
+            if workflow_hooks is None:
+                workflow_hooks = self._collect_hooks(workflow)
+                workflow_graph = DAG()
 
-            workflow_graph.add_nodes_from([
-                (
-                    hook_name, 
-                    {"hook": hook}
-                ) for hook_name, hook in workflow_hooks.items()
-            ])
-            
-            for hook in workflow_hooks.values():
-                for dependency in hook.names:
-                    if workflow_graph.nodes.get(dependency):
-                        workflow_graph.add_edge(dependency, hook.shortname)
+                workflow_graph.add_nodes_from(workflow_hooks.keys())
+                
+                for hook in workflow_hooks.values():
+                    for dependency in hook.names:
+                        if dependency in workflow_graph:
+                            workflow_graph.add_edge(dependency, hook.shortname)
 
-            execution_order: List[List[str]] = [
-                generation for generation in networkx.topological_generations(workflow_graph)
-            ]
+                execution_order = workflow_graph.topological_generations()
+                if execution_order is None:
+                    raise GraphCycleError(
+                        workflow_name,
+                        workflow_graph.find_cycle()
+                    )
+
+                source_definitions = {}
+                workflow_outputs = {
+                    hook_name: find_hook_outputs(
+                        hook,
+                        source_definitions
+                    ) for hook_name, hook in workflow_hooks.items()
+                }
+
+                if plan_key:
+                    self._plan_cache.save(
+                        plan_key,
+                        {
+                            'hooks': {
+                                hook_name: hook.name for hook_name, hook in workflow_hooks.items()
+                            },
+                            'edges': workflow_graph.edges,
+                            'generations': execution_order,
+                            'params': {
+                                hook_name: list(hook.params.keys()) for hook_name, hook in workflow_hooks.items()
+                            },
+                            'outputs': workflow_outputs
+                        }
+                    )
+
+            else:
+                workflow_graph = DAG()
+                workflow_graph.add_nodes_from(workflow_hooks.keys())
+
+                workflow_graph.add_edges_from(workflow_plan.get('edges'))
+                execution_order = workflow_plan.get('generations')
+                workflow_outputs = workflow_plan.get('outputs')
 
             self._execution_orders[workflow_name] = execution_order
             self._workflow_hooks[workflow_name] = workflow_hooks
+            self._workflow_outputs[workflow_name] = workflow_outputs
             self._graphs[workflow_name] = workflow_graph
 
+            self._register_streams(workflow_name)
+            self._register_prompts(workflow_name)
+
+        missing_inputs = self._find_missing_inputs()
+        if len(missing_inputs) > 0:
+            raise MissingStepInputsError(missing_inputs)
+
+        # Graphs that only serve run_step get prompt values in the hook
+        # args they are sent, so they have nothing to resolve.
+        if self._no_prompt and resolve_prompts:
+            self._prompt_values = self._load_prompt_values()
+
+    def _collect_hooks(self, workflow: Workflow) -> Dict[str, BaseHook]:
+
+        workflow_hooks: Dict[str, BaseHook] = {}
+
+        workflow_methods = inspect.getmembers(
+            workflow, 
+            predicate=inspect.ismethod
+        )
+
+        for _, method in workflow_methods:
+            hook = registrar.all.get(method.__qualname__)
+
+            if hook:
+                self._bind_hook(workflow, hook)
+                workflow_hooks[hook.shortname] = hook
+
+        return workflow_hooks
+
+    def _load_plan_hooks(
+        self,
+        workflow: Workflow,
+        workflow_plan: Dict[str, Any]
+    ) -> Dict[str, BaseHook] | None:
+
+        workflow_hooks: Dict[str, BaseHook] = {}
+        plan_params: Dict[str, List[str]] = workflow_plan.get('params', {})
+
+        for hook_name, hook_qualname in workflow_plan.get('hooks', {}).items():
+            hook = registrar.all.get(hook_qualname)
+
+            if hook is None or list(hook.params.keys()) != plan_params.get(hook_name):
+                return None
+
+            elif hook_name not in workflow_plan.get('outputs', {}):
+                return None
+
+            workflow_hooks[hook_name] = hook
+
+        for hook in workflow_hooks.values():
+            self._bind_hook(workflow, hook)
+
+        return workflow_hooks
+
+    def _bind_hook(
+        self,
+        workflow: Workflow,
+        hook: BaseHook
+    ):
+        hook.workflow = workflow.__class__.__name__
+
+        hook._call = hook._call.__get__(workflow, workflow.__class__)
+        setattr(workflow, hook.shortname, hook._call)
+
+        hook.compile_binding()
+
+        map_policy = getattr(hook, 'map_policy', None)
+        if map_policy and map_policy.map_over not in hook.binding.names and hook.binding.var_keyword is False:
+            raise InvalidMapStepError(
+                hook.shortname,
+                hook.workflow,
+                map_policy.map_over
+            )
+
+    def _register_streams(self, workflow_name: str):
+
+        workflow_hooks = self._workflow_hooks.get(workflow_name)
+        workflow_graph = self._graphs.get(workflow_name)
+
+        generation_indexes = {
+            hook_name: generation_index for generation_index, generation in enumerate(
+                self._execution_orders.get(workflow_name)
+            ) for hook_name in generation
+        }
+
+        stream_consumers: Dict[str, List[str]] = {}
+        stream_inputs: Dict[str, List[str]] = {}
+
+        for producer in workflow_hooks.values():
+            if producer.is_stream is False:
+                continue
+
+            if producer.executor == 'process' or producer.map_policy or producer.retry_policy:
+                raise InvalidStreamStepError(
+                    producer.shortname,
+                    workflow_name,
+                    'stream steps run on the event loop without mapping, timeouts, or retries'
+                )
+
+            elif producer.stream_buffer < 1:
+                raise InvalidStreamStepError(
+                    producer.shortname,
+                    workflow_name,
+                    'stream_buffer must be at least 1'
+                )
+
+            consumers = [
+                hook.shortname for hook in workflow_hooks.values() if producer.shortname in hook.binding.names
+            ]
+
+            for consumer in consumers:
+                consumer_hook = workflow_hooks.get(consumer)
+
+                if consumer_hook.executor == 'process' or consumer_hook.is_stream:
+                    raise InvalidStreamStepError(
+                        consumer,
+                        workflow_name,
+                        f'reading - {producer.shortname} - requires running on the event loop as a regular step'
+                    )
+
+                # A consumer waiting on another consumer of the same
+                # stream would never start while the first one blocks
+                # the producer on a full queue.
+                dependent_consumers = workflow_graph.descendants(consumer).intersection(consumers)
+                if len(dependent_consumers) > 0:
+                    raise InvalidStreamStepError(
+                        consumer,
+                        workflow_name,
+                        f'consumers of - {producer.shortname} - must not depend on each other'
+                    )
+
+            consumer_generations = set([
+                generation_indexes.get(consumer) for consumer in consumers
+            ])
+
+            if self._scheduler_mode == SchedulerMode.GENERATIONS and len(consumer_generations) > 1:
+                raise InvalidStreamStepError(
+                    producer.shortname,
+                    workflow_name,
+                    'consumers must share a generation unless using the eager scheduler'
+                )
+
+            stream_consumers[producer.shortname] = consumers
+
+            for consumer in consumers:
+                stream_inputs.setdefault(consumer, []).append(producer.shortname)
+
+        self._stream_consumers[workflow_name] = stream_consumers
+        self._stream_inputs[workflow_name] = stream_inputs
+
+    def _register_prompts(self, workflow_name: str):
+
+        workflow_hooks = self._workflow_hooks.get(workflow_name)
+        execution_order = self._execution_orders.get(workflow_name)
+
+        generation_indexes = {
+            hook_name: generation_index for generation_index, generation in enumerate(
+                execution_order
+            ) for hook_name in generation
+        }
+
+        prompt_order = [
+            hook_name for generation in execution_order for hook_name in generation if len(workflow_hooks.get(hook_name).prompts) > 0
+        ]
+
+        prompt_owners: Dict[str, List[str]] = {}
+        for hook_name in prompt_order:
+            for prompt in workflow_hooks.get(hook_name).prompts:
+                prompt_owners.setdefault(prompt.result_key or hook_name, []).append(hook_name)
+
+        # A step waits only for the prompts it reads and its own. Steps
+        # downstream of it wait through it, and everything else runs
+        # while the prompts are answered. Prompts from later generations
+        # were never visible to a step, so they are not waited on.
+        prompt_waits: Dict[str, List[str]] = {}
+        for hook_name, hook in workflow_hooks.items():
+
+            prompt_keys = [
+                name for name in hook.binding.names if name in prompt_owners
+            ]
+
+            # Conditions and var-keyword steps receive the whole context,
+            # so they wait on every prompt they could have seen.
+            reads_context = hook.condition is not None or hook.binding.var_keyword or any([
+                prompt.condtition is not None for prompt in hook.prompts
+            ])
+
+            if reads_context:
+                prompt_keys = list(prompt_owners.keys())
+
+            waits = set([
+                owner for prompt_key in prompt_keys for owner in prompt_owners[prompt_key] if generation_indexes[owner] <= generation_indexes[hook_name]
+            ])
+
+            if len(hook.prompts) > 0:
+                waits.add(hook_name)
+
+            if len(waits) > 0:
+                prompt_waits[hook_name] = sorted(waits)
+
+        self._prompt_orders[workflow_name] = prompt_order
+        self._prompt_waits[workflow_name] = prompt_waits
+
+    def _load_prompt_values(self) -> Dict[str, Any]:
+
+        # Without a console every prompt is answered up front, so a
+        # missing value fails the run before any step executes.
+        prompt_values: Dict[str, Any] = {}
+        missing_values: Dict[str, Dict[str, List[str]]] = {}
+
+        for workflow_name, workflow_hooks in self._workflow_hooks.items():
+            for hook in workflow_hooks.values():
+                for prompt in hook.prompts:
+
+                    result_key = prompt.result_key
+                    if result_key is None:
+                        result_key = hook.shortname
+
+                    result = self._project_options.get(result_key)
+
+                    if result is None:
+                        result = self._project_options.get(result_key.lower())
+
+                    if result is None:
+                        result = os.environ.get(result_key.upper())
+
+                    if result is None:
+                        result = prompt.default
+
+                    if result is not None:
+                        prompt_values[result_key] = result
+
+                    # Skipped and conditional prompts may never be asked,
+                    # so only unconditional ones must have a value.
+                    elif prompt.skipped is False and prompt.condtition is None:
+                        missing_values.setdefault(workflow_name, {}).setdefault(hook.shortname, []).append(result_key)
+
+        if len(missing_values) > 0:
+            raise MissingPromptValuesError(missing_values)
+
+        return prompt_values
+
+    def _find_missing_inputs(self) -> Dict[str, Dict[str, List[str]]]:
+
+        available: Set[str] = set(self._project_options.keys())
+        unknown_workflows: Set[str] = set()
+
+        for workflow_name, workflow_hooks in self._workflow_hooks.items():
+            for hook in workflow_hooks.values():
+                available.update([
+                    prompt.result_key or hook.shortname for prompt in hook.prompts
+                ])
+
+            for hook_outputs in self._workflow_outputs.get(workflow_name).values():
+                if hook_outputs is None:
+                    unknown_workflows.add(workflow_name)
+
+        missing_inputs: Dict[str, Dict[str, List[str]]] = {}
+
+        for workflow_name, workflow_hooks in self._workflow_hooks.items():
+
+            # Other workflows in the group may run first, so anything they
+            # produce is treated as available.
+            if len(unknown_workflows - {workflow_name}) > 0:
+                continue
+
+            workflow_available = set(available)
+            for other_workflow, other_outputs in self._workflow_outputs.items():
+                if other_workflow != workflow_name:
+                    workflow_available.update(*[
+                        hook_outputs for hook_outputs in other_outputs.values()
+                    ])
+
+            workflow_outputs = self._workflow_outputs.get(workflow_name)
+
+            for generation in self._execution_orders.get(workflow_name):
+                for hook_name in generation:
+                    hook = workflow_hooks.get(hook_name)
+
+                    hook_missing = hook.binding.find_missing(workflow_available)
+                    if len(hook_missing) > 0:
+                        missing_inputs.setdefault(workflow_name, {})[hook_name] = hook_missing
+
+                # Steps only see outputs of earlier generations, and an
+                # earlier step with unknown outputs may provide anything.
+                generation_outputs = [
+                    workflow_outputs.get(hook_name) for hook_name in generation
+                ]
+
+                if None in generation_outputs:
+                    break
+
+                workflow_available.update(*generation_outputs)
+
+        return missing_inputs
+
     async def run(self):
 
-        next_args: Dict[str, Any] = dict(self._project_options)
+        self._run_started = time.monotonic()
+
+        try:
+            if self._coordinator_address:
+                await self._start_coordinator()
+
+            await self._run_tiers()
+
+        finally:
+            self._run_completed = time.monotonic()
+
+            if self._coordinator:
+                await self._coordinator.close()
+                self._coordinator = None
+
+                # Hooks outlive the coordinator, so later runs of this
+                # graph call their steps locally again.
+                for workflow_hooks in self._workflow_hooks.values():
+                    for hook in workflow_hooks.values():
+                        hook.dispatcher = None
+
+    async def run_step(
+        self,
+        workflow_name: str,
+        step_name: str,
+        hook_args: Dict[str, Any]
+    ) -> Any:
+        hook = self._workflow_hooks[workflow_name][step_name]
+        return await hook._invoke(hook_args)
+
+    async def close(self):
+        for workflow in self._workflows.values():
+            await workflow.close()
+
+    async def _start_coordinator(self):
+        from werkflow.connections import ConnectionAddress, Coordinator
+        from werkflow.connections.env import Env, load_env
 
-        loop = asyncio.get_running_loop()
+        self._coordinator = Coordinator(
+            load_env(Env),
+            ConnectionAddress(self._coordinator_address)
+        )
+
+        await self._coordinator.start()
+
+        await self.logger.console.aio.info(
+            f'Waiting for {self._min_workers} workers on - {self._coordinator.address}'
+        )
+
+        await self._coordinator.wait_for_workers(self._min_workers)
+
+        # Conditions, caching, checkpoints, and retries stay with the
+        # graph; only the step body itself runs on a worker. Streams
+        # cannot cross processes, so their steps stay local.
+        for workflow_name, workflow_hooks in self._workflow_hooks.items():
+            stream_inputs = self._stream_inputs.get(workflow_name, {})
+
+            for hook in workflow_hooks.values():
+                if hook.is_stream is False and hook.shortname not in stream_inputs:
+                    hook.dispatcher = self._coordinator.submit
+
+    def create_report(self) -> RunReport:
+        return RunReport(
+            self._workflow_group_name,
+            self._run_started,
+            self._run_completed,
+            self._graphs,
+            self._workflow_starts,
+            self._step_timings,
+            executor_metrics=executors.metrics()
+        )
+
+    async def _run_tiers(self):
+
+        next_args = RunContext({
+            **self._project_options,
+            **self._prompt_values
+        })
+
+        self._liveness = ContextLiveness()
+        for workflow_hooks in self._workflow_hooks.values():
+            self._liveness.register(workflow_hooks.values())
 
-        for workflow_name, execution_order in self._execution_orders.items():
-            
+        for workflow_names in self._get_workflow_tiers():
+
+            if len(workflow_names) > 1:
+                completed = await self._run_concurrent(
+                    workflow_names,
+                    next_args
+                )
+
+                if completed is False:
+                    return
+
+                continue
+
+            workflow_name = workflow_names.pop()
             workflow = self._workflows.get(workflow_name)
-            workflow_hooks = self._workflow_hooks.get(workflow_name)
 
+            completed = await self._run_workflow(
+                workflow_name,
+                next_args
+            )
 
-            for generation in execution_order:
-                generation_hooks: List[BaseHook] = [
-                    workflow_hooks.get(hook_name) for hook_name in generation
-                ]
+            if completed is False:
+                return await workflow.close()
+
+            await workflow.close()
+
+    def _get_workflow_tiers(self) -> List[List[str]]:
+
+        workflow_names = list(self._execution_orders.keys())
+
+        if self._group_concurrency == GroupConcurrency.GROUP:
+            return [workflow_names]
+
+        elif self._group_concurrency == GroupConcurrency.PRIORITY:
+            def get_priority(workflow_name: str):
+                return self._workflows.get(workflow_name).priority
+
+            # groupby only merges adjacent names, so sort first. The sort
+            # is stable and keeps declaration order within each tier.
+            return [
+                list(tier) for _, tier in itertools.groupby(
+                    sorted(
+                        workflow_names,
+                        key=get_priority
+                    ),
+                    key=get_priority
+                )
+            ]
+
+        return [
+            [workflow_name] for workflow_name in workflow_names
+        ]
+
+    async def _run_concurrent(
+        self,
+        workflow_names: List[str],
+        next_args: RunContext
+    ) -> bool:
+
+        max_concurrent_workflows = self._max_concurrent_workflows
+        if max_concurrent_workflows is None:
+            max_concurrent_workflows = len(workflow_names)
+
+        semaphore = asyncio.Semaphore(max_concurrent_workflows)
 
-                current_steps = ', '.join(
-                    list(set([step.shortname for step in generation_hooks]))
+        if self.logger.spinner.logger_enabled:
+            self.logger.spinner.push_message(
+                f"Executing workflows - {', '.join(workflow_names)}"
+            )
+
+            async with self.logger.spinner as status_spinner:
+                results = await self._gather_workflows(
+                    workflow_names,
+                    next_args,
+                    semaphore
                 )
 
-                if self.logger.spinner.logger_enabled:
-                    await self.logger.spinner.append_message(f"Executing steps - {current_steps}")
-
-                generation_prompts = []
-                hooks_with_prompts = []
-                for hook in generation_hooks:
-                    hook_prompts = [hook for hook in generation_hooks if len(hook.prompts) > 0]
-                    generation_prompts.extend(hook_prompts)
-
-                    if len(hook_prompts) > 0:
-                        hooks_with_prompts.append(hook.name)
-
-                for hook in generation_hooks:
-                    for prompt in hook.prompts:
-
-                        result_key = prompt.result_key
-                        if result_key is None:
-                            result_key = hook.shortname
-
-                        result_env_key = result_key.upper()
-                        if self._no_prompt:
-                            result = self._project_options.get(prompt.result_key)
-
-                            if result is None:
-                                result = await loop.run_in_executor(
-                                    None,
-                                    functools.partial(
-                                        os.getenv,
-                                        result_env_key
-                                    )
-                                )
-
-                            if result is not None:
-                                next_args[result_key] = result
-                            
-                        skipped = prompt.skipped
-                        if prompt.condtition:
-                            skipped = prompt.condtition(next_args) is False
-
-                        if skipped is False and self._no_prompt is False:
-
-                            await loop.run_in_executor(
-                                None,
-                                functools.partial(
-                                    click.echo,
-                                    ''
-                                )
-                            )
-
-                            result = await prompt.ask()
-                            await prompt.confirm(result)
-                            next_args[result_key] = result
-
-                            prompt.close()
+                status_spinner.group_finalize()
+                await status_spinner.ok('✔')
 
-                if self.logger.spinner.logger_enabled:
-                    async with self.logger.spinner as status_spinner:
-                        results: List[Dict[str, Any] | Exception] = await asyncio.gather(*[
-                            asyncio.create_task(hook.call(
-                                **next_args,
-                                return_on_failure=self._graceful_abort,
-                            )) for hook in generation_hooks
-                        ])
-
-                        status_spinner.group_finalize()
-                        await status_spinner.ok('✔')
-
-                else:
-                    results: List[Dict[str, Any] | Exception] = await asyncio.gather(*[
-                        asyncio.create_task(hook.call(
-                            **next_args,
-                            return_on_failure=self._graceful_abort,
-                        )) for hook in generation_hooks
+        else:
+            results = await self._gather_workflows(
+                workflow_names,
+                next_args,
+                semaphore
+            )
+
+        for completed, workflow_args in results:
+            if completed is False:
+                return False
+
+            next_args.merge(workflow_args.changes)
+
+        self._liveness.sweep(next_args)
+
+        return True
+
+    async def _gather_workflows(
+        self,
+        workflow_names: List[str],
+        next_args: RunContext,
+        semaphore: asyncio.Semaphore
+    ) -> List[Tuple[bool, RunContext]]:
+        async with asyncio.TaskGroup() as workflows_group:
+            tasks = [
+                workflows_group.create_task(
+                    self._run_bounded_workflow(
+                        workflow_name,
+                        next_args.child(),
+                        semaphore
+                    )
+                ) for workflow_name in workflow_names
+            ]
+
+        return [
+            task.result() for task in tasks
+        ]
+
+    async def _run_bounded_workflow(
+        self,
+        workflow_name: str,
+        workflow_args: RunContext,
+        semaphore: asyncio.Semaphore
+    ) -> Tuple[bool, RunContext]:
+
+        async with semaphore:
+            workflow = self._workflows.get(workflow_name)
+
+            try:
+                completed = await self._run_workflow(
+                    workflow_name,
+                    workflow_args,
+                    manage_spinner=False
+                )
+
+            finally:
+                await workflow.close()
+
+            return completed, workflow_args
+
+    async def _run_workflow(
+        self,
+        workflow_name: str,
+        next_args: RunContext,
+        manage_spinner: bool=True
+    ) -> bool:
+
+        self._workflow_starts[workflow_name] = time.monotonic()
+        self._step_timings[workflow_name] = {}
+        self._prompt_wait_timers[workflow_name] = PromptWait()
+
+        if self._incremental_state is None:
+            return await self._schedule_workflow(
+                workflow_name,
+                next_args,
+                manage_spinner=manage_spinner
+            )
+
+        self._executed_steps[workflow_name] = set()
+        self._replayed_steps[workflow_name] = set()
+
+        await self._incremental_state.load(workflow_name)
+
+        try:
+            completed = await self._schedule_workflow(
+                workflow_name,
+                next_args,
+                manage_spinner=manage_spinner
+            )
+
+        finally:
+            await self._incremental_state.save(workflow_name)
+
+        replayed_count = len(self._replayed_steps[workflow_name])
+        steps_count = len(self._workflow_hooks.get(workflow_name))
+
+        await self.logger.console.aio.info(
+            f'Workflow - {workflow_name} - replayed {replayed_count} of {steps_count} unchanged steps.'
+        )
+
+        return completed
+
+    async def _schedule_workflow(
+        self,
+        workflow_name: str,
+        next_args: RunContext,
+        manage_spinner: bool=True
+    ) -> bool:
+
+        self._stream_tasks[workflow_name] = []
+        self._start_prompts(workflow_name, next_args)
+
+        try:
+            if self._scheduler_mode == SchedulerMode.EAGER:
+                completed = await self._run_eager(
+                    workflow_name,
+                    next_args,
+                    manage_spinner=manage_spinner
+                )
+
+            else:
+                completed = await self._run_generations(
+                    workflow_name,
+                    next_args,
+                    manage_spinner=manage_spinner
+                )
+
+            if completed:
+                completed = await self._finish_streams(workflow_name)
+
+            return completed
+
+        finally:
+            prompt_task = self._prompt_tasks.pop(workflow_name, None)
+            self._prompt_events.pop(workflow_name, None)
+            self._completion_events.pop(workflow_name, None)
+
+            if prompt_task:
+                prompt_task.cancel()
+                await asyncio.gather(prompt_task, return_exceptions=True)
+
+            stream_tasks = self._stream_tasks.pop(workflow_name, [])
+
+            for stream_task in stream_tasks:
+                stream_task.cancel()
+
+            if len(stream_tasks) > 0:
+                await asyncio.gather(*stream_tasks, return_exceptions=True)
+
+    def _start_prompts(
+        self,
+        workflow_name: str,
+        next_args: RunContext
+    ):
+
+        prompt_order = self._prompt_orders.get(workflow_name, [])
+        if self._no_prompt or len(prompt_order) < 1:
+            return
+
+        self._prompt_events[workflow_name] = {
+            hook_name: asyncio.Event() for hook_name in prompt_order
+        }
+
+        self._completion_events[workflow_name] = {
+            hook_name: asyncio.Event() for hook_name in self._workflow_hooks.get(workflow_name)
+        }
+
+        self._prompt_tasks[workflow_name] = asyncio.create_task(
+            self._ask_prompts(
+                workflow_name,
+                next_args
+            )
+        )
+
+    async def _ask_prompts(
+        self,
+        workflow_name: str,
+        next_args: RunContext
+    ):
+
+        workflow_hooks = self._workflow_hooks.get(workflow_name)
+        workflow_graph = self._graphs.get(workflow_name)
+        prompt_events = self._prompt_events.get(workflow_name)
+        completion_events = self._completion_events.get(workflow_name)
+
+        generation_indexes = {
+            hook_name: generation_index for generation_index, generation in enumerate(
+                self._execution_orders.get(workflow_name)
+            ) for hook_name in generation
+        }
+
+        try:
+            for hook_name in self._prompt_orders.get(workflow_name):
+                hook = workflow_hooks.get(hook_name)
+
+                # Conditions read the run context, so they wait for the
+                # steps whose results they would have seen before.
+                if any([prompt.condtition for prompt in hook.prompts]):
+
+                    if self._scheduler_mode == SchedulerMode.EAGER:
+                        condition_steps = workflow_graph.predecessors(hook_name)
+
+                    else:
+                        condition_steps = [
+                            step_name for step_name, generation_index in generation_indexes.items() if generation_index < generation_indexes[hook_name]
+                        ]
+
+                    await asyncio.gather(*[
+                        completion_events[step_name].wait() for step_name in condition_steps
                     ])
 
-                for result in results:
+                await self._resolve_prompts([hook], next_args)
+                prompt_events[hook_name].set()
+
+        finally:
+            # Waiting steps are released on failure too and re-raise the
+            # prompt error themselves.
+            for prompt_event in prompt_events.values():
+                prompt_event.set()
+
+    async def _wait_for_prompts(self, hook: BaseHook):
+
+        prompt_events = self._prompt_events.get(hook.workflow)
+        prompt_hooks = self._prompt_waits.get(hook.workflow, {}).get(hook.shortname)
+
+        if prompt_events is None or prompt_hooks is None:
+            return
+
+        waiting_events = [
+            prompt_events[prompt_hook] for prompt_hook in prompt_hooks if not prompt_events[prompt_hook].is_set()
+        ]
+
+        if len(waiting_events) > 0:
+            prompt_wait = self._prompt_wait_timers[hook.workflow]
+            prompt_wait.start()
+
+            try:
+                await asyncio.gather(*[
+                    prompt_event.wait() for prompt_event in waiting_events
+                ])
+
+            finally:
+                prompt_wait.stop()
+
+        prompt_task = self._prompt_tasks.get(hook.workflow)
+        if prompt_task and prompt_task.done() and not prompt_task.cancelled() and prompt_task.exception():
+            raise prompt_task.exception()
+
+    def _complete_step(
+        self,
+        workflow_name: str,
+        hook_name: str
+    ):
+        completion_events = self._completion_events.get(workflow_name)
+
+        if completion_events:
+            completion_events[hook_name].set()
+
+    async def _finish_streams(self, workflow_name: str) -> bool:
+
+        results = await asyncio.gather(
+            *self._stream_tasks.get(workflow_name, []),
+            return_exceptions=True
+        )
+
+        for result in results:
+            if isinstance(result, Exception) and self._graceful_abort:
+                await self.logger.console.aio.error(f'Encountered - {str(result)} - exception while executing. Aborting run.')
+                return False
+
+            elif isinstance(result, Exception):
+                raise result
+
+        return True
+
+    async def _run_generations(
+        self,
+        workflow_name: str,
+        next_args: RunContext,
+        manage_spinner: bool=True
+    ) -> bool:
+
+        execution_order = self._execution_orders.get(workflow_name)
+        workflow_hooks = self._workflow_hooks.get(workflow_name)
+
+        for generation in execution_order:
+            generation_hooks: List[BaseHook] = [
+                workflow_hooks.get(hook_name) for hook_name in generation
+            ]
+
+            current_steps = ', '.join(
+                list(set([step.shortname for step in generation_hooks]))
+            )
+
+            if self.logger.spinner.logger_enabled:
+                self.logger.spinner.push_message(f"Executing steps - {current_steps}")
+
+            if self.logger.spinner.logger_enabled and manage_spinner:
+                async with self.logger.spinner as status_spinner:
+                    results = await self._gather_hooks(
+                        generation_hooks,
+                        next_args
+                    )
+
+                    status_spinner.group_finalize()
+                    await status_spinner.ok('✔')
+
+            else:
+                results = await self._gather_hooks(
+                    generation_hooks,
+                    next_args
+                )
+
+            for hook, result in zip(generation_hooks, results):
+
+                if isinstance(result, Exception) and self._graceful_abort:
+                    await self.logger.console.aio.error(f'Encountered - {str(result)} - exception while executing. Aborting run.')
+                    return False
+
+                next_args.merge(result)
+                self._liveness.release(hook, result, next_args)
+                self._complete_step(workflow_name, hook.shortname)
+
+        return True
+
+    async def _gather_hooks(
+        self,
+        hooks: List[BaseHook],
+        next_args: RunContext
+    ) -> List[Dict[str, Any] | Exception]:
+
+        tasks = [
+            asyncio.create_task(
+                self._timed_call(hook, next_args)
+            ) for hook in hooks
+        ]
+
+        try:
+            return await asyncio.gather(*tasks)
+
+        finally:
+            # A failing step cancels the rest of its generation rather
+            # than leaving them running unobserved.
+            pending = [
+                task for task in tasks if not task.done()
+            ]
+
+            for task in pending:
+                task.cancel()
+
+            if len(pending) > 0:
+                await asyncio.gather(*pending, return_exceptions=True)
+
+    async def _run_eager(
+        self,
+        workflow_name: str,
+        next_args: RunContext,
+        manage_spinner: bool=True
+    ) -> bool:
+
+        if self.logger.spinner.logger_enabled and manage_spinner:
+            async with self.logger.spinner as status_spinner:
+                run_start = time.monotonic()
+                completed = await self._execute_eager(
+                    workflow_name,
+                    next_args
+                )
+
+                elapsed = time.monotonic() - run_start
+
+                status_spinner.group_finalize()
+                await status_spinner.ok('✔')
+
+        else:
+            run_start = time.monotonic()
+            completed = await self._execute_eager(
+                workflow_name,
+                next_args
+            )
+
+            elapsed = time.monotonic() - run_start
+
+        if completed:
+
+            step_timings = self._step_timings.get(workflow_name)
+
+            generations_estimate = sum([
+                max([
+                    step_timings[hook_name].execution for hook_name in generation if hook_name in step_timings
+                ], default=0) for generation in self._execution_orders.get(workflow_name)
+            ])
+
+            # Step timings leave out time spent waiting on prompts, so the
+            # same time is taken out of the eager run before comparing.
+            prompt_wait = self._prompt_wait_timers.get(workflow_name)
+
+            saved = generations_estimate - (elapsed - prompt_wait.blocked)
+            self.scheduler_savings[workflow_name] = saved
+
+            await self.logger.console.aio.info(
+                f'Workflow - {workflow_name} - completed in {round(elapsed, 2)}s using eager scheduling, saving an estimated {round(saved, 2)}s over generation scheduling.'
+            )
+
+        return completed
+
+    async def _execute_eager(
+        self,
+        workflow_name: str,
+        next_args: RunContext
+    ) -> bool:
+
+        workflow_graph = self._graphs.get(workflow_name)
+        workflow_hooks = self._workflow_hooks.get(workflow_name)
+
+        remaining_dependencies: Dict[str, int] = {
+            hook_name: workflow_graph.in_degree(hook_name) for hook_name in workflow_graph.nodes
+        }
+
+        ready: List[str] = [
+            hook_name for hook_name, dependencies_count in remaining_dependencies.items() if dependencies_count == 0
+        ]
+
+        pending: Dict[asyncio.Task, str] = {}
+
+        try:
+            while len(ready) > 0 or len(pending) > 0:
+
+                for hook_name in ready:
+                    hook = workflow_hooks.get(hook_name)
+
+                    if self.logger.spinner.logger_enabled:
+                        self.logger.spinner.push_message(f"Executing step - {hook.shortname}")
+
+                    pending[
+                        asyncio.create_task(
+                            self._timed_call(hook, next_args)
+                        )
+                    ] = hook_name
+
+                ready = []
+
+                completed_tasks, _ = await asyncio.wait(
+                    pending.keys(),
+                    return_when=asyncio.FIRST_COMPLETED
+                )
+
+                for task in completed_tasks:
+                    hook_name = pending.pop(task)
+                    result = task.result()
 
                     if isinstance(result, Exception) and self._graceful_abort:
                         await self.logger.console.aio.error(f'Encountered - {str(result)} - exception while executing. Aborting run.')
-                        return await workflow.close()
+                        return False
 
-                    next_args.update({
-                        result_key: result_value for result_key, result_value in result.items() if result_value is not None
-                    })
+                    next_args.merge(result)
+                    self._liveness.release(
+                        workflow_hooks.get(hook_name),
+                        result,
+                        next_args
+                    )
 
-            await workflow.close()
+                    self._complete_step(workflow_name, hook_name)
+
+                    for dependent in workflow_graph.successors(hook_name):
+                        remaining_dependencies[dependent] -= 1
+
+                        if remaining_dependencies[dependent] == 0:
+                            ready.append(dependent)
+
+        finally:
+            for task in pending.keys():
+                task.cancel()
+
+            if len(pending) > 0:
+                await asyncio.gather(*pending.keys(), return_exceptions=True)
+
+        return True
+
+    async def _timed_call(
+        self,
+        hook: BaseHook,
+        next_args: RunContext
+    ) -> Dict[str, Any] | Exception:
+        await self._wait_for_prompts(hook)
+
+        started = time.monotonic()
+
+        try:
+            return await self._call_hook(hook, next_args)
+
+        finally:
+            self._step_timings[hook.workflow][hook.shortname] = StepTiming(
+                started,
+                time.monotonic()
+            )
+
+    async def _call_hook(
+        self,
+        hook: StepHook,
+        next_args: RunContext
+    ) -> Dict[str, Any] | Exception:
+
+        if self._incremental_state is None:
+            return await self._execute_hook(hook, next_args)
+
+        workflow_graph = self._graphs.get(hook.workflow)
+        executed_steps = self._executed_steps.get(hook.workflow)
+
+        # Steps that opt out of caching have side effects, so they always
+        # run. Their dependents rerun too, as after any executed step.
+        if hook.cache is False:
+            executed_steps.add(hook.shortname)
+            return await self._execute_hook(hook, next_args)
+
+        condition_result: bool | None = None
+        if hook.condition is not None:
+            condition_result = bool(hook.condition(next_args))
+
+        fingerprint = await self._incremental_state.create_fingerprint(
+            hook,
+            hook.bind(next_args),
+            condition_result=condition_result
+        )
+
+        upstream_executed = any([
+            dependency in executed_steps for dependency in workflow_graph.predecessors(hook.shortname)
+        ])
+
+        if upstream_executed is False:
+            replayed_result = await self._incremental_state.replay(
+                hook,
+                fingerprint
+            )
+
+            if replayed_result is not None:
+                self._replayed_steps[hook.workflow].add(hook.shortname)
+                return replayed_result
+
+        executed_steps.add(hook.shortname)
+
+        result = await self._execute_hook(hook, next_args)
+
+        if not isinstance(result, Exception):
+            await self._incremental_state.record(
+                hook,
+                fingerprint,
+                result
+            )
+
+        return result
+
+    async def _execute_hook(
+        self,
+        hook: StepHook,
+        next_args: RunContext
+    ) -> Dict[str, Any] | Exception:
+
+        # Streams only exist for the length of a run, so neither side
+        # of one is cached or checkpointed.
+        if hook.is_stream:
+            return self._start_stream(hook, next_args)
+
+        stream_inputs = self._stream_inputs.get(hook.workflow, {}).get(hook.shortname)
+        if stream_inputs:
+            return await self._consume_streams(
+                hook,
+                next_args,
+                stream_inputs
+            )
+
+        try:
+            checkpoint_result = await hook.load_checkpoint()
+
+        except Exception as checkpoint_error:
+            if self._graceful_abort:
+                return checkpoint_error
+
+            raise checkpoint_error
+
+        if checkpoint_result is not None:
+            return checkpoint_result
+
+        cache_key: str | None = None
+        use_cache = self._step_cache is not None and hook.cache
+        if use_cache and (hook.condition is None or hook.condition(next_args)):
+            cache_key = self._step_cache.create_key(
+                hook,
+                hook.bind(next_args)
+            )
+
+        result: Dict[str, Any] | Exception | None = None
+        if cache_key:
+            result = await self._step_cache.get(cache_key)
+
+        if result is None and hook.map_policy:
+            result = await self._call_mapped(hook, next_args)
+
+            if isinstance(result, Exception):
+                return result
+
+            if cache_key:
+                await self._step_cache.set(cache_key, result)
+
+        elif result is None:
+            result = await self._call_with_retries(hook, next_args)
+
+            if isinstance(result, Exception):
+                return result
+
+            if cache_key:
+                await self._step_cache.set(cache_key, result)
+
+        try:
+            await hook.save_checkpoint(result)
+
+        except Exception as checkpoint_error:
+            if self._graceful_abort:
+                return checkpoint_error
+
+            raise checkpoint_error
+
+        return result
+
+    def _start_stream(
+        self,
+        hook: StepHook,
+        next_args: RunContext
+    ) -> Dict[str, Any]:
+
+        generator = hook.open_stream(next_args)
+        if generator is None:
+            return {}
+
+        stream = StepStream(
+            hook.shortname,
+            self._stream_consumers[hook.workflow][hook.shortname],
+            hook.stream_buffer
+        )
+
+        # The stream is published as the step's output straight away,
+        # so consumers start while the producer is still yielding.
+        self._stream_tasks[hook.workflow].append(
+            asyncio.create_task(
+                self._pump_stream(
+                    hook,
+                    generator,
+                    stream
+                )
+            )
+        )
+
+        return {
+            hook.shortname: stream
+        }
+
+    async def _pump_stream(
+        self,
+        hook: StepHook,
+        generator: AsyncIterator[Any],
+        stream: StepStream
+    ):
+        try:
+            async for item in generator:
+                await stream.publish(item)
+
+        except Exception as stream_error:
+            await stream.close(stream_error)
+            raise stream_error
+
+        else:
+            await stream.close()
+
+        finally:
+            step_timing = self._step_timings[hook.workflow].get(hook.shortname)
+            if step_timing:
+                self._step_timings[hook.workflow][hook.shortname] = StepTiming(
+                    step_timing.started,
+                    time.monotonic()
+                )
+
+    async def _consume_streams(
+        self,
+        hook: StepHook,
+        next_args: RunContext,
+        stream_inputs: List[str]
+    ) -> Dict[str, Any] | Exception:
+
+        consumer_args = next_args.child()
+        streams: List[StepStream] = []
+
+        for producer_name in stream_inputs:
+            stream = next_args.get(producer_name)
+
+            if isinstance(stream, StepStream):
+                consumer_args[producer_name] = stream.reader(hook.shortname)
+                streams.append(stream)
+
+        try:
+            return await self._call_with_retries(hook, consumer_args)
+
+        finally:
+            for stream in streams:
+                stream.detach(hook.shortname)
+
+    async def _call_mapped(
+        self,
+        hook: StepHook,
+        next_args: RunContext
+    ) -> Dict[str, Any] | Exception:
+
+        map_policy = hook.map_policy
+        items = list(next_args.get(map_policy.map_over, []))
+
+        if map_policy.chunk_size > 1:
+            items = [
+                items[offset:offset + map_policy.chunk_size] for offset in range(
+                    0,
+                    len(items),
+                    map_policy.chunk_size
+                )
+            ]
+
+        if len(items) < 1:
+            return {
+                output_key: [] for output_key in self._get_mapped_output_keys(
+                    hook,
+                    next_args
+                )
+            }
+
+        concurrency = map_policy.concurrency or self._map_concurrency
+        results: List[Dict[str, Any] | Exception | None] = [None] * len(items)
+        remaining = iter(range(len(items)))
+        completed = 0
+
+        async def run_items():
+            nonlocal completed
+
+            # A fixed set of runners pulls items in turn, so the cap
+            # also bounds how many tasks exist at once.
+            for index in remaining:
+
+                # Each invocation sees its item in place of the
+                # collection, with the rest of the context shared.
+                item_args = next_args.child()
+                item_args[map_policy.map_over] = items[index]
+
+                result = await self._call_with_retries(hook, item_args)
+                results[index] = result
+
+                if isinstance(result, Exception):
+                    return
+
+                completed += 1
+                if self.logger.spinner.logger_enabled:
+                    self.logger.spinner.push_message(
+                        f'Step - {hook.shortname} - completed {completed} of {len(items)} items.'
+                    )
+
+        runners = [
+            asyncio.create_task(
+                run_items()
+            ) for _ in range(min(concurrency, len(items)))
+        ]
+
+        try:
+            await asyncio.gather(*runners)
+
+        finally:
+            pending = [
+                runner for runner in runners if not runner.done()
+            ]
+
+            for runner in pending:
+                runner.cancel()
+
+            if len(pending) > 0:
+                await asyncio.gather(*pending, return_exceptions=True)
+
+        for result in results:
+            if isinstance(result, Exception):
+                return result
+
+        # Outputs are collected per key in item order, with None where
+        # an invocation did not produce that key.
+        output_keys: Dict[str, None] = {}
+        for result in results:
+            output_keys.update(dict.fromkeys(result))
+
+        return {
+            output_key: [
+                result.get(output_key) for result in results
+            ] for output_key in output_keys
+        }
+
+    def _get_mapped_output_keys(
+        self,
+        hook: StepHook,
+        next_args: RunContext
+    ) -> List[str]:
+
+        # With no items there are no results to read keys from, so use
+        # the keys found in the step's returns. When those are unknown,
+        # fall back to what direct dependents still need.
+        output_keys = self._workflow_outputs.get(hook.workflow, {}).get(hook.shortname)
+        if output_keys is not None:
+            return output_keys
+
+        workflow_graph = self._graphs.get(hook.workflow)
+        workflow_hooks = self._workflow_hooks.get(hook.workflow)
+
+        missing_keys: Dict[str, None] = {}
+        for dependent_name in workflow_graph.successors(hook.shortname):
+            dependent = workflow_hooks.get(dependent_name)
+            missing_keys.update(
+                dict.fromkeys(
+                    dependent.binding.find_missing(next_args)
+                )
+            )
+
+        return list(missing_keys)
+
+    async def _call_with_retries(
+        self,
+        hook: StepHook,
+        next_args: RunContext
+    ) -> Dict[str, Any] | Exception:
+
+        retry_policy = hook.retry_policy
+        if retry_policy is None:
+            return await hook.call(
+                next_args,
+                return_on_failure=self._graceful_abort,
+            )
+
+        for attempt in range(retry_policy.retries + 1):
+
+            try:
+                # wait_for cancels the attempt on timeout, so a timed out
+                # step does not keep running alongside its retry.
+                result = await asyncio.wait_for(
+                    hook.call(
+                        next_args,
+                        return_on_failure=True
+                    ),
+                    timeout=retry_policy.timeout
+                )
+
+            except asyncio.TimeoutError:
+                result = StepTimeoutError(
+                    hook.shortname,
+                    hook.workflow,
+                    retry_policy.timeout
+                )
+
+            if not isinstance(result, Exception) or attempt == retry_policy.retries:
+                break
+
+            delay = random.uniform(0, retry_policy.backoff * 2**attempt)
+            retry_message = f'Step - {hook.shortname} - failed with - {str(result)} - retrying in {round(delay, 2)}s ({attempt + 1} of {retry_policy.retries}).'
+
+            if self.logger.spinner.logger_enabled:
+                self.logger.spinner.push_message(retry_message)
+
+            else:
+                await self.logger.console.aio.info(retry_message)
+
+            await asyncio.sleep(delay)
+
+        if isinstance(result, Exception) and self._graceful_abort is False:
+            raise result
+
+        return result
+
+    async def _resolve_prompts(
+        self,
+        hooks: List[BaseHook],
+        next_args: RunContext
+    ):
+
+        for hook in hooks:
+            for prompt in hook.prompts:
+
+                result_key = prompt.result_key
+                if result_key is None:
+                    result_key = hook.shortname
+
+                skipped = prompt.skipped
+                if prompt.condtition:
+                    skipped = prompt.condtition(next_args) is False
+
+                if skipped is False:
+
+                    async with self._prompt_lock:
+
+                        if self.logger.spinner.logger_enabled:
+                            await self.logger.spinner.hide()
+
+                        await terminal_io.echo('')
+
+                        result = await prompt.ask()
+                        await prompt.confirm(result)
+                        next_args[result_key] = result
+
+                        prompt.close()
 
-       
+                        if self.logger.spinner.logger_enabled:
+                            await self.logger.spinner.show()
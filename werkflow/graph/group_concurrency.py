@@ -0,0 +1,7 @@
+from enum import Enum
+
+
+class GroupConcurrency(Enum):
+    SEQUENTIAL='sequential'
+    GROUP='group'
+    PRIORITY='priority'
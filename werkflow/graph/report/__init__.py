@@ -0,0 +1,3 @@
+from .prompt_wait import PromptWait
+from .run_report import RunReport
+from .step_timing import StepTiming
@@ -0,0 +1,23 @@
+import time
+
+
+class PromptWait:
+
+    def __init__(self) -> None:
+        self.blocked = 0.0
+        self._waiting = 0
+        self._started = 0.0
+
+    def start(self):
+        # Waits of concurrent steps overlap, so only the time at least
+        # one step is waiting counts towards the blocked total.
+        if self._waiting == 0:
+            self._started = time.monotonic()
+
+        self._waiting += 1
+
+    def stop(self):
+        self._waiting -= 1
+
+        if self._waiting == 0:
+            self.blocked += time.monotonic() - self._started
@@ -0,0 +1,156 @@
+import json
+import os
+from typing import Any, Dict, List
+
+from werkflow.graph.dag import DAG
+
+from .step_timing import StepTiming
+
+
+class RunReport:
+
+    def __init__(
+        self,
+        graph_name: str,
+        run_started: float,
+        run_completed: float,
+        graphs: Dict[str, DAG],
+        workflow_starts: Dict[str, float],
+        step_timings: Dict[str, Dict[str, StepTiming]],
+        executor_metrics: Dict[str, Dict[str, Any]] | None=None
+    ) -> None:
+        self.graph_name = graph_name
+        self.run_started = run_started
+        self.run_completed = run_completed
+        self.workflows: Dict[str, Dict[str, Any]] = {}
+        self.executors: Dict[str, Dict[str, Any]] = executor_metrics or {}
+
+        for workflow_name, workflow_timings in step_timings.items():
+            self.workflows[workflow_name] = self._create_workflow_report(
+                graphs.get(workflow_name),
+                workflow_starts.get(workflow_name, run_started),
+                workflow_timings
+            )
+
+    def _create_workflow_report(
+        self,
+        workflow_graph: DAG,
+        workflow_started: float,
+        workflow_timings: Dict[str, StepTiming]
+    ) -> Dict[str, Any]:
+
+        executions = {
+            step_name: timing.execution for step_name, timing in workflow_timings.items()
+        }
+
+        critical_path, critical_path_time = workflow_graph.critical_path(executions)
+        step_slack = workflow_graph.slack(executions)
+        critical_steps = set(critical_path)
+
+        steps: Dict[str, Dict[str, Any]] = {}
+        for step_name, timing in sorted(
+            workflow_timings.items(),
+            key=lambda step_timing: step_timing[1].started
+        ):
+
+            # A step is ready once its last dependency completes, so any
+            # time between then and its start was spent waiting.
+            ready = max([
+                workflow_timings[dependency].completed for dependency in workflow_graph.predecessors(step_name) if dependency in workflow_timings
+            ], default=workflow_started)
+
+            steps[step_name] = {
+                'start': timing.started - self.run_started,
+                'end': timing.completed - self.run_started,
+                'queue_wait': max(timing.started - ready, 0),
+                'execution': timing.execution,
+                'slack': step_slack.get(step_name, 0),
+                'critical': step_name in critical_steps,
+            }
+
+        workflow_completed = max([
+            timing.completed for timing in workflow_timings.values()
+        ], default=workflow_started)
+
+        return {
+            'elapsed': workflow_completed - workflow_started,
+            'critical_path': critical_path,
+            'critical_path_time': critical_path_time,
+            'steps': steps,
+        }
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'graph': self.graph_name,
+            'elapsed': self.run_completed - self.run_started,
+            'workflows': self.workflows,
+            'executors': self.executors,
+        }
+
+    def to_text(self) -> str:
+
+        lines: List[str] = [
+            f'Run report - {self.graph_name} - {round(self.run_completed - self.run_started, 3)}s'
+        ]
+
+        for workflow_name, workflow_report in self.workflows.items():
+            critical_path = ' -> '.join(workflow_report.get('critical_path'))
+            steps: Dict[str, Dict[str, Any]] = workflow_report.get('steps')
+
+            step_width = max([
+                len(step_name) for step_name in steps
+            ], default=4)
+
+            step_width = max(step_width, 4) + 2
+
+            lines.extend([
+                '',
+                f"Workflow - {workflow_name} - {round(workflow_report.get('elapsed'), 3)}s",
+                f"Critical path - {critical_path} - {round(workflow_report.get('critical_path_time'), 3)}s",
+                '',
+                f"  {'step'.ljust(step_width)}{'start':>10}{'end':>10}{'wait':>10}{'exec':>10}{'slack':>10}",
+            ])
+
+            for step_name, step in steps.items():
+                critical_marker = '*' if step.get('critical') else ' '
+                timings = ''.join([
+                    f"{step.get(timing_name):>10.3f}" for timing_name in (
+                        'start',
+                        'end',
+                        'queue_wait',
+                        'execution',
+                        'slack',
+                    )
+                ])
+
+                lines.append(
+                    f'{critical_marker} {step_name.ljust(step_width)}{timings}'
+                )
+
+        if self.executors:
+            executor_width = max([
+                len(executor_name) for executor_name in self.executors
+            ]) + 2
+
+            lines.extend([
+                '',
+                'Executors',
+                '',
+                f"  {'pool'.ljust(executor_width)}{'workers':>10}{'peak':>10}{'calls':>10}{'queued':>10}{'wait':>10}{'run':>10}{'util':>10}",
+            ])
+
+            for executor_name, metrics in self.executors.items():
+                lines.append(
+                    f"  {executor_name.ljust(executor_width)}{metrics.get('workers'):>10}{metrics.get('peak_workers'):>10}{metrics.get('submitted'):>10}{metrics.get('peak_queued'):>10}{metrics.get('average_wait'):>10.4f}{metrics.get('average_run'):>10.4f}{metrics.get('utilization'):>10.1%}"
+                )
+
+        return '\n'.join(lines)
+
+    def save(self, report_path: str):
+
+        report_directory = os.path.dirname(report_path)
+        if report_directory:
+            os.makedirs(report_directory, exist_ok=True)
+
+        with open(report_path, 'w') as report_file:
+            json.dump(self.to_dict(), report_file, indent=4)
@@ -0,0 +1,13 @@
+class StepTiming:
+
+    def __init__(
+        self,
+        started: float,
+        completed: float
+    ) -> None:
+        self.started = started
+        self.completed = completed
+
+    @property
+    def execution(self) -> float:
+        return self.completed - self.started
@@ -0,0 +1,6 @@
+from enum import Enum
+
+
+class SchedulerMode(Enum):
+    GENERATIONS='generations'
+    EAGER='eager'
@@ -0,0 +1,3 @@
+from .step_stream import StepStream
+from .step_stream_end import StepStreamEnd
+from .step_stream_reader import StepStreamReader
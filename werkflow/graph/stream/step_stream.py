@@ -0,0 +1,48 @@
+import asyncio
+from typing import Any, Dict, List
+
+from .step_stream_end import StepStreamEnd
+from .step_stream_reader import StepStreamReader
+
+
+class StepStream:
+
+    def __init__(
+        self,
+        step_name: str,
+        consumers: List[str],
+        buffer_size: int
+    ) -> None:
+        self.step_name = step_name
+        self.published = 0
+
+        # Each consumer reads from its own bounded queue, so the
+        # producer runs at most a buffer ahead of the slowest one.
+        self._queues: Dict[str, asyncio.Queue] = {
+            consumer: asyncio.Queue(maxsize=buffer_size) for consumer in consumers
+        }
+
+    def reader(self, consumer: str) -> StepStreamReader:
+        return StepStreamReader(
+            self.step_name,
+            self._queues[consumer]
+        )
+
+    async def publish(self, item: Any):
+        for queue in list(self._queues.values()):
+            await queue.put(item)
+
+        self.published += 1
+
+    async def close(self, error: Exception | None=None):
+        end = StepStreamEnd(error)
+
+        for queue in list(self._queues.values()):
+            await queue.put(end)
+
+    def detach(self, consumer: str):
+        queue = self._queues.pop(consumer, None)
+
+        # Draining wakes a producer blocked on this consumer's queue.
+        while queue is not None and not queue.empty():
+            queue.get_nowait()
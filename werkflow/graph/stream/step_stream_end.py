@@ -0,0 +1,4 @@
+class StepStreamEnd:
+
+    def __init__(self, error: Exception | None=None) -> None:
+        self.error = error
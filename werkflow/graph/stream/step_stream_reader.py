@@ -0,0 +1,33 @@
+import asyncio
+from typing import Any
+
+from .step_stream_end import StepStreamEnd
+
+
+class StepStreamReader:
+
+    def __init__(
+        self,
+        step_name: str,
+        queue: asyncio.Queue
+    ) -> None:
+        self.step_name = step_name
+        self._queue = queue
+        self._end: StepStreamEnd | None = None
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self) -> Any:
+        if self._end is None:
+            item = await self._queue.get()
+
+            if not isinstance(item, StepStreamEnd):
+                return item
+
+            self._end = item
+
+        if self._end.error:
+            raise self._end.error
+
+        raise StopAsyncIteration
@@ -1,21 +1,43 @@
 import asyncio
+import contextvars
+import functools
 from collections import deque
-from typing import Any, Callable, Coroutine, Deque, Dict, List, Optional, Tuple, Union
+from concurrent.futures import Executor
+from typing import (
+    Any,
+    AsyncIterator,
+    Callable,
+    Coroutine,
+    Deque,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+)
 
 from werkflow.logging import WerkflowLogger
+from werkflow.tools.executors import ExecutorType, executors
 
 from .exceptions import StepTimeoutError
 
 
 class Workflow:
     priority=1
+    defer_concurrency: int | None=None
 
     def __init__(self) -> None: 
 
-        self.pending: Deque[asyncio.Task] = deque()
+        self.pending: Set[asyncio.Task] = set()
+        self._deferred: Deque[Tuple[Callable[[], Coroutine[None, None, Any]], float, bool]] = deque()
+        self._deferred_running = 0
+        self._deferred_completed: asyncio.Queue[asyncio.Task] | None = None
         self.logger = WerkflowLogger()
         self.logger.initialize()
         self.werkflow_config: Dict[str, Any] = {}
+        self._process_pool: Executor | None = None
 
     def get_project_option(
         self,
@@ -30,10 +52,41 @@ class Workflow:
         *args: Tuple[Any, ...],
         **kwargs: Dict[str, Any]
     ):
-        return await asyncio.to_thread(
-            call,
-            *args,
-            **kwargs
+        loop = asyncio.get_running_loop()
+        context = contextvars.copy_context()
+
+        return await loop.run_in_executor(
+            executors.get(ExecutorType.BLOCKING),
+            functools.partial(
+                context.run,
+                call,
+                *args,
+                **kwargs
+            )
+        )
+
+    async def in_process(
+        self,
+        call: Callable[..., Any],
+        *args: Tuple[Any, ...],
+        **kwargs: Dict[str, Any]
+    ):
+        if self._process_pool is None:
+            from concurrent.futures import ProcessPoolExecutor
+
+            self._process_pool = ProcessPoolExecutor(
+                max_workers=self.werkflow_config.get('max_process_workers')
+            )
+
+        loop = asyncio.get_running_loop()
+
+        return await loop.run_in_executor(
+            self._process_pool,
+            functools.partial(
+                call,
+                *args,
+                **kwargs
+            )
         )
 
     async def sequence(
@@ -66,13 +119,28 @@ class Workflow:
         ],
         timeout: Optional[
             Union[int, float]
-        ]=None
+        ]=None,
+        concurrency: Optional[int]=None
     ) -> List[Any]:
 
-        completed_jobs: List[Any] = await asyncio.wait_for(
-            asyncio.gather(*jobs),
-            timeout=timeout
-        )
+        if concurrency is not None and concurrency < 1:
+            self._close_jobs(jobs)
+            self._raise_invalid_concurrency('concurrency', concurrency)
+
+        if concurrency is None:
+            completed_jobs: List[Any] = await asyncio.wait_for(
+                asyncio.gather(*jobs),
+                timeout=timeout
+            )
+
+        else:
+            completed_jobs: List[Any] = await asyncio.wait_for(
+                self._gather_bounded(
+                    jobs,
+                    concurrency
+                ),
+                timeout=timeout
+            )
 
         results = []
 
@@ -86,15 +154,95 @@ class Workflow:
         
         return results
 
+    async def as_completed(
+        self,
+        *jobs: Tuple[
+            Coroutine[
+                None,
+                None,
+                Any
+            ]
+        ],
+        timeout: Optional[
+            Union[int, float]
+        ]=None,
+        concurrency: Optional[int]=None
+    ) -> AsyncIterator[Any]:
+
+        if concurrency is not None and concurrency < 1:
+            self._close_jobs(jobs)
+            self._raise_invalid_concurrency('concurrency', concurrency)
+
+        loop = asyncio.get_running_loop()
+        deadline = None if timeout is None else loop.time() + timeout
+
+        remaining = iter(jobs)
+        running: Set[asyncio.Task] = set()
+        completed: asyncio.Queue[asyncio.Task] = asyncio.Queue()
+
+        def start_next():
+            job = next(remaining, None)
+            if job is None:
+                return
+
+            task = asyncio.create_task(job)
+            task.add_done_callback(completed.put_nowait)
+            running.add(task)
+
+        for _ in range(len(jobs) if concurrency is None else concurrency):
+            start_next()
+
+        try:
+            while len(running) > 0:
+                task = await self._next_completed(
+                    completed,
+                    deadline
+                )
+
+                running.discard(task)
+                start_next()
+
+                yield task.result()
+
+        finally:
+            self._close_jobs(remaining)
+
+            for task in running:
+                task.cancel()
+
+            if len(running) > 0:
+                await asyncio.gather(*running, return_exceptions=True)
+
     async def finalize(
         self,
         timeout: float=None
     ) -> List[Any]:
-        results = []
-        for result in asyncio.as_completed(self.pending, timeout=timeout):
-            results.append(await result)
+        return [
+            result async for result in self.iter_deferred(timeout=timeout)
+        ]
 
-        return results
+    async def iter_deferred(
+        self,
+        timeout: float=None
+    ) -> AsyncIterator[Any]:
+
+        loop = asyncio.get_running_loop()
+        deadline = None if timeout is None else loop.time() + timeout
+
+        if self._deferred_completed is None:
+            self._deferred_completed = asyncio.Queue()
+
+        while len(self.pending) > 0 or len(self._deferred) > 0:
+            task = await self._next_completed(
+                self._deferred_completed,
+                deadline
+            )
+
+            # Results are released as they are consumed rather than
+            # held until every deferred call finishes.
+            self.pending.discard(task)
+
+            yield task.result()
 
     def defer(
         self,
@@ -105,16 +253,120 @@ class Workflow:
         **kwargs: Dict[str, Any],
 
     ) -> None:
-        self.pending.append(
-            asyncio.create_task(
+        if self.defer_concurrency is not None and self.defer_concurrency < 1:
+            self._raise_invalid_concurrency('defer_concurrency', self.defer_concurrency)
+
+        self._deferred.append((
+            functools.partial(
+                call,
+                *args,
+                **kwargs
+            ),
+            timeout,
+            fail_on_timeout
+        ))
+
+        self._start_deferred()
+
+    def _start_deferred(self):
+
+        if self._deferred_completed is None:
+            self._deferred_completed = asyncio.Queue()
+
+        # Calls beyond defer_concurrency wait as plain callables, so
+        # queued work costs no task or coroutine until it can run.
+        while len(self._deferred) > 0 and (
+            self.defer_concurrency is None or self._deferred_running < self.defer_concurrency
+        ):
+            job, timeout, fail_on_timeout = self._deferred.popleft()
+
+            task = asyncio.create_task(
                 self.wait(
-                    call(*args, **kwargs),
+                    job(),
                     timeout=timeout,
                     fail_on_timeout=fail_on_timeout
                 )
             )
+
+            task.add_done_callback(self._complete_deferred)
+
+            self._deferred_running += 1
+            self.pending.add(task)
+
+    def _complete_deferred(self, task: asyncio.Task):
+        self._deferred_running -= 1
+        self._deferred_completed.put_nowait(task)
+
+        self._start_deferred()
+
+    async def _gather_bounded(
+        self,
+        jobs: Tuple[Coroutine[None, None, Any], ...],
+        concurrency: int
+    ) -> List[Any]:
+
+        results: List[Any] = [None] * len(jobs)
+        remaining = iter(enumerate(jobs))
+
+        async def run_jobs():
+            for index, job in remaining:
+                results[index] = await job
+
+        runners = [
+            asyncio.create_task(
+                run_jobs()
+            ) for _ in range(min(concurrency, len(jobs)))
+        ]
+
+        try:
+            await asyncio.gather(*runners)
+
+        finally:
+            self._close_jobs(job for _, job in remaining)
+
+            for runner in runners:
+                runner.cancel()
+
+            await asyncio.gather(*runners, return_exceptions=True)
+
+        return results
+
+    async def _next_completed(
+        self,
+        completed: asyncio.Queue[asyncio.Task],
+        deadline: float | None
+    ) -> asyncio.Task:
+
+        if deadline is None:
+            return await completed.get()
+
+        loop = asyncio.get_running_loop()
+
+        return await asyncio.wait_for(
+            completed.get(),
+            timeout=max(deadline - loop.time(), 0)
         )
-    
+
+    def _raise_invalid_concurrency(
+        self,
+        setting_name: str,
+        concurrency: int
+    ):
+        # Zero runners would never await the jobs, so a limit below one
+        # is rejected rather than treated as unlimited or as no work.
+        raise ValueError(
+            f'Workflow - {self.__class__.__name__} - {setting_name} must be at least 1, got {concurrency}'
+        )
+
+    def _close_jobs(
+        self,
+        jobs: Iterator[Coroutine[None, None, Any]]
+    ):
+        # Jobs that never started are closed so they are not reported
+        # as never awaited.
+        for job in jobs:
+            job.close()
+
     async def wait(
         self,
         call: Callable[..., Coroutine[None, None, Any]],
@@ -137,7 +389,21 @@ class Workflow:
             return error
 
     async def close(self):
-        pass
+        if self._process_pool:
+            loop = asyncio.get_running_loop()
+            await loop.run_in_executor(
+                executors.get(ExecutorType.BLOCKING),
+                functools.partial(
+                    self._process_pool.shutdown,
+                    cancel_futures=True
+                )
+            )
+
+            self._process_pool = None
 
     def abort(self):
-        pass
\ No newline at end of file
+        if self._process_pool:
+            self._process_pool.shutdown(
+                wait=False,
+                cancel_futures=True
+            )
\ No newline at end of file
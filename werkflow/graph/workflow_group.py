@@ -1,11 +1,14 @@
 import inspect
 from collections import OrderedDict
 from typing import List, Type, Dict
+from .group_concurrency import GroupConcurrency
 from .workflow import Workflow
 
 
 class WorkflowGroup:
     workflows: List[Type[Workflow]]=[]
+    concurrency: GroupConcurrency | None=None
+    max_concurrent_workflows: int | None=None
 
     def __init__(self) -> None:
         self.group_workflows: Dict[str, Workflow] = OrderedDict()
@@ -1,12 +1,28 @@
+import asyncio
 import inspect
 import uuid
-from typing import Any, Callable, Dict, List, Tuple
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, List, Literal, Mapping, Tuple
 
 from werkflow.prompt.types.base.base_prompt import BasePrompt
 
+from .hook_binding import HookBinding
 from .hook_types import HookType
 
 
+def call_in_process(
+    call: Callable[..., Any],
+    hook_args: Dict[str, Any]
+):
+    # Workflow instances hold loggers and loop-bound state that cannot
+    # be pickled, so process steps run unbound.
+    result = call(None, **hook_args)
+
+    if inspect.isawaitable(result):
+        return asyncio.run(result)
+
+    return result
+
+
 class BaseHook:
 
     def __init__(
@@ -21,12 +37,15 @@ class BaseHook:
         condition: Callable[
             [Dict[str, Any]],
             bool
-        ]=None
+        ]=None,
+        executor: Literal['loop', 'process']='loop',
+        cache: bool=True,
     ) -> None:
         self.id = str(uuid.uuid4())
         self.name = name
         self.shortname = shortname
         self._call = call
+        self._func = call
         self.names: List[str] = list(names)
         self.args = inspect.signature(call)
         self.params = self.args.parameters
@@ -36,25 +55,31 @@ class BaseHook:
         self.workflow: str = None
         self.prompts = prompts
         self.condition = condition
+        self.executor = executor
+        self.cache = cache
+        self.is_stream = inspect.isasyncgenfunction(call)
+        self.binding: HookBinding | None = None
+        self.dispatcher: Callable[
+            [BaseHook, Dict[str, Any]],
+            Awaitable[Any]
+        ] | None = None
 
     async def call(
         self, 
+        context: Mapping[str, Any],
         return_on_failure: bool = True,
-        **kwargs
     ):
 
-        hook_args = {
-            name: value for name, value in kwargs.items() if name in self.params
-        }
+        hook_args = self.bind(context)
 
         result = {}
         
         try:
-            if self.condition and self.condition(kwargs):
-                result: Any | Exception = await self._call(**hook_args)
+            if self.condition and self.condition(context):
+                result: Any | Exception = await self._invoke(hook_args)
 
             elif self.condition is None:
-                result: Any | Exception = await self._call(**hook_args)
+                result: Any | Exception = await self._invoke(hook_args)
 
         except Exception as execution_error:
             
@@ -67,13 +92,36 @@ class BaseHook:
             return result
 
         elif isinstance(result, dict):
-            return {
-                **kwargs,
-                **result
-            }
-        
+            return result
+
         return {
-            **kwargs,
             self.shortname: result
         }
 
+    def open_stream(self, context: Mapping[str, Any]) -> AsyncIterator[Any] | None:
+        if self.condition and not self.condition(context):
+            return None
+
+        return self._call(
+            **self.bind(context)
+        )
+
+    def compile_binding(self):
+        self.binding = HookBinding(self._func)
+
+    def bind(self, context: Mapping[str, Any]) -> Dict[str, Any]:
+        return self.binding.bind(context)
+
+    async def _invoke(self, hook_args: Dict[str, Any]):
+        if self.dispatcher:
+            return await self.dispatcher(self, hook_args)
+
+        elif self.executor == 'process':
+            workflow = self._call.__self__
+            return await workflow.in_process(
+                call_in_process,
+                self._func,
+                hook_args
+            )
+
+        return await self._call(**hook_args)
@@ -0,0 +1,63 @@
+import inspect
+from typing import Any, Callable, Dict, List, Mapping, Set, Tuple
+
+
+class HookBinding:
+
+    def __init__(self, call: Callable[..., Any]) -> None:
+
+        parameters = list(inspect.signature(call).parameters.values())
+
+        # The first parameter is the workflow instance the step is
+        # bound to, so it is never looked up in the run context.
+        self.instance_name: str | None = None
+        if len(parameters) > 0 and parameters[0].kind in (
+            inspect.Parameter.POSITIONAL_ONLY,
+            inspect.Parameter.POSITIONAL_OR_KEYWORD
+        ):
+            self.instance_name = parameters[0].name
+            parameters = parameters[1:]
+
+        names: List[str] = []
+        required: List[str] = []
+        self.defaults: Dict[str, Any] = {}
+        self.var_keyword = False
+
+        for parameter in parameters:
+
+            if parameter.kind == inspect.Parameter.VAR_KEYWORD:
+                self.var_keyword = True
+                continue
+
+            elif parameter.kind not in (
+                inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                inspect.Parameter.KEYWORD_ONLY
+            ):
+                continue
+
+            names.append(parameter.name)
+
+            if parameter.default is inspect.Parameter.empty:
+                required.append(parameter.name)
+
+            else:
+                self.defaults[parameter.name] = parameter.default
+
+        self.names: Tuple[str, ...] = tuple(names)
+        self.required: Tuple[str, ...] = tuple(required)
+
+    def bind(self, context: Mapping[str, Any]) -> Dict[str, Any]:
+
+        if self.var_keyword:
+            return {
+                name: value for name, value in context.items() if name != self.instance_name
+            }
+
+        return {
+            name: context[name] for name in self.names if name in context
+        }
+
+    def find_missing(self, available: Set[str]) -> List[str]:
+        return [
+            name for name in self.required if name not in available
+        ]
@@ -0,0 +1,135 @@
+import ast
+import inspect
+import linecache
+from typing import Dict, Iterator, List, Set
+
+from .base_hook import BaseHook
+
+
+FunctionDefinition = ast.FunctionDef | ast.AsyncFunctionDef
+
+
+def find_hook_outputs(
+    hook: BaseHook,
+    source_definitions: Dict[str, Dict[int, FunctionDefinition]] | None=None
+) -> List[str] | None:
+
+    # Returns the context keys a hook can produce, or None when they
+    # cannot be determined from its return statements.
+    if hook.is_stream:
+        return [hook.shortname]
+
+    if source_definitions is None:
+        source_definitions = {}
+
+    hook_definition = _find_definition(hook, source_definitions)
+    if hook_definition is None:
+        return None
+
+    outputs: Set[str] = set()
+
+    for return_node in _find_returns(hook_definition):
+        return_value = return_node.value
+
+        if return_value is None or (
+            isinstance(return_value, ast.Constant) and return_value.value is None
+        ):
+            continue
+
+        elif isinstance(return_value, ast.Dict):
+            for key in return_value.keys:
+                if not isinstance(key, ast.Constant) or not isinstance(key.value, str):
+                    return None
+
+                outputs.add(key.value)
+
+        elif isinstance(return_value, (
+            ast.Constant,
+            ast.List,
+            ast.Tuple,
+            ast.Set,
+            ast.JoinedStr,
+            ast.ListComp,
+            ast.SetComp,
+            ast.GeneratorExp
+        )):
+            outputs.add(hook.shortname)
+
+        else:
+            return None
+
+    return sorted(outputs)
+
+
+def _find_definition(
+    hook: BaseHook,
+    source_definitions: Dict[str, Dict[int, FunctionDefinition]]
+) -> FunctionDefinition | None:
+
+    try:
+        source_file = inspect.getsourcefile(hook._func)
+        first_line = hook._func.__code__.co_firstlineno
+
+    except (AttributeError, TypeError):
+        return None
+
+    if source_file is None:
+        return None
+
+    # Parsing each workflow file once keeps setup linear in the number
+    # of steps, where inspect.getsource rescans the file per function.
+    definitions = source_definitions.get(source_file)
+    if definitions is None:
+        definitions = {}
+
+        try:
+            source_tree = ast.parse(
+                ''.join(linecache.getlines(source_file))
+            )
+
+        except SyntaxError:
+            source_tree = ast.Module(body=[], type_ignores=[])
+
+        _collect_definitions(source_tree.body, definitions)
+        source_definitions[source_file] = definitions
+
+    return definitions.get(first_line)
+
+
+def _collect_definitions(
+    nodes: List[ast.stmt],
+    definitions: Dict[int, FunctionDefinition]
+):
+
+    # Steps are methods, so only module and class bodies are searched.
+    for node in nodes:
+        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+            definition_line = min([
+                node.lineno,
+                *[decorator.lineno for decorator in node.decorator_list]
+            ])
+
+            definitions[definition_line] = node
+
+        elif isinstance(node, ast.ClassDef):
+            _collect_definitions(node.body, definitions)
+
+
+def _find_returns(node: ast.AST) -> Iterator[ast.Return]:
+
+    for child in ast.iter_child_nodes(node):
+        if isinstance(child, ast.Return):
+            yield child
+
+        # Returns inside nested functions or classes belong to those
+        # scopes, not the hook.
+        elif isinstance(child, (
+            ast.FunctionDef,
+            ast.AsyncFunctionDef,
+            ast.ClassDef,
+            ast.Lambda
+        )):
+            continue
+
+        else:
+            yield from _find_returns(child)
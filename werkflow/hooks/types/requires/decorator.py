@@ -1,9 +1,9 @@
 from werkflow_core import Module
 from typing import Tuple, Type
-from .validator import RequiresValidator
 
 
 def requires(*modules: Tuple[Type[Module], ...]):
+    from .validator import RequiresValidator
 
     RequiresValidator(
         modules=modules
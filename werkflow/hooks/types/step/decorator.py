@@ -5,8 +5,6 @@ from werkflow.hooks.types.base.hook_types import HookType
 from werkflow.hooks.types.base.registrar import registrar
 from werkflow.prompt.types.base.base_prompt import BasePrompt
 
-from .validator import StepHookCheckpoint, StepHookValidator
-
 
 @registrar(HookType.STEP)
 def step(
@@ -27,20 +25,18 @@ def step(
             'save',
         ],
     ] | None = None,
+    executor: Literal['loop', 'process']='loop',
+    cache: bool=True,
+    inputs: List[str]=[],
+    outputs: List[str]=[],
+    timeout: float | None=None,
+    retries: int=0,
+    backoff: float=1,
+    map_over: str | None=None,
+    map_chunk_size: int=1,
+    map_concurrency: int | None=None,
+    stream_buffer: int=64,
 ):
-    
-    validated_checkpoint: StepHookCheckpoint | None = None
-    if validated_checkpoint:
-        validated_checkpoint = StepHookCheckpoint(**checkpoint)
-
-    StepHookValidator(
-        names=names,
-        prompts=prompts,
-        skip_on_fail=skip_on_fail,
-        condition=condition,
-        checkpoint=validated_checkpoint,
-    )
-
     def wrapper(func):
 
         @functools.wraps(func)
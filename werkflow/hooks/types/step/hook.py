@@ -1,4 +1,10 @@
+import asyncio
+import functools
+import json
+import os
+import pickle
 from typing import (
+    TYPE_CHECKING,
     Any,
     Callable,
     Dict,
@@ -10,6 +16,15 @@ from typing import (
 from werkflow.hooks.types.base.base_hook import BaseHook
 from werkflow.hooks.types.base.hook_types import HookType
 from werkflow.prompt.types.base.base_prompt import BasePrompt
+from werkflow.tools.executors import ExecutorType, executors
+from werkflow.tools.filesystem import open
+
+if TYPE_CHECKING:
+    from .validator import (
+        StepHookCheckpoint,
+        StepHookMapPolicy,
+        StepHookRetryPolicy,
+    )
 
 
 class StepHook(BaseHook):
@@ -36,6 +51,17 @@ class StepHook(BaseHook):
                     'save',
                 ],
             ] | None = None,
+            executor: Literal['loop', 'process']='loop',
+            cache: bool=True,
+            inputs: List[str]=[],
+            outputs: List[str]=[],
+            timeout: float | None=None,
+            retries: int=0,
+            backoff: float=1,
+            map_over: str | None=None,
+            map_chunk_size: int=1,
+            map_concurrency: int | None=None,
+            stream_buffer: int=64,
         ) -> None:
 
         super().__init__(
@@ -47,6 +73,110 @@ class StepHook(BaseHook):
             prompts=prompts,
             skip_on_fail=skip_on_fail,
             condition=condition,
+            executor=executor,
+            cache=cache,
+        )
+
+        self.inputs = list(inputs)
+        self.outputs = list(outputs)
+        self.stream_buffer = stream_buffer
+
+        # The validators pull in pydantic, so they are imported once a
+        # step is defined rather than when the package is.
+        from . import validator
+
+        self.checkpoint: StepHookCheckpoint | None = None
+        if checkpoint:
+            self.checkpoint = validator.StepHookCheckpoint(**checkpoint)
+
+        self.retry_policy: StepHookRetryPolicy | None = None
+        if timeout is not None or retries != 0 or backoff != 1:
+            self.retry_policy = validator.StepHookRetryPolicy(
+                timeout=timeout,
+                retries=retries,
+                backoff=backoff
+            )
+
+        self.map_policy: StepHookMapPolicy | None = None
+        if map_over:
+            self.map_policy = validator.StepHookMapPolicy(
+                map_over=map_over,
+                chunk_size=map_chunk_size,
+                concurrency=map_concurrency
+            )
+
+        validator.StepHookValidator(
+            names=names,
+            prompts=prompts,
+            skip_on_fail=skip_on_fail,
+            condition=condition,
+            checkpoint=self.checkpoint,
+            executor=executor,
+            cache=cache,
+            inputs=inputs,
+            outputs=outputs,
+            retry_policy=self.retry_policy or validator.StepHookRetryPolicy(),
+            map_policy=self.map_policy,
+            stream_buffer=stream_buffer,
+        )
+
+    async def load_checkpoint(self) -> Dict[str, Any] | None:
+
+        if self.checkpoint is None or self.checkpoint.action != 'load':
+            return None
+
+        loop = asyncio.get_running_loop()
+        checkpoint_exists = await loop.run_in_executor(
+            executors.get(ExecutorType.FILE_IO),
+            os.path.exists,
+            self.checkpoint.path
+        )
+
+        if checkpoint_exists is False:
+            return None
+
+        if self.checkpoint.serializer == 'bytes':
+            checkpoint_file = await open(self.checkpoint.path, 'rb')
+            checkpoint_data = await checkpoint_file.read()
+            await checkpoint_file.close()
+
+            return pickle.loads(checkpoint_data)
+
+        checkpoint_file = await open(self.checkpoint.path, 'r')
+        checkpoint_data = await checkpoint_file.read()
+        await checkpoint_file.close()
+
+        return json.loads(checkpoint_data)
+
+    async def save_checkpoint(self, result: Dict[str, Any]):
+
+        if self.checkpoint is None:
+            return
+
+        checkpoint_directory = os.path.dirname(
+            os.path.abspath(self.checkpoint.path)
         )
 
-        self.checkpoint = checkpoint
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(
+            executors.get(ExecutorType.FILE_IO),
+            functools.partial(
+                os.makedirs,
+                checkpoint_directory,
+                exist_ok=True
+            )
+        )
+
+        if self.checkpoint.serializer == 'bytes':
+            checkpoint_file = await open(self.checkpoint.path, 'wb')
+            await checkpoint_file.write(
+                pickle.dumps(result)
+            )
+
+        else:
+            checkpoint_file = await open(self.checkpoint.path, 'w')
+            await checkpoint_file.write(
+                json.dumps(result)
+            )
+
+        await checkpoint_file.close()
@@ -8,7 +8,7 @@ from typing import (
     Tuple,
 )
 
-from pydantic import BaseModel, StrictBool, StrictStr
+from pydantic import BaseModel, StrictBool, StrictStr, confloat, conint
 
 from werkflow.prompt.types.base.base_prompt import BasePrompt
 
@@ -18,6 +18,16 @@ class StepHookCheckpoint(BaseModel):
     action: Literal['load', 'save']
     path: StrictStr
 
+class StepHookRetryPolicy(BaseModel):
+    timeout: Optional[confloat(gt=0)] = None
+    retries: conint(ge=0) = 0
+    backoff: confloat(ge=0) = 1
+
+class StepHookMapPolicy(BaseModel):
+    map_over: StrictStr
+    chunk_size: conint(ge=1) = 1
+    concurrency: Optional[conint(ge=1)] = None
+
 class StepHookValidator(BaseModel):
     names: Tuple[StrictStr, ...]
     prompts: List[BasePrompt]=[]
@@ -29,6 +39,13 @@ class StepHookValidator(BaseModel):
         ]
     ]=None
     checkpoint: StepHookCheckpoint | None = None
+    executor: Literal['loop', 'process'] = 'loop'
+    cache: StrictBool = True
+    inputs: List[StrictStr] = []
+    outputs: List[StrictStr] = []
+    retry_policy: StepHookRetryPolicy
+    map_policy: Optional[StepHookMapPolicy] = None
+    stream_buffer: conint(ge=1) = 64
 
     class Config:
         arbitrary_types_allowed=True
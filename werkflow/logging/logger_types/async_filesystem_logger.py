@@ -5,6 +5,7 @@ from typing import Dict
 from pathlib import Path
 from aiologger.levels import LogLevel
 from aiologger.formatters.base import Formatter
+from werkflow.tools.executors import ExecutorType, executors
 from werkflow.tools.filesystem import open
 from .handlers.async_file_handler import AsyncTimedRotatingFileHandler, RolloverInterval
 from .logger_types import LoggerTypes
@@ -85,13 +86,17 @@ class AsyncFilesystemLogger:
 
         loop = asyncio.get_event_loop()
         path_exists = await loop.run_in_executor(
-            None,
+            executors.get(ExecutorType.LOGGING),
             os.path.exists,
             filepath
         )
         
         if path_exists is False:
-            logfile = await open(filepath, 'w')
+            logfile = await open(
+                filepath,
+                'w',
+                executor=executors.get(ExecutorType.LOGGING)
+            )
             await logfile.close()
 
             self.update_files(filepath)
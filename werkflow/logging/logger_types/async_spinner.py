@@ -14,6 +14,7 @@ from yaspin.spinners import Spinners
 from aiologger.levels import LogLevel
 from aiologger.formatters.base import Formatter
 from werkflow.logging.spinner import ProgressText
+from werkflow.tools.terminal import terminal_io
 from yaspin.core import to_unicode
 from .async_logger import AsyncLogger
 from .logger_types import LoggerTypes
@@ -109,10 +110,15 @@ class AsyncSpinner(Yaspin):
     def append_message(self, message: str) -> Coroutine[None]:
         return self.display.append_cli_message(message)
 
+    def push_message(self, message: str) -> None:
+        self.display.publish(message)
+
     def set_default_message(self, message: str) -> Coroutine[None]:
         return self.display.clear_and_replace(message)
 
     def set_message_at(self, message_index: int, message:str) -> None:
+        self.display.consume()
+
         if message_index < len(self.display.cli_messages):
             self.display.cli_messages[message_index] = message
 
@@ -290,7 +296,16 @@ class AsyncSpinner(Yaspin):
             self._start_time = time.time()
             self._stop_time = None  # Reset value to properly calculate subsequent spinner starts (if any)  # pylint: disable=line-too-long
             self._stop_spin = asyncio.Event()
-            self._hide_spin = asyncio.Event()
+
+            # Hiding outlives restarts so a spinner started while a
+            # prompt is open stays hidden until the prompt finishes.
+            if self._hide_spin is None:
+                self._hide_spin = asyncio.Event()
+
+            # The first frame renders as soon as the loop yields, so the
+            # display is reset before the render task starts.
+            self.display.start_cli_tasks()
+
             try:
                 self._spin_thread = asyncio.create_task(self._spin())
             finally:
@@ -298,8 +313,6 @@ class AsyncSpinner(Yaspin):
                 # getting it back
                 await self._show_cursor()
 
-            self.display.start_cli_tasks()
-
     async def stop(self):
         if self.enabled:
             self._stop_time = time.time()
@@ -320,30 +333,33 @@ class AsyncSpinner(Yaspin):
         """Hide the spinner to allow for custom writing to the terminal."""
         thr_is_alive = self._spin_thread and (self._spin_thread.done() is False and self._spin_thread.cancelled() is False)
 
-        if thr_is_alive and not self._hide_spin.is_set():
+        if self._hide_spin is None:
+            self._hide_spin = asyncio.Event()
+
+        if not self._hide_spin.is_set():
             
             # set the hidden spinner flag
             self._hide_spin.set()
-            await self._clear_line()
 
-            # flush the stdout buffer so the current line
-            # can be rewritten to
-            await self._loop.run_in_executor(
-                None,
-                sys.stdout.flush
-            )  
+            if thr_is_alive:
+                await self._clear_line()
+
+                # flush the stdout buffer so the current line
+                # can be rewritten to
+                await terminal_io.flush()
 
     async def show(self):
         """Show the hidden spinner."""
         thr_is_alive = self._spin_thread and (self._spin_thread.done() is False and self._spin_thread.cancelled() is False)
 
-        if thr_is_alive and self._hide_spin.is_set():
+        if self._hide_spin and self._hide_spin.is_set():
             
             # clear the hidden spinner flag
             self._hide_spin.clear()
 
             # clear the current line so the spinner is not appended to it
-            await self._clear_line()      
+            if thr_is_alive:
+                await self._clear_line()
 
     async def write(self, text):
         if self.logger_enabled:
@@ -361,11 +377,7 @@ class AsyncSpinner(Yaspin):
             # Ensure output is Unicode
             assert isinstance(_text, str)
 
-            await self._loop.run_in_executor(
-                None,
-                sys.stdout.write,
-                
-            )
+            await terminal_io.write(_text)
 
             self._cur_line_len = 0    
             self._stdout_lock.release()  
@@ -394,11 +406,7 @@ class AsyncSpinner(Yaspin):
         await self.stop()
         
 
-        await self._loop.run_in_executor(
-            None,
-            sys.stdout.write,
-            self._last_frame
-        )
+        await terminal_io.write(self._last_frame)
 
         self._cur_line_len = 0  
 
@@ -411,33 +419,20 @@ class AsyncSpinner(Yaspin):
                 continue
             
             await self._stdout_lock.acquire()
-            terminal_size = await self._loop.run_in_executor(
-                None,
-                get_terminal_size
-            )
-
-            terminal_width = terminal_size[0]
+            terminal_width = get_terminal_size()[0]
 
             # Compose output
+            self.display.consume()
             spin_phase = next(self._cycle)
             out = self._compose_out(spin_phase)
 
             if len(out) > terminal_width:
                 out = f'{out[:terminal_width-1]}...'
 
-            # Write
-               
-            await self._clear_line()
-            
-            await self._loop.run_in_executor(
-                None,
-                sys.stdout.write,
-                out
-            )
-
-            await self._loop.run_in_executor(
-                None,
-                sys.stdout.flush
+            # Frames are not awaited; the terminal writer batches
+            # them with any other pending output.
+            terminal_io.write_nowait(
+                f'{self._get_clear_sequence()}{out}'
             )
 
             self._cur_line_len = max(self._cur_line_len, len(out))
@@ -452,54 +447,29 @@ class AsyncSpinner(Yaspin):
             self._stdout_lock.release()
 
     async def _clear_line(self):
+        await terminal_io.write(
+            self._get_clear_sequence()
+        )
+
+    def _get_clear_sequence(self) -> str:
         if sys.stdout.isatty():
             # ANSI Control Sequence EL does not work in Jupyter
-            await self._loop.run_in_executor(
-                None,
-                sys.stdout.write,
-                "\r\033[K"
-            )
+            return "\r\033[K"
+
+        fill = " " * self._cur_line_len
+        return f"\r{fill}\r"
 
-        else:
-            fill = " " * self._cur_line_len
-            await self._loop.run_in_executor(
-                None,
-                sys.stdout.write,
-                sys.stdout.write,
-                f"\r{fill}\r"
-            )
-            
     @staticmethod
     async def _show_cursor():
-        loop = asyncio.get_event_loop()
         if sys.stdout.isatty():
             # ANSI Control Sequence DECTCEM 1 does not work in Jupyter
-            await loop.run_in_executor(
-                None,
-                sys.stdout.write,
-                "\033[?25h"
-            )
-
-            await loop.run_in_executor(
-                None,
-                sys.stdout.flush
-            )
+            await terminal_io.write("\033[?25h")
 
     @staticmethod
     async def _hide_cursor():
-        loop = asyncio.get_event_loop()
         if sys.stdout.isatty():
             # ANSI Control Sequence DECTCEM 1 does not work in Jupyter
-            await loop.run_in_executor(
-                None,
-                sys.stdout.write,
-                "\033[?25l"
-            )
-
-            await loop.run_in_executor(
-                None,
-                sys.stdout.flush
-            )
+            await terminal_io.write("\033[?25l")
 
     def _register_signal_handlers(self):
         # SIGKILL cannot be caught or ignored, and the receiving
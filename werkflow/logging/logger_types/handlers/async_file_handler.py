@@ -13,6 +13,7 @@ from typing import Callable, List, Optional
 from aiologger.handlers.base import Handler
 from aiologger.records import LogRecord
 from aiologger.utils import classproperty, get_running_loop
+from werkflow.tools.executors import ExecutorType, executors
 from werkflow.tools.filesystem import open
 from werkflow.tools.filesystem.text import AsyncTextIOWrapper
 
@@ -48,6 +49,7 @@ class AsyncFileHandler(Handler):
                     file=self.absolute_file_path,
                     mode=self.mode,
                     encoding=self.encoding,
+                    executor=executors.get(ExecutorType.LOGGING),
                 )
 
     async def flush(self):
@@ -151,9 +153,9 @@ class BaseAsyncRotatingFileHandler(AsyncFileHandler, metaclass=abc.ABCMeta):
         if self.rotator is None:
             # logging issue 18940: A file may not have been created if delay is True.
             loop = get_running_loop()
-            if await loop.run_in_executor(None, lambda: os.path.exists(source)):
+            if await loop.run_in_executor(executors.get(ExecutorType.LOGGING), lambda: os.path.exists(source)):
                 await loop.run_in_executor(  # type: ignore
-                    None, lambda: os.rename(source, dest)
+                    executors.get(ExecutorType.LOGGING), lambda: os.rename(source, dest)
                 )
         else:
             self.rotator(source, dest)
@@ -387,7 +389,7 @@ class AsyncTimedRotatingFileHandler(BaseAsyncRotatingFileHandler):
         dir_name, base_name = os.path.split(self.absolute_file_path)
         loop = get_running_loop()
         file_names = await loop.run_in_executor(
-            None, lambda: os.listdir(dir_name)
+            executors.get(ExecutorType.LOGGING), lambda: os.listdir(dir_name)
         )
         result = []
         prefix = base_name + "."
@@ -407,7 +409,7 @@ class AsyncTimedRotatingFileHandler(BaseAsyncRotatingFileHandler):
         loop = get_running_loop()
         for file_path in file_paths:
             await loop.run_in_executor(  # type: ignore
-                None, lambda: os.unlink(file_path)
+                executors.get(ExecutorType.LOGGING), lambda: os.unlink(file_path)
             )
 
     async def do_rollover(self):
@@ -443,10 +445,10 @@ class AsyncTimedRotatingFileHandler(BaseAsyncRotatingFileHandler):
         )
         loop = get_running_loop()
         if await loop.run_in_executor(
-            None, lambda: os.path.exists(destination_file_path)
+            executors.get(ExecutorType.LOGGING), lambda: os.path.exists(destination_file_path)
         ):
             await loop.run_in_executor(
-                None, lambda: os.unlink(destination_file_path)
+                executors.get(ExecutorType.LOGGING), lambda: os.unlink(destination_file_path)
             )
         await self.rotate(self.absolute_file_path, destination_file_path)
         if self.backup_count > 0:
@@ -1,5 +1,6 @@
-import asyncio
-from typing import List
+import time
+from collections import deque
+from typing import Deque, List
 from .timer import Timer
 
 
@@ -16,8 +17,11 @@ class ProgressText:
         self.cli_message = ''
         self.cli_messages = []
         self.next_cli_message = 0
-        self._cli_task = None
-        self._timer_task = None
+        self.message_interval = 2.5
+        self.timer_interval = 2
+        self._events: Deque[str] = deque()
+        self._rotation_started = time.monotonic()
+        self._timers_started = time.monotonic()
         self.enabled = True
         self.finalized = False
         self.group_finalized = False
@@ -35,73 +39,87 @@ class ProgressText:
 
         return f'> {self.cli_message} - {self.selected_timer.elapsed_message}'
 
+    def publish(self, message: str):
+        # Publishing never waits. The spinner picks messages up on its
+        # next frame, so progress updates cost steps nothing.
+        self._events.append(message)
+
     async def append_cli_message(self, text: str):
-        self.cli_message = text
-        self.cli_messages.append(text)
-        await asyncio.sleep(1)
+        self.publish(text)
 
-    def start_cli_tasks(self):
-        if self.enabled:
-            self.finalized = False
-            self.group_finalized = False
-            self._timer_task = asyncio.create_task(self._start_timer_tasks())
-            self._cli_task = asyncio.create_task(self._start_cli_tasks())
+    def consume(self):
 
-    async def _start_cli_tasks(self):
-        self.run_cli_task = True
+        now = time.monotonic()
 
-        while self.run_cli_task:
-            for cli_task in self.cli_messages:
+        while self._events:
+            self.cli_message = self._events.popleft()
+            self.cli_messages.append(self.cli_message)
 
-                if self.run_cli_task is False:
-                    return
+            # A new message shows for a full rotation before cycling.
+            self.next_cli_message = len(self.cli_messages) - 1
+            self._rotation_started = now
 
-                self.cli_message = cli_task
-                await asyncio.sleep(2.5)
+        if self.run_cli_task and len(self.cli_messages) > 0:
+            rotations = int((now - self._rotation_started)/self.message_interval)
+            self.cli_message = self.cli_messages[
+                (self.next_cli_message + rotations) % len(self.cli_messages)
+            ]
 
-    async def _start_timer_tasks(self):
-        self.run_timer_task = True
-        self.total_timer.update()
-        self.group_timer.update()
+        if self.run_timer_task:
+            timer_rotations = int((now - self._timers_started)/self.timer_interval)
 
-        while self.run_timer_task:
-            if self.selected_timer_name == self.total_timer.name:
-                self.selected_timer_name = self.group_timer.name
-                self.selected_timer = self.group_timer
+            if timer_rotations % 2 == 0:
+                self.selected_timer = self.total_timer
 
             else:
-                self.selected_timer_name = self.total_timer.name
-                self.selected_timer = self.total_timer
+                self.selected_timer = self.group_timer
 
-            await asyncio.sleep(2)
-            if self.run_timer_task is False:
-                return
+            self.selected_timer_name = self.selected_timer.name
 
+    def start_cli_tasks(self):
+        if self.enabled:
+            self.finalized = False
+            self.group_finalized = False
+
+            now = time.monotonic()
+            self._rotation_started = now
+            self._timers_started = now
+
+            self.total_timer.update()
+            self.group_timer.update()
+
+            self.run_cli_task = True
+            self.run_timer_task = True
 
     async def stop_cli_tasks(self):
         self.run_cli_task = False
         self.run_timer_task = False
 
-        if self._cli_task and self._timer_task:
-            await self._cli_task
-            await self._timer_task
+        # The final frame shows the latest message even if no frame
+        # rendered it yet.
+        if self._events:
+            self.cli_message = self._events[-1]
 
+        self._events.clear()
         self.cli_messages = []
+        self.next_cli_message = 0
 
     async def pause_cli_tasks(self):
         self.run_cli_task = False
-        if self._cli_task:
-            await self._cli_task
 
     async def clear_and_replace(self, message: str):
 
         await self.pause_cli_tasks()
+        self._events.clear()
         self.cli_message = message
         self.cli_messages = [message]
+        self.next_cli_message = 0
         self.start_cli_tasks()
 
     async def clear_and_replace_multiple(self, messages: List[str]):
         await self.pause_cli_tasks()
+        self._events.clear()
         self.cli_message = messages[0]
         self.cli_messages = messages
+        self.next_cli_message = 0
         self.start_cli_tasks()
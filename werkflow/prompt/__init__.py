@@ -1,6 +1,30 @@
-from .types.confirmation.confirmation_prompt import ConfirmationPrompt
-from .types.input.input_prompt import InputPrompt
-from .types.key_value.key_value_prompt import KeyValuePrompt
-from .types.option.option_prompt import OptionPrompt
-from .types.secure.secure_prompt import SecurePrompt
-from .types.repeat.repeat_prompt import RepeatPrompt
\ No newline at end of file
+from typing import TYPE_CHECKING
+
+from werkflow.tools.imports import lazy_exports
+
+if TYPE_CHECKING:
+    from .types.confirmation.confirmation_prompt import ConfirmationPrompt
+    from .types.input.input_prompt import InputPrompt
+    from .types.key_value.key_value_prompt import KeyValuePrompt
+    from .types.option.option_prompt import OptionPrompt
+    from .types.secure.secure_prompt import SecurePrompt
+    from .types.repeat.repeat_prompt import RepeatPrompt
+
+
+__all__ = [
+    'ConfirmationPrompt',
+    'InputPrompt',
+    'KeyValuePrompt',
+    'OptionPrompt',
+    'SecurePrompt',
+    'RepeatPrompt',
+]
+
+__getattr__, __dir__ = lazy_exports(__name__, {
+    'ConfirmationPrompt': '.types.confirmation.confirmation_prompt',
+    'InputPrompt': '.types.input.input_prompt',
+    'KeyValuePrompt': '.types.key_value.key_value_prompt',
+    'OptionPrompt': '.types.option.option_prompt',
+    'SecurePrompt': '.types.secure.secure_prompt',
+    'RepeatPrompt': '.types.repeat.repeat_prompt',
+})
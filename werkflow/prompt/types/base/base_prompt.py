@@ -1,11 +1,6 @@
-import asyncio
-import functools
-import click
-import os
-from concurrent.futures import ThreadPoolExecutor
 from termcolor import colored
 from typing import Optional, Any, Callable, Union
-from .base_prompt_validator import BasePromptValidator
+from werkflow.tools.terminal import terminal_io
 
 
 class BasePrompt:
@@ -19,11 +14,7 @@ class BasePrompt:
         condition: Optional[Callable[..., bool]] = None, 
         confirmation_message: Optional[Union[str, Callable[..., str]]] = None, 
     ) -> None:
-
-        self._loop: asyncio.AbstractEventLoop = None
-        self._executor = ThreadPoolExecutor(
-            max_workers=os.cpu_count()
-        )
+        from .base_prompt_validator import BasePromptValidator
 
         self.prompt_color = 'cyan'
         self.prompt_frame = colored('●', color=self.prompt_color)
@@ -57,13 +48,9 @@ class BasePrompt:
             else:
                 confirmation_text = self.confirmation_message(response)
 
-            await self._loop.run_in_executor(
-                self._executor,
-                functools.partial(
-                    click.echo,
-                    f'{self.confirmation_frame} {confirmation_text}',
-                )
+            await terminal_io.echo(
+                f'{self.confirmation_frame} {confirmation_text}'
             )
 
     def close(self):
-        self._executor.shutdown()
\ No newline at end of file
+        pass
\ No newline at end of file
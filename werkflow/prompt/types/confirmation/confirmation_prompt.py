@@ -1,5 +1,3 @@
-import asyncio
-import functools
 import click
 from typing import (
     Optional,
@@ -10,6 +8,7 @@ from typing import (
 )
 from werkflow.prompt.types.base.base_prompt import BasePrompt
 from werkflow.prompt.types.base.prompt_type import PromptType
+from werkflow.tools.terminal import terminal_io
 from .confirmation_prompt_validator import ConfirmationPromptValidator
 
 
@@ -42,16 +41,10 @@ class ConfirmationPrompt(BasePrompt):
         self.prompt_type = validator.prompt_type
 
     async def ask(self):
-        if self._loop is None:
-            self._loop = asyncio.get_running_loop()
-
-        return await self._loop.run_in_executor(
-            self._executor,
-            functools.partial(
-                click.confirm,
-                f'{self.prompt_frame} {self.message}',
-                default=self.default,
-                abort=False,
-                prompt_suffix=''
-            )
+        return await terminal_io.call(
+            click.confirm,
+            f'{self.prompt_frame} {self.message}',
+            default=self.default,
+            abort=False,
+            prompt_suffix=''
         )
\ No newline at end of file
@@ -1,9 +1,8 @@
 import click
-import asyncio
-import functools
 from typing import Dict, Type, Optional, Any, Callable, Union
 from werkflow.prompt.types.base.base_prompt import BasePrompt
 from werkflow.prompt.types.base.prompt_type import PromptType
+from werkflow.tools.terminal import terminal_io
 from .input_prompt_validator import InputPromptValidator
 
 
@@ -38,16 +37,10 @@ class InputPrompt(BasePrompt):
         
 
     async def ask(self):
-        if self._loop is None:
-            self._loop = asyncio.get_running_loop()
-
-        return await self._loop.run_in_executor(
-            self._executor,
-            functools.partial(
-                click.prompt,
-                f'{self.prompt_frame} {self.message}',
-                type=self.data_type,
-                default=self.default,
-                prompt_suffix=''
-            )
+        return await terminal_io.call(
+            click.prompt,
+            f'{self.prompt_frame} {self.message}',
+            type=self.data_type,
+            default=self.default,
+            prompt_suffix=''
         )
\ No newline at end of file
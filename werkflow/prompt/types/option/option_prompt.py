@@ -1,10 +1,9 @@
 import click
-import asyncio
-import functools
 from typing import List, Dict, Optional, Any, Callable, Union
 from .option_prompt_validator import OptionPromptValidator
 from werkflow.prompt.types.base.base_prompt import BasePrompt
 from werkflow.prompt.types.base.prompt_type import PromptType
+from werkflow.tools.terminal import terminal_io
 
 
 class OptionPrompt(BasePrompt):
@@ -41,17 +40,11 @@ class OptionPrompt(BasePrompt):
         
 
     async def ask(self):
-        if self._loop is None:
-            self._loop = asyncio.get_running_loop()
-
-        return await self._loop.run_in_executor(
-            self._executor,
-            functools.partial(
-                click.prompt,
-                f'{self.prompt_frame} {self.message}',
-                type=self.options,
-                default=self.default,
-                prompt_suffix='',
-                show_choices=True
-            )
+        return await terminal_io.call(
+            click.prompt,
+            f'{self.prompt_frame} {self.message}',
+            type=self.options,
+            default=self.default,
+            prompt_suffix='',
+            show_choices=True
         )
\ No newline at end of file
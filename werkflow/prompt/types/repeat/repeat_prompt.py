@@ -1,8 +1,6 @@
-import asyncio
-import click
-import functools
 from werkflow.prompt.types.base.base_prompt import BasePrompt
 from werkflow.prompt.types.base.prompt_type import PromptType
+from werkflow.tools.terminal import terminal_io
 from typing import Callable, Union, Optional, Any, Dict
 from .repeat_prompt_validator import RepeatPromptValidator
 
@@ -43,9 +41,6 @@ class RepeatPrompt(BasePrompt):
         responses = []
         response = None
 
-        if self._loop is None:
-            self._loop = asyncio.get_running_loop()
-
         while not self.break_condition(response):
 
             if response is not None:
@@ -55,34 +50,21 @@ class RepeatPrompt(BasePrompt):
             await self.prompt.confirm(response)
 
             if not self.break_condition(response):
-                await self._loop.run_in_executor(
-                    self._executor,
-                    functools.partial(
-                        click.echo,
-                        ''
-                    )
-                )
+                await terminal_io.echo('')
 
         return responses
 
     async def confirm(self, response: Any):
         if self.confirmation_message:
 
-            if self._loop is None:
-                self._loop = asyncio.get_running_loop()
-            
             if isinstance(self.confirmation_message, str):
                 confirmation_text = self.confirmation_message
 
             else:
                 confirmation_text = self.confirmation_message(response)
 
-            await self._loop.run_in_executor(
-                self._executor,
-                functools.partial(
-                    click.echo,
-                    f'{self.prompt.confirmation_frame} {confirmation_text}',
-                )
+            await terminal_io.echo(
+                f'{self.prompt.confirmation_frame} {confirmation_text}'
             )
 
     def close(self):
@@ -0,0 +1,3 @@
+from .adaptive_thread_pool import AdaptiveThreadPool
+from .executor_registry import ExecutorRegistry, executors
+from .executor_type import ExecutorType
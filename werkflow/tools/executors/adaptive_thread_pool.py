@@ -0,0 +1,261 @@
+import os
+import queue
+import threading
+import time
+from concurrent.futures import Executor, Future
+from typing import Any, Callable, Dict, Set, Tuple
+
+
+WorkItem = Tuple[
+    Future,
+    Callable[..., Any],
+    Tuple[Any, ...],
+    Dict[str, Any],
+    float
+]
+
+
+class AdaptiveThreadPool(Executor):
+
+    def __init__(
+        self,
+        name: str,
+        min_workers: int=0,
+        max_workers: int | None=None,
+        adaptive: bool=True,
+        idle_timeout: float=5
+    ) -> None:
+
+        if max_workers is None:
+            max_workers = min(32, (os.cpu_count() or 1) + 4)
+
+        if max_workers < 1:
+            raise ValueError(f'Executor - {name} - max_workers must be at least 1')
+
+        self.name = name
+        self.max_workers = max_workers
+        self.min_workers = min(max(min_workers, 0), max_workers)
+        self.adaptive = adaptive
+        self.idle_timeout = idle_timeout
+
+        self._queue: queue.SimpleQueue[WorkItem | None] = queue.SimpleQueue()
+        self._lock = threading.Lock()
+        self._workers: Set[threading.Thread] = set()
+        self._shutdown = False
+
+        self._queued = 0
+        self._idle = 0
+        self._active = 0
+        self._submitted = 0
+        self._completed = 0
+        self._failed = 0
+        self._spawned = 0
+        self._retired = 0
+        self._peak_workers = 0
+        self._peak_queued = 0
+        self._wait_time = 0.0
+        self._run_time = 0.0
+        self._created = time.monotonic()
+
+    def submit(
+        self,
+        fn: Callable[..., Any],
+        /,
+        *args: Tuple[Any, ...],
+        **kwargs: Dict[str, Any]
+    ) -> Future:
+
+        future = Future()
+
+        with self._lock:
+            if self._shutdown:
+                raise RuntimeError(f'Executor - {self.name} - cannot schedule new calls after shutdown')
+
+            self._queue.put((
+                future,
+                fn,
+                args,
+                kwargs,
+                time.monotonic()
+            ))
+
+            self._submitted += 1
+            self._queued += 1
+            self._peak_queued = max(self._peak_queued, self._queued)
+
+            # Only grow when queued calls outnumber the workers free to
+            # take them, so bursts add threads and steady load reuses them.
+            if self._queued > self._idle and len(self._workers) < self.max_workers:
+                self._spawn_worker()
+
+        return future
+
+    def resize(
+        self,
+        min_workers: int | None=None,
+        max_workers: int | None=None,
+        adaptive: bool | None=None,
+        idle_timeout: float | None=None
+    ):
+        with self._lock:
+            if max_workers is not None:
+                if max_workers < 1:
+                    raise ValueError(f'Executor - {self.name} - max_workers must be at least 1')
+
+                self.max_workers = max_workers
+
+            if min_workers is not None:
+                self.min_workers = max(min_workers, 0)
+
+            self.min_workers = min(self.min_workers, self.max_workers)
+
+            if adaptive is not None:
+                self.adaptive = adaptive
+
+            if idle_timeout is not None:
+                self.idle_timeout = idle_timeout
+
+            # Shrinking past the new maximum happens as surplus workers
+            # next go idle, so running calls are never interrupted.
+            while self._queued > self._idle and len(self._workers) < self.max_workers:
+                self._spawn_worker()
+
+    def metrics(self) -> Dict[str, Any]:
+
+        with self._lock:
+            uptime = time.monotonic() - self._created
+            finished = self._completed + self._failed
+
+            return {
+                'workers': len(self._workers),
+                'min_workers': self.min_workers,
+                'max_workers': self.max_workers,
+                'peak_workers': self._peak_workers,
+                'active': self._active,
+                'idle': self._idle,
+                'queued': self._queued,
+                'peak_queued': self._peak_queued,
+                'submitted': self._submitted,
+                'completed': self._completed,
+                'failed': self._failed,
+                'spawned': self._spawned,
+                'retired': self._retired,
+                'average_wait': self._wait_time / finished if finished else 0,
+                'average_run': self._run_time / finished if finished else 0,
+                'utilization': self._run_time / (uptime * self.max_workers) if uptime > 0 else 0,
+            }
+
+    def shutdown(
+        self,
+        wait: bool=True,
+        *,
+        cancel_futures: bool=False
+    ):
+        with self._lock:
+            self._shutdown = True
+
+            if cancel_futures:
+                while True:
+                    try:
+                        work_item = self._queue.get_nowait()
+
+                    except queue.Empty:
+                        break
+
+                    if work_item is not None:
+                        work_item[0].cancel()
+                        self._queued -= 1
+
+            workers = list(self._workers)
+            for _ in workers:
+                self._queue.put(None)
+
+        if wait:
+            for worker in workers:
+                worker.join()
+
+    def _spawn_worker(self):
+        worker = threading.Thread(
+            target=self._run_worker,
+            name=f'werkflow-{self.name}-{self._spawned}',
+            daemon=True
+        )
+
+        self._workers.add(worker)
+        self._idle += 1
+        self._spawned += 1
+        self._peak_workers = max(self._peak_workers, len(self._workers))
+
+        worker.start()
+
+    def _run_worker(self):
+
+        worker = threading.current_thread()
+
+        while True:
+
+            try:
+                work_item = self._queue.get(
+                    timeout=self.idle_timeout if self.adaptive else None
+                )
+
+            except queue.Empty:
+                with self._lock:
+                    # A call queued while the wait timed out still needs
+                    # this worker, so only retire when nothing is waiting.
+                    if self._queued < 1 and len(self._workers) > self.min_workers:
+                        self._retire_worker(worker)
+                        return
+
+                continue
+
+            if work_item is None:
+                with self._lock:
+                    self._retire_worker(worker)
+
+                return
+
+            future, fn, args, kwargs, queued_at = work_item
+
+            started = time.monotonic()
+            with self._lock:
+                self._idle -= 1
+                self._queued -= 1
+                self._active += 1
+                self._wait_time += started - queued_at
+
+            failed = False
+            if future.set_running_or_notify_cancel():
+                try:
+                    result = fn(*args, **kwargs)
+
+                except BaseException as error:
+                    future.set_exception(error)
+                    failed = True
+
+                else:
+                    future.set_result(result)
+
+            # Drop references so large results or arguments are not
+            # pinned by an idle worker.
+            del work_item, future, fn, args, kwargs
+
+            with self._lock:
+                self._active -= 1
+                self._idle += 1
+                self._run_time += time.monotonic() - started
+
+                if failed:
+                    self._failed += 1
+
+                else:
+                    self._completed += 1
+
+                if len(self._workers) > self.max_workers:
+                    self._retire_worker(worker)
+                    return
+
+    def _retire_worker(self, worker: threading.Thread):
+        self._workers.discard(worker)
+        self._idle -= 1
+        self._retired += 1
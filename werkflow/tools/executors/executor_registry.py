@@ -0,0 +1,90 @@
+import os
+import threading
+from typing import Any, Dict
+
+from .adaptive_thread_pool import AdaptiveThreadPool
+from .executor_type import ExecutorType
+
+
+class ExecutorRegistry:
+
+    def __init__(self) -> None:
+
+        default_max_workers = min(32, (os.cpu_count() or 1) + 4)
+
+        self._settings: Dict[ExecutorType, Dict[str, Any]] = {
+            ExecutorType.FILE_IO: {
+                'min_workers': 0,
+                'max_workers': default_max_workers,
+                'adaptive': True,
+            },
+            ExecutorType.BLOCKING: {
+                'min_workers': 0,
+                'max_workers': default_max_workers,
+                'adaptive': True,
+            },
+            # Log writes are small and must land in the order they were
+            # made, so a single thread keeps each file ordered.
+            ExecutorType.LOGGING: {
+                'min_workers': 0,
+                'max_workers': 1,
+                'adaptive': True,
+            },
+        }
+
+        self._pools: Dict[ExecutorType, AdaptiveThreadPool] = {}
+        self._lock = threading.Lock()
+
+    def configure(
+        self,
+        executor_type: ExecutorType | str,
+        **settings: Dict[str, Any]
+    ):
+        executor_type = ExecutorType(executor_type)
+
+        with self._lock:
+            self._settings[executor_type].update({
+                setting_name: setting for setting_name, setting in settings.items() if setting is not None
+            })
+
+            pool = self._pools.get(executor_type)
+
+        if pool:
+            pool.resize(**settings)
+
+    def get(self, executor_type: ExecutorType | str) -> AdaptiveThreadPool:
+        executor_type = ExecutorType(executor_type)
+
+        pool = self._pools.get(executor_type)
+        if pool is not None:
+            return pool
+
+        with self._lock:
+            pool = self._pools.get(executor_type)
+
+            if pool is None:
+                pool = AdaptiveThreadPool(
+                    executor_type.value,
+                    **self._settings[executor_type]
+                )
+
+                self._pools[executor_type] = pool
+
+        return pool
+
+    def metrics(self) -> Dict[str, Dict[str, Any]]:
+        return {
+            executor_type.value: pool.metrics() for executor_type, pool in list(self._pools.items())
+        }
+
+    def shutdown(self, wait: bool=True):
+
+        with self._lock:
+            pools = list(self._pools.values())
+            self._pools.clear()
+
+        for pool in pools:
+            pool.shutdown(wait=wait)
+
+
+executors = ExecutorRegistry()
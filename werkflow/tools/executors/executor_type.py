@@ -0,0 +1,7 @@
+from enum import Enum
+
+
+class ExecutorType(Enum):
+    FILE_IO='file_io'
+    BLOCKING='blocking'
+    LOGGING='logging'
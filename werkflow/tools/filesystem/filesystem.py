@@ -12,6 +12,8 @@ from io import (
 )
 from functools import partial, singledispatch
 
+from werkflow.tools.executors import ExecutorType, executors
+
 from .binary import (
     AsyncBufferedIOBase,
     AsyncBufferedReader,
@@ -78,6 +80,8 @@ async def _open(
     """Open an asyncio file."""
     if loop is None:
         loop = asyncio.get_event_loop()
+    if executor is None:
+        executor = executors.get(ExecutorType.FILE_IO)
     cb = partial(
         sync_open,
         file,
@@ -0,0 +1 @@
+from .lazy_exports import lazy_exports
@@ -0,0 +1,33 @@
+import importlib
+from typing import Any, Callable, Dict, List, Tuple
+
+
+def lazy_exports(
+    package_name: str,
+    exports: Dict[str, str]
+) -> Tuple[
+    Callable[[str], Any],
+    Callable[[], List[str]]
+]:
+    # Resolves a package's public names on first access so importing
+    # the package does not import every submodule behind it.
+    package = importlib.import_module(package_name)
+
+    def __getattr__(name: str) -> Any:
+        module_name = exports.get(name)
+        if module_name is None:
+            raise AttributeError(f'module {package_name!r} has no attribute {name!r}')
+
+        value = getattr(
+            importlib.import_module(module_name, package_name),
+            name
+        )
+
+        setattr(package, name, value)
+
+        return value
+
+    def __dir__() -> List[str]:
+        return sorted(set(vars(package)) | set(exports))
+
+    return __getattr__, __dir__
@@ -0,0 +1 @@
+from .terminal_io import TerminalIO, terminal_io
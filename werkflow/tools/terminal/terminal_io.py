@@ -0,0 +1,198 @@
+import asyncio
+import atexit
+import os
+import queue
+import sys
+import threading
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, List, Tuple
+
+import click
+
+
+TerminalItem = Tuple[
+    str | None,
+    Callable[[], Any] | None,
+    Future | None
+]
+
+
+class TerminalIO:
+
+    def __init__(self) -> None:
+        self._queue: queue.SimpleQueue[TerminalItem | None] = queue.SimpleQueue()
+        self._lock = threading.Lock()
+        self._thread: threading.Thread | None = None
+        self._pending_calls = 0
+        self._exit_registered = False
+
+    def write_nowait(self, text: str):
+        self._put((text, None, None))
+
+    async def write(self, text: str):
+        future = Future()
+        self._put((text, None, future))
+
+        # Output queued behind an open prompt is written once the prompt
+        # closes. Waiting on it would stall the caller on user input.
+        if self._pending_calls > 0:
+            return
+
+        await asyncio.wrap_future(future)
+
+    async def flush(self):
+        await self.write('')
+
+    async def echo(
+        self,
+        message: Any='',
+        **kwargs: Dict[str, Any]
+    ):
+        await self.call(
+            click.echo,
+            message,
+            **kwargs
+        )
+
+    async def call(
+        self,
+        call: Callable[..., Any],
+        *args: Tuple[Any, ...],
+        **kwargs: Dict[str, Any]
+    ):
+        future = Future()
+
+        with self._lock:
+            self._pending_calls += 1
+
+        self._put((
+            None,
+            lambda: call(*args, **kwargs),
+            future
+        ))
+
+        return await asyncio.wrap_future(future)
+
+    def close(self, timeout: float=1):
+
+        with self._lock:
+            thread = self._thread
+            self._thread = None
+
+            if thread is None:
+                return
+
+            self._queue.put(None)
+
+        # A prompt left waiting on input should not hold up exit, so
+        # the join is bounded.
+        thread.join(timeout=timeout)
+
+    def _put(self, item: TerminalItem):
+
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run,
+                    name='werkflow-terminal',
+                    daemon=True
+                )
+
+                self._thread.start()
+
+                if self._exit_registered is False:
+                    atexit.register(self.close)
+                    self._exit_registered = True
+
+            self._queue.put(item)
+
+    def _run(self):
+
+        pending: List[TerminalItem | None] = []
+
+        while True:
+            item = pending.pop() if pending else self._queue.get()
+
+            if item is None:
+                return
+
+            text, call, future = item
+
+            if call is not None:
+                input_blocking = self._set_input_blocking(True)
+
+                try:
+                    if future.set_running_or_notify_cancel():
+                        future.set_result(call())
+
+                except BaseException as error:
+                    future.set_exception(error)
+
+                finally:
+                    self._set_input_blocking(input_blocking)
+
+                    with self._lock:
+                        self._pending_calls -= 1
+
+                continue
+
+            # Writes queued behind this one go out as a single write and
+            # flush, stopping at the next prompt so ordering is kept.
+            texts = [text]
+            futures = [future] if future else []
+
+            while True:
+                try:
+                    next_item = self._queue.get_nowait()
+
+                except queue.Empty:
+                    break
+
+                if next_item is None or next_item[1] is not None:
+                    pending.append(next_item)
+                    break
+
+                next_text, _, next_future = next_item
+                texts.append(next_text)
+
+                if next_future:
+                    futures.append(next_future)
+
+            error: Exception | None = None
+
+            try:
+                sys.stdout.write(''.join(texts))
+                sys.stdout.flush()
+
+            except Exception as write_error:
+                error = write_error
+
+            for write_future in futures:
+                if error:
+                    write_future.set_exception(error)
+
+                else:
+                    write_future.set_result(None)
+
+    def _set_input_blocking(self, blocking: bool | None) -> bool | None:
+
+        # Async loggers make stdout non-blocking, and on a terminal stdin
+        # often shares that file, so a prompt would read EOF instead of
+        # waiting. Returns the previous state so it can be restored.
+        if blocking is None:
+            return None
+
+        try:
+            input_fd = sys.stdin.fileno()
+            was_blocking = os.get_blocking(input_fd)
+
+            if was_blocking != blocking:
+                os.set_blocking(input_fd, blocking)
+
+            return was_blocking
+
+        except (AttributeError, OSError, ValueError):
+            return None
+
+
+terminal_io = TerminalIO()